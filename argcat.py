@@ -1,17 +1,34 @@
 """ArgCat"""
 #!/usr/bin/env python3
 
-import argparse
-import inspect
+from __future__ import annotations
+
+import _thread
+import contextvars
+import io
+import operator
 import sys
+import os
 import functools
-from copy import deepcopy
-from pydoc import locate
+import importlib
+import time
+from types import MappingProxyType, ModuleType
 from enum import Enum, unique
 from argparse import (ArgumentParser, Namespace, _ArgumentGroup, _MutuallyExclusiveGroup,
-                      _SubParsersAction, Action)
-from typing import ClassVar, List, Dict, Optional, Callable, Tuple, Any, Union
-import traceback
+                      _SubParsersAction, Action, ArgumentError)
+# NOTE: `import argcat` is on the startup path of every CLI built with it. So, the modules which are
+# only needed by handler registration, error reporting, caching or printing, such as inspect,
+# traceback, pydoc, copy, json, hashlib and shutil, are imported where they are used instead.
+# Even threading is, and all the locks are from _thread, which is built in. threading.Lock is
+# _thread.allocate_lock anyway.
+# And since annotations are not evaluated at runtime with `from __future__ import annotations`,
+# typing is only imported for type checkers, which treat TYPE_CHECKING as True.
+# See unitests/test_import_time.py.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import inspect
+    from typing import (ClassVar, List, Dict, Optional, Callable, Tuple, Any, Union, Iterable,
+                        Iterator, Sequence, Mapping)
 
 # May not be the best solution for the constants, but it's fine for now.
 # And we don't need ClassVar[str] here because I think all constants' type are pretty clear.
@@ -46,6 +63,26 @@ class _ManifestConstants:
     IGNORED_BY_SUBPARSER = 'ignored_by_subparser'
     DEFAULT_HANDLER = 'default_handler'
 
+# Keys of a compiled manifest, which is what ArgCat.compile_spec() stores with the manifest.
+class _CompiledConstants:
+    # Bump FORMAT_VERSION whenever the layout of the compiled manifest changes, so that the specs
+    # of the old layout are refused.
+    FORMAT_VERSION = 1
+    VERSION = 'version'
+    PARSERS = 'parsers'
+    DESTS = 'dests'
+    ADDITIONAL_ARGUMENTS_INFO = 'additional_arguments_info'
+    TYPES = 'types'
+    USAGE = 'usage'
+    USAGE_WIDTH = 'usage_width'
+    # Kinds of the rendered texts of a parser, which ArgCat keeps for each terminal width.
+    HELP = 'help'
+    # Keys of a compiled spec made by ArgCat.compile_spec(), which has the version, the manifest,
+    # the compiled manifest and the import paths of the handlers.
+    MANIFEST = 'manifest'
+    COMPILED = 'compiled'
+    HANDLERS = 'handlers'
+
 # Argument values by Default
 _ARGUMENT_DEFAULTS_ = {
     # NOTE : REMEMBER TO USE DEEP COPY WHEN SETTING THIS DICT AS A DEFAULT DICT
@@ -80,13 +117,41 @@ class _ArgCatPrintLevel(Enum):
         #if self.value in [0, 1]:
         return "[ LOG ]: "
 
+# The filter level of the ArgCat running in the current thread or task, which overrides
+# _ArgCatPrinter.filter_level. So, every ArgCat prints by its own `chatter`, even if many of them
+# run at the same time. See _ArgCatFilterLevelScope.
+_FILTER_LEVEL: contextvars.ContextVar = contextvars.ContextVar('argcat_filter_level',
+                                                              default=None)
+
 class _ArgCatPrinter:
-    filter_level: ClassVar[_ArgCatPrintLevel] = _ArgCatPrintLevel.VERBOSE
+    # The filter level out of any ArgCat's calls, such as for registering types.
+    filter_level: ClassVar[_ArgCatPrintLevel] = _ArgCatPrintLevel.IF_NECESSARY
     log_prefix: ClassVar[str] = "<ArgCat>"
     indent_blank_str: ClassVar[str] = " " * 2
 
     @classmethod
-    def print(cls, msg: str, *, level: _ArgCatPrintLevel = _ArgCatPrintLevel.VERBOSE,
+    def current_filter_level(cls) -> _ArgCatPrintLevel:
+        """Get the filter level of the ArgCat running in the current thread or task, or the class
+        filter level if there is none.
+
+        Returns an _ArgCatPrintLevel.
+        """
+        filter_level: Optional[_ArgCatPrintLevel] = _FILTER_LEVEL.get()
+        return cls.filter_level if filter_level is None else filter_level
+
+    @classmethod
+    def is_enabled(cls, level: _ArgCatPrintLevel) -> bool:
+        """Check whether a message with `level` can be displayed with the current filter level.
+
+        This is for skipping the work which is only needed by a log message, such as collecting
+        information in a loop, when the message would be filtered out anyway.
+
+        Returns a Boolean.
+        """
+        return level.value >= cls.current_filter_level().value
+
+    @classmethod
+    def print(cls, msg: str, *args: Any, level: _ArgCatPrintLevel = _ArgCatPrintLevel.VERBOSE,
               indent: int = 0) -> None:
         """Print logs with a certain log level and indent
 
@@ -95,10 +160,16 @@ class _ArgCatPrinter:
         filtered out and cannot be shown. `indent` is a way to layout the message in a more
         structural style.
 
+        If `args` is given, `msg` is a %-format string as the one of the `logging` module and is
+        formatted with `args` only when the message is displayed. So, a message filtered out costs
+        nothing but this call. Always prefer this to an f-string on a hot path.
+
         Returns None.
         """
-        if level.value < cls.filter_level.value:
+        if level.value < cls.current_filter_level().value:
             return
+        if args:
+            msg = msg % args
         level_str: str = str(level)
         indent_str: str
         if indent <= 0:
@@ -113,19 +184,312 @@ class _ArgCatPrinter:
         """Set the filter level.
 
         This filter level determine whether a log message with a level can be displayed. Any message
-        with a level under this filter level would not be shown.
+        with a level under this filter level would not be shown. It's overridden by the filter
+        level of the ArgCat running, which is set by its `chatter`.
 
         Returns None.
         """
         cls.filter_level = filter_level
 
+class _ArgCatFilterLevelScope:
+    """A context manager printing by a filter level in its body, only in the current thread or
+    task.
+
+    The previous filter level is restored on exit, so scopes can be nested, such as an ArgCat
+    calling another one in a handler. A scope object should be entered only once at a time.
+    """
+    _filter_level: _ArgCatPrintLevel
+    _token: Optional[contextvars.Token]
+
+    def __init__(self, filter_level: _ArgCatPrintLevel) -> None:
+        self._filter_level = filter_level
+        self._token = None
+
+    def __enter__(self) -> _ArgCatFilterLevelScope:
+        self._token = _FILTER_LEVEL.set(self._filter_level)
+        return self
+
+    def __exit__(self, exit_type, value, exit_traceback) -> None:
+        _FILTER_LEVEL.reset(self._token)
+        self._token = None
+
+    @staticmethod
+    def iterate(filter_level: _ArgCatPrintLevel, iterator: Iterable) -> Iterable:
+        """Iterate over `iterator` printing by `filter_level` while each item is being made.
+
+        The filter level can't be set around a generator as a whole, since the caller runs
+        between the items and would print by it too.
+
+        Returns an iterator of the items.
+        """
+        iterator = iter(iterator)
+        while True:
+            with _ArgCatFilterLevelScope(filter_level):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+def _printing(method: Callable) -> Callable:
+    """Decorate a method of ArgCat to print by the filter level of its instance."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with _ArgCatFilterLevelScope(self._filter_level):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _printing_async(method: Callable) -> Callable:
+    """Decorate an async method of ArgCat to print by the filter level of its instance."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with _ArgCatFilterLevelScope(self._filter_level):
+            return await method(self, *args, **kwargs)
+    return wrapper
+
+# If True, the parsers raise _ArgCatParseError instead of exiting on errors. See parse_many().
+_RAISE_PARSE_ERROR: contextvars.ContextVar = contextvars.ContextVar('argcat_raise_parse_error',
+                                                                   default=False)
+
+class _ArgCatParseError(Exception):
+    """Raised by _ArgCatArgumentParser on errors instead of exiting when _RAISE_PARSE_ERROR is set.
+    """
+    def __init__(self, parser: ArgumentParser, message: str) -> None:
+        super().__init__(message)
+        self.parser = parser
+        self.message = message
+
+class _ArgCatArgumentParser(ArgumentParser):
+    """The ArgumentParser for all parsers created by ArgCat.
+
+    argparse creates subparsers by the class of the main parser, so this is used by the subparsers
+    as well.
+    """
+    def error(self, message: str):
+        if _RAISE_PARSE_ERROR.get():
+            raise _ArgCatParseError(self, message)
+        super().error(message)
+
+    def _check_value(self, action, value):
+        # argparse checks the subcommand before calling the action, which resolves abbreviations.
+        if isinstance(action, _ArgCatSubParsersAction) and action.resolve(value) is not None:
+            return
+        super()._check_value(action, value)
+
+class _ArgCatParseResult:
+    """The result of parsing one args by ArgCat.parse_many().
+
+    It has either the result from the handlers, which is the same as the one returned by
+    ArgCat.parse_args(), or the error stopping the parsing, which would have made parse_args()
+    exit.
+    """
+    _args: List[str]
+    _result: Optional[Dict]
+    _error: Optional[str]
+    _exit_status: Optional[int]
+    _error_parser: Optional[ArgumentParser]
+    _line_number: Optional[int]
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, args: List[str], result: Optional[Dict] = None, error: Optional[str] = None,
+                 exit_status: Optional[int] = None,
+                 error_parser: Optional[ArgumentParser] = None) -> None:
+        self._args = args
+        self._result = result
+        self._error = error
+        self._exit_status = exit_status
+        self._error_parser = error_parser
+        self._line_number = None
+
+    @property
+    def args(self) -> List[str]:
+        """Get the args parsed."""
+        return self._args
+
+    @property
+    def result(self) -> Optional[Dict]:
+        """Get the result from the handlers, or None if the parsing is stopped."""
+        return self._result
+
+    @property
+    def error(self) -> Optional[str]:
+        """Get the error message of argparse, or None if there is no error."""
+        return self._error
+
+    @property
+    def exit_status(self) -> Optional[int]:
+        """Get the status the parsing would have exited with, or None if it wouldn't exit.
+
+        It's 2 for errors, the same as argparse. Other values are from actions exit by themselves,
+        such as 0 from `-h/--help`. It's always an int, the same as the interpreter would exit
+        with, such as 0 for `sys.exit()`.
+        """
+        return self._exit_status
+
+    @property
+    def succeeded(self) -> bool:
+        """Check whether the args is parsed and handled without exiting."""
+        return self._exit_status is None
+
+    @property
+    def usage(self) -> Optional[str]:
+        """Get the usage of the parser which raises the error, or None if there is no error.
+
+        The usage is formatted only when it's accessed, since it's costly.
+        """
+        if self._error_parser is None:
+            return None
+        return self._error_parser.format_usage()
+
+    @property
+    def line_number(self) -> Optional[int]:
+        """Get the number of the line the args is from, starting from 1, for the results of
+        ArgCat.parse_stream(). It's None for the others.
+        """
+        return self._line_number
+
+    @line_number.setter
+    def line_number(self, value: Optional[int]) -> None:
+        self._line_number = value
+
+    def __repr__(self) -> str:
+        if self.succeeded:
+            return f"_ArgCatParseResult(args={self._args!r}, result={self._result!r})"
+        return f"_ArgCatParseResult(args={self._args!r}, error={self._error!r}, " + \
+            f"exit_status={self._exit_status!r})"
+
+def _recv_all(sock: Any) -> bytes:
+    """Receive from the socket until the peer shuts down writing."""
+    chunks: List[bytes] = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+def _exit_status_of(exc: SystemExit) -> int:
+    """Get the exit status of SystemExit the same as the Python interpreter does."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+def _call_handlers_in_worker(handler_calls: List[Tuple[str, Callable, Dict]]) \
+    -> Dict[str, Tuple[bool, Any]]:
+    """Call the handlers for ArgCat.parse_many() with an executor, which may be in another process.
+
+    It's at the module level so it can be pickled to the worker processes. An exception raised by a
+    handler is returned as its formatted traceback, since the exception itself may not be
+    picklable.
+
+    Returns a dict of the parser name to (True, the result) or (False, the traceback string).
+    """
+    results: Dict[str, Tuple[bool, Any]] = {}
+    for parser_name, handler, parameters in handler_calls:
+        try:
+            results[parser_name] = (True, handler(**parameters))
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            # pylint: disable=import-outside-toplevel
+            import traceback
+            results[parser_name] = (False, traceback.format_exc())
+    return results
+
+class _ArgCatDispatchPlan:
+    """How to call a handler with the parsed arguments, which is compiled once for the handler.
+
+    If the handler is checked to have exactly the parameters of the parser and all of them can be
+    passed positionally, it's called with positional arguments picked by an itemgetter in the order
+    of its signature, which is faster than unpacking the dict as keyword arguments. Otherwise, it's
+    called with keyword arguments as usual.
+    """
+    _handler: Callable
+    _signature: Optional[inspect.Signature]
+    _signature_str: Optional[str]
+    _parameter_names: Tuple[str, ...]
+    _getter: Optional[Callable[[Dict], Any]]
+    _cache: Optional[_ArgCatHandlerCache]
+
+    def __init__(self, handler: Callable, signature: Optional[inspect.Signature] = None,
+                 checked: bool = False) -> None:
+        self._handler = handler
+        self._signature = signature
+        self._signature_str = None
+        self._parameter_names = ()
+        self._getter = None
+        # Set by `@ArgCat.handler` with the caching options.
+        self._cache = getattr(handler, 'argcat_handler_cache', None)
+        if signature is None or not checked:
+            return
+        # pylint: disable=import-outside-toplevel
+        import inspect
+        parameters = signature.parameters.values()
+        if all(parameter.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                  inspect.Parameter.POSITIONAL_OR_KEYWORD)
+               for parameter in parameters):
+            self._parameter_names = tuple(signature.parameters)
+            if len(self._parameter_names) > 1:
+                self._getter = operator.itemgetter(*self._parameter_names)
+
+    @property
+    def handler(self) -> Callable:
+        """Get the handler to call."""
+        return self._handler
+
+    @property
+    def cache(self) -> Optional[_ArgCatHandlerCache]:
+        """Get the cache of the results of the handler, or None if it's not cached."""
+        return self._cache
+
+    @property
+    def parameter_names(self) -> Tuple[str, ...]:
+        """Get the names of the parameters passed positionally in order.
+
+        It's empty if the handler is called with keyword arguments.
+        """
+        return self._parameter_names
+
+    @property
+    def signature_str(self) -> str:
+        """Get the signature string of the handler for messages, which is only made once."""
+        if self._signature_str is None:
+            if self._signature is None:
+                # pylint: disable=import-outside-toplevel
+                import inspect
+                self._signature = inspect.signature(self._handler)
+            self._signature_str = str(self._signature)
+        return self._signature_str
+
+    def call(self, parameters: Dict) -> Any:
+        """Call the handler with the parsed arguments dict, unless the result is cached.
+
+        Returns the result from the handler.
+        """
+        if self._cache is not None:
+            return self._cache.call(self._call_handler, parameters,
+                                    getattr(self._handler, '__self__', None))
+        return self._call_handler(parameters)
+
+    def _call_handler(self, parameters: Dict) -> Any:
+        if self._getter is not None:
+            return self._handler(*self._getter(parameters))
+        if self._parameter_names:
+            return self._handler(parameters[self._parameter_names[0]])
+        return self._handler(**parameters)
+
 class _ArgCatParser:
     _parser: ArgumentParser
     _name: str
     _arguments: List[Dict]
     _dests: List[str]
+    _dest_set: frozenset
+    _dests_ignored_by_subparser: frozenset
+    _dests_for_subparser: List[str]
     _groups: Optional[Dict]
     _handler_func: Optional[Callable]
+    _dispatch_plan: Optional[_ArgCatDispatchPlan]
     _additional_argument_info: Optional[dict]
 
     # pylint: disable=too-many-arguments
@@ -138,9 +502,20 @@ class _ArgCatParser:
         self._dests = [arg.dest for arg in arguments]
         self._groups = groups
         self._handler_func = handler_func
+        self._dispatch_plan = None
 
         self._additional_argument_info = additional_arguments_info
 
+        # Partitions of the dests for routing the parsed arguments. See split_namespace().
+        # A dest without additional info is ignored by subparser, which is the default.
+        additional_info: Dict = additional_arguments_info or {}
+        self._dest_set = frozenset(self._dests)
+        self._dests_ignored_by_subparser = frozenset(
+            dest for dest in self._dests
+            if additional_info.get(dest, {}).get(_ManifestConstants.IGNORED_BY_SUBPARSER, True))
+        self._dests_for_subparser = [dest for dest in self._dests
+                                     if dest not in self._dests_ignored_by_subparser]
+
     @property
     def name(self) -> str:
         """Get the name of ArgCatParser.
@@ -167,6 +542,14 @@ class _ArgCatParser:
         """
         return self._dests
 
+    @property
+    def dests_for_subparser(self) -> List[str]:
+        """Get the dests of ArgCatParser which are passed to the subparsers' handlers as well.
+
+        These are the dests not marked as ignored_by_subparser, in the order of `dests`.
+        """
+        return self._dests_for_subparser
+
     @property
     def handler_func(self) -> Optional[Callable]:
         """Get the argument handler function of ArgCatParser"""
@@ -176,6 +559,23 @@ class _ArgCatParser:
     def handler_func(self, value: Optional[Callable]) -> None:
         """Set the argument handler function of ArgCatParser"""
         self._handler_func = value
+        self._dispatch_plan = None
+
+    @property
+    def dispatch_plan(self) -> Optional[_ArgCatDispatchPlan]:
+        """Get the dispatch plan of the handler function, or None if there is no handler.
+
+        A handler function set by `set_handler()` has a plan compiled with its checked signature.
+        Otherwise, a plan calling it with keyword arguments is made on the first use.
+        """
+        if self._dispatch_plan is None and self._handler_func is not None:
+            self._dispatch_plan = _ArgCatDispatchPlan(self._handler_func)
+        return self._dispatch_plan
+
+    def set_handler(self, handler: Callable, signature: inspect.Signature) -> None:
+        """Set the handler function whose signature has been checked against this parser."""
+        self._handler_func = handler
+        self._dispatch_plan = _ArgCatDispatchPlan(handler, signature, checked=True)
 
     @property
     def groups(self) -> Optional[Dict]:
@@ -223,42 +623,339 @@ class _ArgCatParser:
         """
         # Call the main parser's parse_args() to parse the arguments input.
         parsed_args: Namespace = self._parser.parse_args(args=args, namespace=namespace)
-        _ArgCatPrinter.print(f"Parsed args result: `{parsed_args}`.")
-        parsed_arguments_dict: Dict = dict(vars(parsed_args))
-        subparser_name: str = parsed_arguments_dict.get(_ManifestConstants.SUBPARSER_NAME, None)
+        _ArgCatPrinter.print("Parsed args result: `%s`.", parsed_args)
+        return self.split_namespace(parsed_args)
+
+    def split_namespace(self, parsed_args: Namespace) -> Tuple[str, Dict, Dict]:
+        """Split the parsed Namespace into the arguments for the subparser and this parser.
 
-        # ManifestConstants.SUBPARSER_NAME is not needed for the handlers.
-        # So, delete it from the argument dict if it exists.
-        if _ManifestConstants.SUBPARSER_NAME in parsed_arguments_dict:
-            del parsed_arguments_dict[_ManifestConstants.SUBPARSER_NAME]
+        It's done in one pass over the Namespace with the dest sets made when this parser is
+        created:
+        1. The arguments of this parser go to the dict for this parser;
+        2. All the other arguments, except the ones of this parser marked as ignored_by_subparser
+        and the reserved subparser name, go to the dict for the subparser if any subparser is
+        called.
 
-        parsed_arguments_dict_for_cur_parser = {}
-        # Firstly, pick all arguments parsed of the current parser.
+        Return a Tuple, the same as `parse_args()`.
+        """
+        parsed_arguments_dict: Dict = vars(parsed_args)
+        subparser_name: str = parsed_arguments_dict.get(_ManifestConstants.SUBPARSER_NAME, None)
+
+        parsed_arguments_dict_for_cur_parser: Dict = {}
+        # If subparser_name is None, the dict for the subparser is None to make sure it cannot be
+        # used.
+        parsed_arguments_dict_for_subparser: Optional[Dict] = {} if subparser_name else None
+        dest_set: frozenset = self._dest_set
+        dests_ignored_by_subparser: frozenset = self._dests_ignored_by_subparser
         for key, value in parsed_arguments_dict.items():
-            if key in self._dests:
+            if key in dest_set:
                 parsed_arguments_dict_for_cur_parser[key] = value
+                # By default, all main parser's arguments will stored in the args namespace even
+                # there is no the main arguments input. So, the ones marked IGNORED_BY_SUBPARSER
+                # must be removed to make sure the arguments input into the handler correctly.
+                if key in dests_ignored_by_subparser:
+                    continue
+            # ManifestConstants.SUBPARSER_NAME is not needed for the handlers.
+            elif key == _ManifestConstants.SUBPARSER_NAME:
+                continue
+            if parsed_arguments_dict_for_subparser is not None:
+                parsed_arguments_dict_for_subparser[key] = value
 
-        # If the subparser is needed, remove all arguments from the
-        # namspace belong to the main parser(parent parser) marked IGNORED_BY_SUBPARSER True.
-        # By default, all main parser's arguments will stored in the args namespace even there is no
-        # the main arguments input.
-        # So, this step is to make sure the arguments input into the handler correctly.
-        if subparser_name:
-            for argument in self._arguments:
-                # 'dest' value is the key of the argument in the parsed_arguments_dict.
-                dest: str = argument.dest
-                should_be_ignored: bool = \
-                self._additional_argument_info[dest].get(_ManifestConstants.IGNORED_BY_SUBPARSER,
-                                                         True)
-                # Remove the argument by key in the parsed_arguments_dict.
-                if dest is not None and should_be_ignored:
-                    del parsed_arguments_dict[dest]
-        else:
-            # If subparser_name is None, clear this make sure it cannot be used.
-            parsed_arguments_dict = None
+        return subparser_name, parsed_arguments_dict_for_subparser, \
+            parsed_arguments_dict_for_cur_parser
+
+class _ArgCatSubParsersAction(_SubParsersAction):
+    """A _SubParsersAction which resolves the subcommand typed, such as an alias or an
+    abbreviation, to the subparser name the same way as the router, so the args left to argparse
+    select the same subparser as the routed ones.
+    """
+    _resolver: Optional[Callable[[str], Optional[str]]]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolver = None
+
+    def set_resolver(self, resolver: Optional[Callable[[str], Optional[str]]]) -> None:
+        """Set the function looking up the subparser name of a subcommand, like
+        `_ArgCatSubcommandRouter.lookup()`.
+
+        Returns None.
+        """
+        self._resolver = resolver
+
+    def resolve(self, value: str) -> Optional[str]:
+        """Resolve the subcommand typed to its subparser name.
+
+        Returns the subparser name or None if there is no resolver or no such subparser.
+        """
+        return None if self._resolver is None else self._resolver(value)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if values:
+            name = self.resolve(values[0])
+            if name is not None and name != values[0]:
+                values = [name, *values[1:]]
+        super().__call__(parser, namespace, values, option_string)
+
+class _ArgCatLazySubParsersAction(_ArgCatSubParsersAction):
+    """A _SubParsersAction whose parsers are only created when they are selected.
+
+    Every lazy parser is registered as a stub, which is just its name (and aliases) in the choices
+    plus the help pseudo action, so the main parser can validate and display it without creating
+    anything. The actual ArgumentParser is created and passed to the materializer the first time
+    the main parser routes to it.
+    """
+    _lazy_parsers: Dict[str, Tuple[Dict, Callable[[str, ArgumentParser], None]]]
+    _lazy_aliases: Dict[str, str]
+    # Held while a parser is being created, so threads parsing at the same time create it once.
+    _lock: Any
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_parsers = {}
+        self._lazy_aliases = {}
+        self._lock = _thread.allocate_lock()
+
+    def add_lazy_parser(self, name: str, materializer: Callable[[str, ArgumentParser], None],
+                        **kwargs) -> None:
+        """Register a parser stub which will be created by `add_parser()` only when needed.
+
+        `materializer` is called with the parser name and the created ArgumentParser, so the caller
+        can add arguments into it before it parses anything.
+
+        Returns None.
+        """
+        aliases = kwargs.get('aliases', ())
+        # Same as add_parser(), a pseudo action holds the choice help.
+        if 'help' in kwargs:
+            kwargs = dict(kwargs)
+            self._choices_actions.append(self._ChoicesPseudoAction(name, aliases,
+                                                                   kwargs.pop('help')))
+        self._lazy_parsers[name] = (kwargs, materializer)
+        # None as a placeholder makes the name and aliases valid choices of the main parser.
+        self._name_parser_map[name] = None
+        for alias in aliases:
+            self._name_parser_map[alias] = None
+            self._lazy_aliases[alias] = name
+
+    def materialize(self, name: str) -> Optional[ArgumentParser]:
+        """Create the parser for the stub `name`, which can also be one of its aliases.
+
+        If creating the parser raises, the stub is kept, so the same error is raised again by the
+        next parse of `name` instead of the placeholder being used.
+
+        Returns the created ArgumentParser or None if `name` is not a stub.
+        """
+        name = self._lazy_aliases.get(name, name)
+        with self._lock:
+            lazy_parser = self._lazy_parsers.get(name, None)
+            if lazy_parser is None:
+                return None
+            kwargs, materializer = lazy_parser
+            kwargs = dict(kwargs)
+            aliases = kwargs.pop('aliases', ())
+            # Same as add_parser(), but the placeholders are replaced in place to keep choices'
+            # order, and only after the parser is done, so other threads never see a partial one.
+            if kwargs.get('prog') is None:
+                kwargs['prog'] = f'{self._prog_prefix} {name}'
+            new_parser: ArgumentParser = self._parser_class(**kwargs)
+            materializer(name, new_parser)
+            del self._lazy_parsers[name]
+            self._name_parser_map[name] = new_parser
+            for alias in aliases:
+                self._name_parser_map[alias] = new_parser
+        return new_parser
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # If another thread is creating the parser, materialize() waits for it.
+        if values:
+            name = self.resolve(values[0]) or values[0]
+            if self._name_parser_map.get(name, 0) is None:
+                self.materialize(name)
+        super().__call__(parser, namespace, values, option_string)
+
+class _ArgCatSubcommandRouter:
+    """A router which finds the subcommand in the args before argparse does.
+
+    argparse matches every arg against the main parser first, and only then hands the args after
+    the subcommand to the subparser, which matches them again. The router instead scans the
+    options of the main parser up to the first positional, looks it up in a hash map of the names
+    and aliases of the subparsers, or a prefix trie of them for abbreviations, and lets the main
+    parser and the selected subparser each parse their own slice of the args only. The main parser
+    doesn't parse at all if there is nothing before the subcommand, since its defaults are parsed
+    once and reused.
+
+    It gives up routing, and leaves the args to argparse as usual, whenever it cannot be sure to
+    split the args the same way as argparse, such as for options with a variable number of values,
+    abbreviated or combined options of the main parser, `--` and unknown subcommands.
+    """
+    # The value of a trie node matched by the prefixes of more than one subparser.
+    AMBIGUOUS: ClassVar[str] = ''
+
+    _main_parser: ArgumentParser
+    _subparsers_action: _SubParsersAction
+    # The subparser names by themselves and their aliases.
+    _names: Dict[str, str]
+    # Every node is [children by char, the subparser name of all keys through it or AMBIGUOUS].
+    _trie: Optional[List]
+    # The number of values of the options of the main parser, by the option strings.
+    _option_nargs: Dict[str, int]
+    _enabled: bool
+    _main_defaults: Optional[Dict]
+
+    def __init__(self, main_parser: ArgumentParser, subparsers_action: _SubParsersAction,
+                 aliases: Dict[str, Sequence[str]], allow_abbrev: bool = False) -> None:
+        self._main_parser = main_parser
+        self._subparsers_action = subparsers_action
+        self._names = {}
+        self._trie = [{}, self.AMBIGUOUS] if allow_abbrev else None
+        for name, name_aliases in aliases.items():
+            for key in (name, *name_aliases):
+                self._names[key] = name
+                if self._trie is not None:
+                    self._add_to_trie(key, name)
+        self._option_nargs = {}
+        # The only positional of the main parser must be the subcommand, and the required
+        # subcommand is left to argparse to report if it's missing.
+        self._enabled = not subparsers_action.required and \
+            main_parser.fromfile_prefix_chars is None
+        for action in main_parser._actions: # pylint: disable=protected-access
+            if not action.option_strings:
+                if action is not subparsers_action:
+                    self._enabled = False
+                continue
+            nargs = action.nargs
+            if nargs is None:
+                nargs = 1
+            elif not isinstance(nargs, int):
+                # '?', '*', '+' and the like can't be counted without matching like argparse.
+                nargs = -1
+            for option_string in action.option_strings:
+                self._option_nargs[option_string] = nargs
+        self._main_defaults = None
+
+    def _add_to_trie(self, key: str, name: str) -> None:
+        node = self._trie
+        for char in key:
+            node = node[0].setdefault(char, [{}, name])
+            if node[1] != name:
+                node[1] = self.AMBIGUOUS
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether the main parser can be routed at all."""
+        return self._enabled
 
-        # parsed_arguments_dict now is a dict contains arguments only for the subparser.
-        return subparser_name, parsed_arguments_dict, parsed_arguments_dict_for_cur_parser
+    def lookup(self, token: str) -> Optional[str]:
+        """Look up the subparser of a name, an alias or, if abbreviations are allowed, a unique
+        prefix of them.
+
+        Returns the subparser name or None if there isn't one. An ambiguous prefix is an error of
+        the main parser.
+        """
+        name = self._names.get(token, None)
+        if name is not None or self._trie is None or not token:
+            return name
+        node = self._trie
+        for char in token:
+            node = node[0].get(char, None)
+            if node is None:
+                return None
+        if node[1] == self.AMBIGUOUS:
+            candidates = sorted(key for key in self._names if key.startswith(token))
+            self._main_parser.error(str(ArgumentError(
+                self._subparsers_action,
+                f"ambiguous choice: {token!r} could match {', '.join(candidates)}")))
+        return node[1]
+
+    def split(self, args: Sequence[str]) -> Optional[Tuple[int, str]]:
+        """Find the subcommand in the args.
+
+        Returns the index of the subcommand and the subparser name, or None if the args should be
+        left to argparse.
+        """
+        prefix_chars: str = self._main_parser.prefix_chars
+        index: int = 0
+        while index < len(args):
+            arg: str = args[index]
+            if not arg or arg[0] not in prefix_chars or arg == '-':
+                name = self.lookup(arg)
+                return None if name is None else (index, name)
+            option_string, has_value, _ = arg.partition('=')
+            nargs: int = self._option_nargs.get(option_string if has_value else arg, -1)
+            if nargs < 0 or arg == '--' or (has_value and nargs != 1):
+                return None
+            values = args[index + 1:index + 1 + (0 if has_value else nargs)]
+            if len(values) < (0 if has_value else nargs) or \
+                any(value and value[0] in prefix_chars for value in values):
+                return None
+            index += 1 + len(values)
+        return None
+
+    def route(self, args: Sequence[str]) -> Optional[Namespace]:
+        """Parse the args by the main parser and the subparser selected, each with its own slice.
+
+        Returns the parsed Namespace, the same as the one from argparse, except that the subparser
+        name is always the name rather than the alias or the abbreviation typed. Returns None if
+        the args should be left to argparse.
+        """
+        found = self.split(args)
+        if found is None:
+            return None
+        index, name = found
+        subparser: Optional[ArgumentParser] = self._subparsers_action.choices.get(name, None)
+        if subparser is None and isinstance(self._subparsers_action, _ArgCatLazySubParsersAction):
+            # None if another thread has created it meanwhile.
+            subparser = self._subparsers_action.materialize(name) or \
+                self._subparsers_action.choices.get(name, None)
+        if subparser is None:
+            return None
+        if index > 0:
+            namespace = self._main_parser.parse_args(args[:index])
+        else:
+            if self._main_defaults is None:
+                self._main_defaults = vars(self._main_parser.parse_args([]))
+            namespace = Namespace(**self._main_defaults)
+        setattr(namespace, self._subparsers_action.dest, name)
+        # The same as _SubParsersAction, the subparser parses into a new namespace whose values
+        # override the ones of the main parser, and the main parser reports unrecognized args.
+        sub_namespace, unrecognized_args = subparser.parse_known_args(args[index + 1:], None)
+        for key, value in vars(sub_namespace).items():
+            setattr(namespace, key, value)
+        if unrecognized_args:
+            self._main_parser.error(f"unrecognized arguments: {' '.join(unrecognized_args)}")
+        return namespace
+
+def _read_only(value: Any) -> Any:
+    """Get a read-only version of `value` for the results of _ArgCatBuilder.
+
+    Dicts become read-only views of new dicts, lists and tuples become tuples and sets become
+    frozensets, all the way down. So, the nested values of a result can't be modified either, and
+    they never refer to the ones in the manifest. Any other value is returned as it is.
+
+    Returns the read-only value, or `value` itself if it's read-only already.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        items = tuple(_read_only(item) for item in value)
+        # Keep the tuples which are read-only already, such as the name or flags of arguments.
+        if isinstance(value, tuple) and all(map(operator.is_, items, value)):
+            return value
+        return items
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+def _read_only_mapping(data: Dict) -> Mapping:
+    """Get a read-only view of `data` whose nested values are read-only too. See _read_only().
+
+    Returns a MappingProxyType, which is a view of `data` itself if none of its values are
+    containers.
+    """
+    if any(isinstance(value, (dict, list, tuple, set)) for value in data.values()):
+        data = {key: _read_only(value) for key, value in data.items()}
+    return MappingProxyType(data)
 
 class _ArgCatBuilder:
     # NOTE: Try not to initialize a collection here, otherwise all instances of _ArgCatBuilder will
@@ -266,24 +963,37 @@ class _ArgCatBuilder:
     # cause serious bugs.
     _manifest_data: Dict # = {}
     _on_build_done: Callable[[Dict], None]
+    # The builder prints by the filter level of its ArgCat in the `with` body.
+    _filter_level_scope: _ArgCatFilterLevelScope
 
-    def __init__(self, on_build_done: Callable):
+    def __init__(self, on_build_done: Callable,
+                 filter_level: _ArgCatPrintLevel = _ArgCatPrintLevel.IF_NECESSARY):
         self._manifest_data = {}
         self._on_build_done = on_build_done
+        self._filter_level_scope = _ArgCatFilterLevelScope(filter_level)
 
     # For with statement: enter is before `with` body.
     def __enter__(self):
+        self._filter_level_scope.__enter__()
         # Init data with default values.
         # NOTE: DEEP COPY IS A MUST! Otherwise, all _manifest_data of _ArgCatBuilder instances will
         # have and operate on the same META and PARSERS dict, which is a epic serious bug.
-        self._manifest_data[_ManifestConstants.META] = deepcopy(_ARGUMENT_DEFAULTS_["META"])
-        self._manifest_data[_ManifestConstants.PARSERS] = deepcopy(_ARGUMENT_DEFAULTS_["PARSERS"])
+        # META only has str values and each default parser only has an empty argument list, so
+        # copying them level by level is as deep as deepcopy() without importing copy.
+        self._manifest_data[_ManifestConstants.META] = dict(_ARGUMENT_DEFAULTS_["META"])
+        self._manifest_data[_ManifestConstants.PARSERS] = {
+            parser_name: {key: list(value) for key, value in parser_dict.items()}
+            for parser_name, parser_dict in _ARGUMENT_DEFAULTS_["PARSERS"].items()
+        }
 
         return self
 
     # For with statement: exit is after `with` body.
     def __exit__(self, exit_type, value, exit_traceback):
-        self._on_build_done(self._manifest_data)
+        try:
+            self._on_build_done(self._manifest_data)
+        finally:
+            self._filter_level_scope.__exit__(exit_type, value, exit_traceback)
 
     def _select_parser_by_name(self, parser_name: str) -> Dict:
         parsers: Dict = self._manifest_data[_ManifestConstants.PARSERS]
@@ -298,7 +1008,7 @@ class _ArgCatBuilder:
         parsers[parser_name] = new_parser
         return new_parser
 
-    def set_prog_info(self, **kwargs) -> Dict:
+    def set_prog_info(self, **kwargs) -> Mapping:
         """Set basic information of program.
 
         `**kwargs` will be used to initialize the main parser of this program by
@@ -309,13 +1019,14 @@ class _ArgCatBuilder:
         This function can be omitted. If so, the "prog" and "description" will be set to default
         values.
 
-        Returns a dict contains kwargs.
+        Returns a read-only mapping contains kwargs.
         """
         for key, value in kwargs.items():
             self._manifest_data[_ManifestConstants.META][key] = value
-        return deepcopy(kwargs)
+        # kwargs is a new dict of this call, but its values are stored in the manifest as they are.
+        return _read_only_mapping(kwargs)
 
-    def set_subparsers_info(self, **kwargs) -> Dict:
+    def set_subparsers_info(self, **kwargs) -> Mapping:
         """Set basic information of subparsers.
 
         `**kwargs` will be used to initialize the subparsers of the main parser by
@@ -326,16 +1037,16 @@ class _ArgCatBuilder:
         This function can be omitted. If so, an empty `**kwargs` will be used for the
         initialization.
 
-        Returns a dict contains kwargs.
+        Returns a read-only mapping contains kwargs.
         """
         subparsers_data = \
         self._manifest_data[_ManifestConstants.META].get(_ManifestConstants.SUBPARSER, {})
 
         for key, value in kwargs.items():
             subparsers_data[key] = value
-        return deepcopy(kwargs)
+        return _read_only_mapping(kwargs)
 
-    def add_subparser(self, parser_name: str, **kwargs: str) -> Optional[Dict]:
+    def add_subparser(self, parser_name: str, **kwargs: str) -> Optional[Mapping]:
         """Add a new subparser.
 
         `parser_name` is the name of the new subparser to add. If there has already been a parser
@@ -344,8 +1055,8 @@ class _ArgCatBuilder:
         `**kwargs` is exactly the same as the one passed into
         `argparse.ArgumentParser.add_parser()`. ArgCat does not modify any elements of it.
 
-        Returns a dict contains the parser's information from `*args, **kwargs` and ArgCat, or
-        None if a parser with the same name has already existed.
+        Returns a read-only mapping contains the parser's information from `*args, **kwargs` and
+        ArgCat, or None if a parser with the same name has already existed.
         """
         the_parser = self._select_parser_by_name(parser_name)
         if the_parser:
@@ -356,7 +1067,10 @@ class _ArgCatBuilder:
         new_parser = self._add_parser_with_name(parser_name)
         for key, value in kwargs.items():
             new_parser[key] = value
-        return deepcopy(new_parser)
+        # Only the argument list of the parser is modified by the builder later, which is not a
+        # part of kwargs. So, give a read-only view of the parser information with no arguments
+        # instead of copying it.
+        return _read_only_mapping({**new_parser, _ManifestConstants.ARGUMENTS: ()})
 
     class _ArgCatParserArgumentBuilder:
         _parser: Dict # parser dict to add argumemt information
@@ -364,7 +1078,7 @@ class _ArgCatBuilder:
         def __init__(self, parser: Dict) -> None:
             self._parser = parser
 
-        def _add_argument(self, ignored_by_subparser: bool, *args: str, **kwargs: str) -> Dict:
+        def _add_argument(self, ignored_by_subparser: bool, *args: str, **kwargs: str) -> Mapping:
             new_argument = {} # An empty argument.
             if args:
                 new_argument[_ManifestConstants.NAME_OR_FLAGS] = args
@@ -374,10 +1088,12 @@ class _ArgCatBuilder:
             arguments: List = self._parser[_ManifestConstants.ARGUMENTS]
             arguments.append(new_argument)
             # Make sure we don't return the actual dict of the argument information to prevent the
-            # internal dict from being modified outside the builder unexpectedly.
-            return deepcopy(new_argument)
+            # internal dict from being modified outside the builder unexpectedly. A read-only view
+            # is enough, since the builder never modifies the argument dict once it is added. The
+            # nested values, such as `choices` or a list `default`, are read-only too.
+            return _read_only_mapping(new_argument)
 
-        def add_argument(self, *args: str, **kwargs: str) -> Dict:
+        def add_argument(self, *args: str, **kwargs: str) -> Mapping:
             """Add a new argument.
 
             `*args, **kwargs` is exactly the same as those for
@@ -385,14 +1101,15 @@ class _ArgCatBuilder:
             further modification. So, if there is any complain/error due to your input, don't blame
             the cat. LOL. (DOGE):P
 
-            Returns a dict contains the argument information from `*args, **kwargs` and ArgCat.
+            Returns a read-only mapping contains the argument information from `*args, **kwargs`
+            and ArgCat.
             """
             return self._add_argument(False, *args, **kwargs)
 
         def add_group(self, group_name: str, description: Optional[str] = None,
-                      is_mutually_exclusive: bool = False) -> Optional[Dict]:
+                      is_mutually_exclusive: bool = False) -> Optional[Mapping]:
             """Add a new group for a parser.
-            Returns a dict contains the group information or None if any errors.
+            Returns a read-only mapping contains the group information or None if any errors.
             """
             the_groups = self._parser.setdefault(_ManifestConstants.ARGUMENT_GROUPS, {})
             new_group = the_groups.get(group_name, {})
@@ -410,11 +1127,11 @@ class _ArgCatBuilder:
 
             # Make sure we don't return the actual dict of the group information to prevent the
             # internal dict from being modified outside the builder unexpectedly.
-            return deepcopy(new_group)
+            return _read_only_mapping(new_group)
 
     class _ArgCatMainParserArgumentBuilder(_ArgCatParserArgumentBuilder):
 
-        def add_exclusive_argument(self, *args: str, **kwargs: str) -> Dict:
+        def add_exclusive_argument(self, *args: str, **kwargs: str) -> Mapping:
             """Add a new exclusive argument.
 
             An exclusive argument for `main` parser is one argument whose `ignored_by_subparser`
@@ -436,7 +1153,8 @@ class _ArgCatBuilder:
             operation. So, if there is any complain/error due to your input, don't blame the cat.
             (DOGE):P
 
-            Returns a dict contains the argument information from `*args, **kwargs` and ArgCat.
+            Returns a read-only mapping contains the argument information from `*args, **kwargs`
+            and ArgCat.
             """
             return self._add_argument(True, *args, **kwargs)
 
@@ -465,32 +1183,1193 @@ class _ArgCatBuilder:
         _ArgCatPrinter.print(f"`{parser_name}` parser is not valid.", level=_ArgCatPrintLevel.ERROR)
         return None
 
+class _ArgCatTypeRegistry:
+    """A process-wide registry resolving the lexical types in manifests to real types.
+
+    A lexical type is resolved in the order of:
+    1. The converters registered by `register()`;
+    2. The types resolved before, by any ArgCat instance of this process;
+    3. The built-in fast paths for the common scalar types and path types;
+    4. The import path given, such as the one in a compiled manifest;
+    5. `pydoc.locate()`, which is the slowest since it tries to import every prefix of the lexical
+    type as a module.
+    """
+    _converters: ClassVar[Dict[str, Callable[[str], Any]]] = {}
+    _resolved_types: ClassVar[Dict[str, Any]] = {}
+    _builtin_types: ClassVar[Dict[str, Any]] = {
+        builtin_type.__name__: builtin_type
+        for builtin_type in (str, int, float, complex, bool, bytes, bytearray)
+    }
+    # The modules of these types are imported only when the types are used.
+    _builtin_type_paths: ClassVar[Dict[str, Tuple[str, str]]] = {
+        'pathlib.Path': ('pathlib', 'Path'),
+        'pathlib.PurePath': ('pathlib', 'PurePath'),
+        'pathlib.PurePosixPath': ('pathlib', 'PurePosixPath'),
+        'pathlib.PureWindowsPath': ('pathlib', 'PureWindowsPath'),
+        'decimal.Decimal': ('decimal', 'Decimal'),
+        'fractions.Fraction': ('fractions', 'Fraction'),
+    }
+
+    @classmethod
+    def register(cls, name: str, converter: Callable[[str], Any]) -> None:
+        """Register `converter` as the type of the arguments whose lexical type is `name`.
+
+        Returns None.
+        """
+        cls._converters[name] = converter
+
+    @classmethod
+    def unregister(cls, name: str) -> bool:
+        """Unregister the converter registered with `name`.
+
+        Returns True if there was such a converter, otherwise False.
+        """
+        return cls._converters.pop(name, None) is not None
+
+    @staticmethod
+    def import_type(module_name: str, qualname: str) -> Any:
+        """Import the type by its module name and qualified name.
+
+        Returns the type or None if it cannot be imported.
+        """
+        try:
+            located_type = importlib.import_module(module_name)
+            for attr in qualname.split('.'):
+                located_type = getattr(located_type, attr)
+        except (ImportError, AttributeError):
+            return None
+        return located_type
+
+    @classmethod
+    def resolve(cls, lexical_type: str, type_path: Optional[Sequence[str]] = None) -> Any:
+        """Resolve `lexical_type` to a real type, optionally with its import path `type_path`.
+
+        Returns the type or None if it cannot be resolved.
+        """
+        converter = cls._converters.get(lexical_type, None)
+        if converter is not None:
+            return converter
+        if lexical_type in cls._resolved_types:
+            return cls._resolved_types[lexical_type]
+        located_type = cls._builtin_types.get(lexical_type, None)
+        if located_type is None:
+            type_path = cls._builtin_type_paths.get(lexical_type, type_path)
+            if type_path is not None:
+                located_type = cls.import_type(*type_path)
+        if located_type is None:
+            # pylint: disable=import-outside-toplevel
+            from pydoc import locate
+            located_type = locate(lexical_type)
+        cls._resolved_types[lexical_type] = located_type
+        return located_type
+
+class _ArgCatStats:
+    """Opt-in instrumentation of ArgCat, recording the wall time of every phase and the dispatch
+    latency of every parser.
+
+    The phases are:
+    - build: the `with ArgCat.build()` body, in which the manifest is made;
+    - create_parsers: creating the parsers from the manifest;
+    - materialize: creating a lazy subparser when it's selected, which is also a part of tokenize;
+    - tokenize: argparse parsing the args into a Namespace;
+    - split: splitting the Namespace into the arguments for the parsers;
+    - dispatch: calling a handler. For a coroutine handler, this is only creating the awaitable.
+    Besides the time of the phase, every dispatch is counted for its parser with a latency
+    histogram.
+
+    It's only created when the instrumentation is on. Otherwise, the cost is checking
+    `ArgCat._timed` on every phase.
+    """
+    BUILD: ClassVar[str] = 'build'
+    CREATE_PARSERS: ClassVar[str] = 'create_parsers'
+    MATERIALIZE: ClassVar[str] = 'materialize'
+    TOKENIZE: ClassVar[str] = 'tokenize'
+    SPLIT: ClassVar[str] = 'split'
+    DISPATCH: ClassVar[str] = 'dispatch'
+    # The upper bounds in seconds of the buckets of the dispatch latency histograms. The last
+    # bucket of a histogram is for anything slower than the last bound.
+    HISTOGRAM_BOUNDS: ClassVar[Tuple[float, ...]] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05,
+                                                     0.1, 0.5, 1.0, 5.0)
+
+    _callback: Optional[Callable[[str, float, Optional[str]], None]]
+    # Phase name to [count, failed count, total seconds, min seconds, max seconds].
+    _phases: Dict[str, List]
+    # Parser name to [count, failed count, total seconds, bucket counts].
+    _dispatches: Dict[str, List]
+    _lock: Any
+
+    def __init__(self, callback: Optional[Callable[[str, float, Optional[str]], None]] = None
+                 ) -> None:
+        self._callback = callback
+        self._lock = _thread.allocate_lock()
+        self._phases = {}
+        self._dispatches = {}
+
+    def record(self, phase: str, seconds: float, parser_name: Optional[str] = None,
+               failed: bool = False) -> None:
+        """Record `seconds` spent in `phase`, for the parser `parser_name` if it's a dispatch.
+
+        `failed` is whether the phase ended with an error, such as a parsing error or an exception
+        raised by the handler. The callback, if any, is called with `phase`, `seconds` and
+        `parser_name` after recording.
+
+        Returns None.
+        """
+        with self._lock:
+            phase_stats = self._phases.get(phase, None)
+            if phase_stats is None:
+                self._phases[phase] = [1, int(failed), seconds, seconds, seconds]
+            else:
+                phase_stats[0] += 1
+                phase_stats[1] += failed
+                phase_stats[2] += seconds
+                phase_stats[3] = min(phase_stats[3], seconds)
+                phase_stats[4] = max(phase_stats[4], seconds)
+            if parser_name is not None:
+                dispatch_stats = self._dispatches.get(parser_name, None)
+                if dispatch_stats is None:
+                    dispatch_stats = [0, 0, 0.0, [0] * (len(self.HISTOGRAM_BOUNDS) + 1)]
+                    self._dispatches[parser_name] = dispatch_stats
+                dispatch_stats[0] += 1
+                dispatch_stats[1] += failed
+                dispatch_stats[2] += seconds
+                bucket = 0
+                while bucket < len(self.HISTOGRAM_BOUNDS) and \
+                    seconds > self.HISTOGRAM_BOUNDS[bucket]:
+                    bucket += 1
+                dispatch_stats[3][bucket] += 1
+        if self._callback is not None:
+            self._callback(phase, seconds, parser_name)
+
+    def snapshot(self) -> Dict:
+        """Make a snapshot of the statistics, which is a JSON serializable dict like:
+
+        {
+            'phases': {phase: {'count', 'failed', 'total', 'min', 'max'}},
+            'dispatches': {parser_name: {'count', 'failed', 'total', 'histogram': {
+                'bounds': HISTOGRAM_BOUNDS, 'counts': bucket counts}}}
+        }
+
+        Returns a dict.
+        """
+        with self._lock:
+            return {
+                'phases': {
+                    phase: {'count': count, 'failed': failed, 'total': total, 'min': minimum,
+                            'max': maximum}
+                    for phase, (count, failed, total, minimum, maximum) in self._phases.items()
+                },
+                'dispatches': {
+                    parser_name: {'count': count, 'failed': failed, 'total': total,
+                                  'histogram': {'bounds': list(self.HISTOGRAM_BOUNDS),
+                                                'counts': list(counts)}}
+                    for parser_name, (count, failed, total, counts) in self._dispatches.items()
+                }
+            }
+
+    def reset(self) -> None:
+        """Clear all the statistics recorded.
+
+        Returns None.
+        """
+        with self._lock:
+            self._phases = {}
+            self._dispatches = {}
+
+# The tracer of the ArgCat dispatching the current handler. See ArgCat.trace_span().
+_CURRENT_TRACER: contextvars.ContextVar = contextvars.ContextVar('argcat_current_tracer',
+                                                                default=None)
+
+class _ArgCatTracer:
+    """Opt-in tracing of ArgCat, writing spans in the Chrome Trace Event format.
+
+    Every span is a complete event ("ph": "X") written as one line of a JSON array as soon as it
+    ends. The closing bracket of the array is never written, which is allowed by the format, so the
+    file is still viewable in chrome://tracing or Perfetto if the process is killed. `{pid}` in
+    `trace_path` is replaced with the process ID, so the invocations in a shell loop don't
+    overwrite the traces of each other.
+    """
+    _trace_path: str
+    _trace_file: Any
+    _origin: float
+    _pid: int
+    _lock: Any
+
+    def __init__(self, trace_path: str) -> None:
+        self._pid = os.getpid()
+        self._trace_path = trace_path.replace('{pid}', str(self._pid))
+        self._trace_file = None
+        self._origin = time.perf_counter()
+        self._lock = _thread.allocate_lock()
+
+    @property
+    def trace_path(self) -> str:
+        """Get the path of the trace file."""
+        return self._trace_path
+
+    def add_span(self, name: str, start: float, end: float, args: Optional[Dict] = None) -> None:
+        """Write a span from `start` to `end`, which are from `time.perf_counter()`.
+
+        `args` is shown as the arguments of the span in the viewer. Its values which are not JSON
+        serializable are written as their `str()`.
+
+        Returns None.
+        """
+        # pylint: disable=import-outside-toplevel
+        import json
+        event: Dict = {'name': name, 'cat': 'argcat', 'ph': 'X',
+                       'ts': round((start - self._origin) * 1e6, 3),
+                       'dur': round((end - start) * 1e6, 3),
+                       'pid': self._pid, 'tid': _thread.get_ident()}
+        if args:
+            event['args'] = args
+        line: str = json.dumps(event, default=str) + ',\n'
+        with self._lock:
+            if self._trace_file is None:
+                # pylint: disable=consider-using-with
+                self._trace_file = open(self._trace_path, 'w', encoding='utf-8')
+                self._trace_file.write('[\n')
+            self._trace_file.write(line)
+            self._trace_file.flush()
+
+    def close(self) -> None:
+        """Close the trace file.
+
+        Returns None.
+        """
+        with self._lock:
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+
+    def __del__(self) -> None:
+        self.close()
+
+class _ArgCatTraceSpan:
+    """A span of the tracer, which is a context manager. See ArgCat.trace_span().
+
+    Without a tracer, it does nothing.
+    """
+    _tracer: Optional[_ArgCatTracer]
+    _name: str
+    _args: Dict
+    _start: float
+
+    def __init__(self, tracer: Optional[_ArgCatTracer], name: str, args: Dict) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self) -> _ArgCatTraceSpan:
+        if self._tracer is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exit_type, value, exit_traceback) -> None:
+        if self._tracer is not None:
+            if exit_type is not None:
+                self._args['error'] = repr(value)
+            self._tracer.add_span(self._name, self._start, time.perf_counter(), self._args)
+
+class _ArgCatParseCache:
+    """A bounded LRU cache of the parsed results of args.
+
+    The key is the tuple of the args, and the value is the tuple returned by
+    _ArgCatParser.parse_args(), which is (subparser name, subparser kwargs, main kwargs). The kwargs
+    are copied both when they are stored and when they are returned, if any of their values is
+    mutable, so a handler changing its kwargs, such as appending to a list default, never changes
+    the cached ones.
+
+    Only the results made of IMMUTABLE_TYPES and the plain containers of them are cached. Any other
+    value, such as a file opened by `argparse.FileType`, may have been made with side effects which
+    must happen on every parse, so the args are parsed by argparse every time.
+    """
+    # The types of the values which are never copied.
+    IMMUTABLE_TYPES: ClassVar[Tuple[type, ...]] = (str, int, float, complex, bool, bytes,
+                                                    type(None), frozenset)
+    # The containers whose items are checked and copied.
+    CONTAINER_TYPES: ClassVar[Tuple[type, ...]] = (list, tuple, set, dict)
+
+    _maxsize: int
+    _entries: Dict[Tuple[str, ...], Tuple[str, Optional[Dict], Dict]]
+    _hits: int
+    _misses: int
+    _invalidations: int
+    _lock: Any
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        # Dicts keep the insertion order, so the first key is the least recently used one.
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._lock = _thread.allocate_lock()
+
+    @classmethod
+    def _copy(cls, parsed: Tuple[str, Optional[Dict], Dict]) -> Tuple[str, Optional[Dict], Dict]:
+        subparser_name, sub_dict, main_dict = parsed
+        if all(isinstance(value, cls.IMMUTABLE_TYPES) for value in main_dict.values()) and \
+            (sub_dict is None or
+             all(isinstance(value, cls.IMMUTABLE_TYPES) for value in sub_dict.values())):
+            return subparser_name, None if sub_dict is None else dict(sub_dict), dict(main_dict)
+        # pylint: disable=import-outside-toplevel
+        import copy
+        return copy.deepcopy(parsed)
+
+    @classmethod
+    def is_cacheable(cls, value: Any) -> bool:
+        """Check whether `value` is made of IMMUTABLE_TYPES and CONTAINER_TYPES only. Subclasses
+        of the containers are not, since they may do anything.
+
+        Returns a Boolean.
+        """
+        if isinstance(value, cls.IMMUTABLE_TYPES):
+            return True
+        if type(value) not in cls.CONTAINER_TYPES:
+            return False
+        if isinstance(value, dict):
+            return all(cls.is_cacheable(key) and cls.is_cacheable(item)
+                       for key, item in value.items())
+        return all(cls.is_cacheable(item) for item in value)
+
+    def get(self, key: Tuple[str, ...]) -> Optional[Tuple[str, Optional[Dict], Dict]]:
+        """Get a copy of the parsed result of `key` and mark it as the most recently used.
+
+        Returns the tuple, or None if it's not cached.
+        """
+        with self._lock:
+            parsed = self._entries.pop(key, None)
+            if parsed is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries[key] = parsed
+        return self._copy(parsed)
+
+    def put(self, key: Tuple[str, ...], parsed: Tuple[str, Optional[Dict], Dict]) -> None:
+        """Store a copy of the parsed result of `key`, evicting the least recently used one if the
+        cache is full. It's best-effort: the result is not stored if it's not cacheable or can't be
+        copied.
+
+        Returns None.
+        """
+        _, sub_dict, main_dict = parsed
+        if not all(self.is_cacheable(value) for value in main_dict.values()) or \
+            (sub_dict is not None and
+             not all(self.is_cacheable(value) for value in sub_dict.values())):
+            return
+        # pylint: disable=broad-exception-caught
+        try:
+            parsed = self._copy(parsed)
+        except Exception:
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = parsed
+
+    def invalidate(self) -> None:
+        """Drop all the cached results. The hit and miss counts are kept.
+
+        Returns None.
+        """
+        with self._lock:
+            if self._entries:
+                self._entries.clear()
+                self._invalidations += 1
+
+    def info(self) -> Dict:
+        """Get the counters of the cache.
+
+        Returns a dict of `hits`, `misses`, `invalidations`, `size` and `maxsize`.
+        """
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses,
+                    'invalidations': self._invalidations, 'size': len(self._entries),
+                    'maxsize': self._maxsize}
+
+def _stable_repr(obj: Any) -> str:
+    """The `default` of json.dumps() for hashing objects which are not JSON serializable.
+
+    Classes and functions are identified by their import paths since their reprs may contain
+    memory addresses. Any other object with an address in its repr can't be hashed stably.
+    """
+    if isinstance(obj, type) or callable(obj) and hasattr(obj, '__qualname__'):
+        return f"{getattr(obj, '__module__', '')}.{obj.__qualname__}"
+    if isinstance(obj, (set, frozenset)):
+        return repr(sorted(repr(element) for element in obj))
+    obj_repr = repr(obj)
+    if ' at 0x' in obj_repr:
+        raise TypeError(f"`{obj_repr}` cannot be hashed stably.")
+    return obj_repr
+
+class _ArgCatHandlerCache:
+    """A cache of the results of a pure handler, which is set by `@ArgCat.handler` with any of the
+    caching options.
+
+    The key is the stable hash of the kwargs of the handler, so the same kwargs always get the same
+    key, even across processes. The name and a hash of the code of the handler are hashed too, so
+    the results saved by another version of the handler are never used. For a method, so is the
+    object it's bound to, by the repr. So, the results of one object are never returned for another
+    one, and a method of an object without a stable repr, whose repr has its memory address, is
+    never cached. Up to `maxsize` results are kept in memory, the least recently used
+    one being evicted first. If `ttl` is set, a result expires `ttl` seconds after being stored. If
+    `cache_dir` is set, the results are pickled there too, so they are shared by processes and
+    survive restarts.
+
+    A handler raising an exception or returning an awaitable is never cached, nor is one whose
+    kwargs can't be hashed stably.
+    """
+    # The maxsize of the memory cache if only the TTL or the cache dir is set.
+    DEFAULT_MAXSIZE: ClassVar[int] = 128
+
+    _name: str
+    _maxsize: int
+    _ttl: Optional[float]
+    _cache_dir: Optional[str]
+    _code: Optional[Any]
+    # The hash of `_code`, which is made on the first call.
+    _code_hash: Optional[str]
+    # The results and the time they are stored by the keys, the least recently used one first.
+    _entries: Dict[str, Tuple[Any, float]]
+    _hits: int
+    _disk_hits: int
+    _misses: int
+    # Held for the entries and the counters only, so the handler itself runs in parallel.
+    _lock: Any
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, name: str, maxsize: Optional[int] = None, ttl: Optional[float] = None,
+                 cache_dir: Optional[str] = None, code: Optional[Any] = None) -> None:
+        self._name = name
+        self._code = code
+        self._code_hash = None
+        self._maxsize = self.DEFAULT_MAXSIZE if maxsize is None else maxsize
+        self._ttl = ttl
+        # Every handler has its own dir, so invalidating one never touches the others.
+        dir_name = ''.join(char if char.isalnum() or char in '._-' else '_' for char in name)
+        self._cache_dir = os.path.join(os.path.expanduser(cache_dir), dir_name) \
+            if cache_dir else None
+        self._entries = {}
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._lock = _thread.allocate_lock()
+
+    def key_of(self, parameters: Dict, bound_to: Optional[Any] = None) -> Optional[str]:
+        """Hash the kwargs of the handler, along with its name, its code and `bound_to`, the object
+        a method is bound to.
+
+        Returns the hex digest or None if any of them can't be hashed stably.
+        """
+        # pylint: disable=import-outside-toplevel
+        import hashlib
+        import json
+        if self._code_hash is None:
+            import marshal
+            # The code object has the bytecode, the constants and the names, as well as the nested
+            # functions, and marshal dumps them the same in every process.
+            self._code_hash = '' if self._code is None else \
+                hashlib.sha256(marshal.dumps(self._code)).hexdigest()
+        try:
+            key_str = json.dumps([self._name, self._code_hash, bound_to, parameters],
+                                 sort_keys=True, default=_stable_repr)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+
+    def _is_expired(self, stored_time: float) -> bool:
+        return self._ttl is not None and time.time() - stored_time >= self._ttl
+
+    def _load(self, key: str) -> Optional[Tuple[Any, float]]:
+        # pylint: disable=import-outside-toplevel
+        import pickle
+        cache_path = os.path.join(self._cache_dir, f"{key}.pickle")
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                entry: Tuple[Any, float] = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        # pylint: disable=broad-exception-caught
+        except Exception as exc:
+            _ArgCatPrinter.print(f"Ignored the corrupted handler cache `{cache_path}`: {exc!r}",
+                                 level=_ArgCatPrintLevel.WARNING)
+            return None
+        if self._is_expired(entry[1]):
+            return None
+        return entry
+
+    def _save(self, key: str, entry: Tuple[Any, float]) -> None:
+        # pylint: disable=import-outside-toplevel
+        import pickle
+        cache_path = os.path.join(self._cache_dir, f"{key}.pickle")
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                pickle.dump(entry, cache_file)
+            os.replace(temp_path, cache_path)
+        # Pickling can fail with almost any exception for objects not picklable.
+        # pylint: disable=broad-exception-caught
+        except Exception as exc:
+            _ArgCatPrinter.print(f"Failed to save the handler cache `{cache_path}`: {exc!r}",
+                                 level=_ArgCatPrintLevel.WARNING)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def call(self, func: Callable[[Dict], Any], parameters: Dict,
+             bound_to: Optional[Any] = None) -> Any:
+        """Get the cached result of `parameters`, or call `func` with `parameters` and cache the
+        result. `bound_to` is the object the handler is bound to if it's a method.
+
+        Returns the result.
+        """
+        key = self.key_of(parameters, bound_to)
+        if key is None:
+            return func(parameters)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None and self._is_expired(entry[1]):
+            entry = None
+        is_disk_hit: bool = False
+        if entry is None and self._cache_dir is not None:
+            entry = self._load(key)
+            is_disk_hit = entry is not None
+        if entry is not None:
+            with self._lock:
+                self._hits += 1
+                self._disk_hits += is_disk_hit
+                self._entries[key] = entry
+            _ArgCatPrinter.print("Returned the cached result of `%s`.", self._name)
+            return entry[0]
+        with self._lock:
+            self._misses += 1
+        result = func(parameters)
+        if hasattr(result, '__await__'):
+            return result
+        entry = (result, time.time())
+        if self._maxsize > 0:
+            with self._lock:
+                if key not in self._entries and len(self._entries) >= self._maxsize:
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = entry
+        if self._cache_dir is not None:
+            self._save(key, entry)
+        return result
+
+    def invalidate(self) -> None:
+        """Drop all the cached results, including the ones in the cache dir.
+
+        Returns None.
+        """
+        with self._lock:
+            self._entries.clear()
+        if self._cache_dir is None or not os.path.isdir(self._cache_dir):
+            return
+        for file_name in os.listdir(self._cache_dir):
+            if file_name.endswith('.pickle'):
+                try:
+                    os.remove(os.path.join(self._cache_dir, file_name))
+                except FileNotFoundError:
+                    pass
+
+    def info(self) -> Dict:
+        """Get the counters of the cache. `hits` includes `disk_hits`.
+
+        Returns a dict of `hits`, `disk_hits`, `misses`, `size`, `maxsize`, `ttl` and
+        `cache_dir`.
+        """
+        with self._lock:
+            return {'hits': self._hits, 'disk_hits': self._disk_hits, 'misses': self._misses,
+                    'size': len(self._entries), 'maxsize': self._maxsize, 'ttl': self._ttl,
+                    'cache_dir': self._cache_dir}
+
+class _ArgCatHandlerRegistry:
+    """A process-wide registry of the names and the ids of the functions decorated by
+    @ArgCat.handler.
+
+    A handler provider is bound by looking up only these names on it, instead of going through all
+    its members, which evaluates the properties of an instance. A module, such as `__main__`, may
+    have a handler by another name, like `from tool import plan as plan_handler`. So, the values in
+    its dict are matched by the ids as well, which doesn't touch any of them.
+    """
+    _names: ClassVar[Dict[str, None]] = {}
+    # The functions are not kept alive by the registry. An id reused by another object after a
+    # handler is gone is harmless, since the object found is checked to be a handler anyway.
+    _ids: ClassVar[Dict[int, None]] = {}
+    _lock: ClassVar[Any] = _thread.allocate_lock()
+
+    @classmethod
+    def register(cls, func: Callable) -> None:
+        """Register a function decorated by @ArgCat.handler.
+
+        Returns None.
+        """
+        name: Optional[str] = getattr(func, '__name__', None)
+        with cls._lock:
+            if name is not None:
+                cls._names[name] = None
+            cls._ids[id(func)] = None
+
+    @classmethod
+    def handlers_of(cls, handler_provider: Any) -> List[Tuple[str, Callable]]:
+        """Find the handlers of `handler_provider`.
+
+        The attributes are looked up statically first, so a property or a `__getattr__` is never
+        called. Only the functions, methods, static methods and class methods are got then. The
+        functions of a module are also found by their ids under any other names.
+
+        Returns a list of the names and the handlers, in alphabet order of the names.
+        """
+        # pylint: disable=import-outside-toplevel
+        import inspect
+        with cls._lock:
+            names: List[str] = list(cls._names)
+            ids: Dict[int, None] = dict(cls._ids) if isinstance(handler_provider, ModuleType) \
+                else {}
+        handlers: Dict[str, Callable] = {}
+        if ids:
+            # Only the dict is iterated, and only the values with the ids are checked.
+            handlers = {name: obj for name, obj in list(vars(handler_provider).items())
+                        if id(obj) in ids}
+            handlers = {name: obj for name, obj in handlers.items()
+                        if inspect.isfunction(obj) and hasattr(obj, 'argcat_argument_parser_name')}
+        for name in names:
+            if name in handlers:
+                continue
+            obj = inspect.getattr_static(handler_provider, name, None)
+            if obj is None or not (isinstance(obj, (staticmethod, classmethod)) or \
+                                   inspect.isfunction(obj) or inspect.ismethod(obj)):
+                continue
+            obj = getattr(handler_provider, name)
+            if (inspect.ismethod(obj) or inspect.isfunction(obj)) and \
+                hasattr(obj, 'argcat_argument_parser_name'):
+                handlers[name] = obj
+        return sorted(handlers.items(), key=operator.itemgetter(0))
+
+class _ArgCatCompletion:
+    """A generator of static shell completion scripts from a manifest.
+
+    The scripts complete the subcommands and their aliases, the option strings, the `choices`, and
+    files for the arguments of path types, without running any Python. They are generated by
+    walking the manifest only, so no parser is created.
+
+    Every parser is turned into a fragment of the script of each shell. `write()` keeps the
+    fragments with the hashes of what they are generated from, so regenerating the scripts only
+    regenerates the fragments of the parsers changed, and only rewrites the scripts changed.
+    """
+    SHELLS: ClassVar[Tuple[str, ...]] = ('bash', 'zsh', 'fish')
+    # The script file names of the shells, by the conventions of their completion dirs.
+    FILE_NAMES: ClassVar[Dict[str, str]] = {'bash': '{command}', 'zsh': '_{command}',
+                                            'fish': '{command}.fish'}
+    INDEX_FILE_NAME: ClassVar[str] = '.{command}.completion.json'
+    # Bump FORMAT_VERSION whenever the generated fragments change, so that the kept ones are
+    # regenerated.
+    FORMAT_VERSION: ClassVar[int] = 1
+    # The actions of options taking no value.
+    FLAG_ACTIONS: ClassVar[frozenset] = frozenset(['store_const', 'store_true', 'store_false',
+                                                   'append_const', 'count', 'help', 'version',
+                                                   'BooleanOptionalAction'])
+    # The lexical types completed as files.
+    PATH_TYPES: ClassVar[frozenset] = frozenset(['pathlib.Path', 'pathlib.PurePath',
+                                                 'pathlib.PosixPath', 'pathlib.PurePosixPath',
+                                                 'pathlib.WindowsPath', 'pathlib.PureWindowsPath',
+                                                 'argparse.FileType'])
+    HELP_OPTION: ClassVar[Dict] = {'strings': ['-h', '--help'], 'takes_value': False,
+                                   'choices': [], 'files': False,
+                                   'help': 'show this help message and exit'}
+
+    _manifest_data: Dict
+    _command: str
+    _function_name: str
+
+    def __init__(self, manifest_data: Dict, command: str) -> None:
+        self._manifest_data = manifest_data
+        self._command = command
+        self._function_name = f"_argcat_{self._identifier(command)}"
+
+    @staticmethod
+    def _identifier(name: str) -> str:
+        # Every other char is escaped by its code, so different names never get the same identifier.
+        return ''.join(char if char.isalnum() else f'_{ord(char):x}' for char in name)
+
+    @staticmethod
+    def _text(text: Any) -> str:
+        # Help strings are shown in one line.
+        return ' '.join(str(text or '').split())
+
+    @classmethod
+    def _is_path_type(cls, argument_type: Any) -> bool:
+        if isinstance(argument_type, str):
+            return argument_type in cls.PATH_TYPES
+        # pylint: disable=import-outside-toplevel
+        from argparse import FileType
+        return isinstance(argument_type, FileType) or \
+            isinstance(argument_type, type) and issubclass(argument_type, os.PathLike)
+
+    def _spec_of(self, parser_dict: Dict, add_help: bool) -> Dict:
+        options: List[Dict] = [dict(self.HELP_OPTION)] if add_help else []
+        positionals: List[Dict] = []
+        for argument_dict in parser_dict.get(_ManifestConstants.ARGUMENTS, ()):
+            help_str = argument_dict.get(_ManifestConstants.HELP, None)
+            if help_str == '==SUPPRESS==':
+                continue
+            name_or_flags: List[str] = list(
+                argument_dict.get(_ManifestConstants.NAME_OR_FLAGS, None) or
+                [argument_dict.get(_ManifestConstants.DEST, '')])
+            action = argument_dict.get(_ManifestConstants.ACTION, 'store')
+            action_name = action if isinstance(action, str) else getattr(action, '__name__', '')
+            choices = argument_dict.get(_ManifestConstants.CHOICES, None)
+            argument_spec: Dict = {
+                'takes_value': action_name not in self.FLAG_ACTIONS and
+                               argument_dict.get(_ManifestConstants.NARGS, None) != 0,
+                'choices': [str(choice) for choice in choices] if choices is not None else [],
+                'files': self._is_path_type(argument_dict.get(_ManifestConstants.TYPE, None)),
+                'help': self._text(help_str)
+            }
+            if not name_or_flags[0].startswith('-'):
+                argument_spec['name'] = name_or_flags[0]
+                nargs = argument_dict.get(_ManifestConstants.NARGS, None)
+                argument_spec['repeated'] = nargs in ('*', '+', '...')
+                argument_spec['optional'] = nargs in ('?', '*')
+                positionals.append(argument_spec)
+                continue
+            if action_name == 'BooleanOptionalAction':
+                name_or_flags += [f"--no-{flag[2:]}" for flag in name_or_flags
+                                  if flag.startswith('--')]
+            argument_spec['strings'] = name_or_flags
+            options.append(argument_spec)
+        return {'options': options, 'positionals': positionals}
+
+    def specs(self) -> Dict[str, Dict]:
+        """Walk the manifest for what every parser completes.
+
+        Returns a dict of the JSON serializable specs by the parser names, `main` first. The spec of
+        `main` also has the subcommands.
+        """
+        meta_dict: Dict = self._manifest_data[_ManifestConstants.META]
+        parsers_dict: Dict = self._manifest_data[_ManifestConstants.PARSERS]
+        specs: Dict[str, Dict] = {
+            _ManifestConstants.MAIN: self._spec_of(parsers_dict.get(_ManifestConstants.MAIN, None)
+                                                   or {}, meta_dict.get('add_help', True))
+        }
+        subcommands: List[Dict] = []
+        for parser_name, parser_dict in parsers_dict.items():
+            if parser_name == _ManifestConstants.MAIN or not parser_dict:
+                continue
+            specs[parser_name] = self._spec_of(parser_dict, parser_dict.get('add_help', True))
+            subcommands.append({'name': parser_name,
+                                'aliases': list(parser_dict.get('aliases', ())),
+                                'help': self._text(parser_dict.get(_ManifestConstants.HELP, ''))})
+        specs[_ManifestConstants.MAIN]['subcommands'] = subcommands
+        return specs
+
+    def _function_of(self, parser_name: str) -> str:
+        return f"{self._function_name}_{self._identifier(parser_name)}"
+
+    def _bash_fragment(self, parser_name: str, spec: Dict) -> str:
+        # pylint: disable=import-outside-toplevel
+        import shlex
+        lines: List[str] = [f"{self._function_of(parser_name)}() {{"]
+        value_cases: List[str] = []
+        for option in spec['options']:
+            if not option['takes_value']:
+                continue
+            if option['choices']:
+                reply = f"COMPREPLY=($(compgen -W {shlex.quote(' '.join(option['choices']))} " + \
+                    "-- \"$cur\"))"
+            elif option['files']:
+                reply = "COMPREPLY=($(compgen -f -- \"$cur\"))"
+            else:
+                reply = "COMPREPLY=()"
+            pattern = '|'.join(shlex.quote(string) for string in option['strings'])
+            value_cases.append(f"        {pattern}) {reply}; return ;;")
+        if value_cases:
+            lines += ["    case \"$prev\" in", *value_cases, "    esac"]
+        option_strings = ' '.join(string for option in spec['options']
+                                  for string in option['strings'])
+        words = [key for subcommand in spec.get('subcommands', ())
+                 for key in (subcommand['name'], *subcommand['aliases'])]
+        words += [choice for positional in spec['positionals'] for choice in positional['choices']]
+        lines += ["    if [[ \"$cur\" == -* ]]; then",
+                  f"        COMPREPLY=($(compgen -W {shlex.quote(option_strings)} -- \"$cur\"))",
+                  "        return",
+                  "    fi",
+                  f"    COMPREPLY=($(compgen -W {shlex.quote(' '.join(words))} -- \"$cur\"))"
+                  if words else "    COMPREPLY=()"]
+        if any(positional['files'] for positional in spec['positionals']):
+            lines.append("    COMPREPLY+=($(compgen -f -- \"$cur\"))")
+        lines.append("}")
+        return '\n'.join(lines) + '\n'
+
+    def _bash_script(self, specs: Dict[str, Dict], fragments: List[str]) -> str:
+        # pylint: disable=import-outside-toplevel
+        import shlex
+        name_cases: List[str] = []
+        function_cases: List[str] = []
+        for subcommand in specs[_ManifestConstants.MAIN]['subcommands']:
+            name = shlex.quote(subcommand['name'])
+            pattern = '|'.join(shlex.quote(key) for key in (subcommand['name'],
+                                                             *subcommand['aliases']))
+            name_cases.append(f"            {pattern}) cmd={name}; break ;;")
+            function_cases.append(f"        {name}) {self._function_of(subcommand['name'])} ;;")
+        lines: List[str] = [
+            f"# bash completion for {self._command}, generated by ArgCat. Do not edit.", "",
+            *fragments,
+            f"{self._function_name}() {{",
+            "    local cur=\"${COMP_WORDS[COMP_CWORD]}\" prev=\"${COMP_WORDS[COMP_CWORD-1]}\" " +
+            "word cmd=''"]
+        if name_cases:
+            lines += ["    for word in \"${COMP_WORDS[@]:1:COMP_CWORD-1}\"; do",
+                      "        case \"$word\" in", *name_cases, "        esac",
+                      "    done"]
+        lines += ["    case \"$cmd\" in", *function_cases,
+                  f"        *) {self._function_of(_ManifestConstants.MAIN)} ;;",
+                  "    esac",
+                  "}",
+                  f"complete -F {self._function_name} {shlex.quote(self._command)}"]
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _zsh_escape(text: str, chars: str = '\\[]:') -> str:
+        # For the descriptions, the messages and the values in the specs of _arguments and
+        # _describe, before being quoted for the shell.
+        for char in chars:
+            text = text.replace(char, '\\' + char)
+        return text
+
+    def _zsh_action(self, argument: Dict) -> str:
+        if argument['choices']:
+            return '(' + ' '.join(self._zsh_escape(choice, '\\[]: ()')
+                                  for choice in argument['choices']) + ')'
+        return '_files' if argument['files'] else ' '
+
+    def _zsh_fragment(self, parser_name: str, spec: Dict) -> str:
+        # pylint: disable=import-outside-toplevel
+        import shlex
+        argument_specs: List[str] = []
+        for option in spec['options']:
+            exclusion = f"({' '.join(option['strings'])})" if len(option['strings']) > 1 else ''
+            for string in option['strings']:
+                argument_spec = f"{exclusion}{string}[{self._zsh_escape(option['help'])}]"
+                if option['takes_value']:
+                    argument_spec += f":{self._zsh_escape(option['strings'][-1].lstrip('-'))}:" + \
+                        self._zsh_action(option)
+                argument_specs.append(argument_spec)
+        subcommands: List[Dict] = spec.get('subcommands', [])
+        if subcommands:
+            argument_specs += ['1: :->command', '*:: :->argument']
+        else:
+            for positional in spec['positionals']:
+                prefix = '*:' if positional['repeated'] else '::' if positional['optional'] else ':'
+                argument_specs.append(f"{prefix}{self._zsh_escape(positional['name'])}:" +
+                                      self._zsh_action(positional))
+        lines: List[str] = [f"{self._function_of(parser_name)}() {{"]
+        if subcommands:
+            lines += ["    local curcontext=\"$curcontext\" state line",
+                      "    typeset -A opt_args"]
+        lines.append(f"    _arguments -s{' -C' if subcommands else ''}" +
+                     ''.join(f" \\\n        {shlex.quote(argument_spec)}"
+                             for argument_spec in argument_specs))
+        if subcommands:
+            lines += ["    case $state in",
+                      "        command)",
+                      "            local -a commands",
+                      "            commands=("]
+            lines += [f"                {shlex.quote(self._zsh_escape(key, chr(92) + ':'))}"
+                      if not subcommand['help'] else
+                      "                " +
+                      shlex.quote(f"{self._zsh_escape(key, chr(92) + ':')}:{subcommand['help']}")
+                      for subcommand in subcommands
+                      for key in (subcommand['name'], *subcommand['aliases'])]
+            lines += ["            )",
+                      "            _describe -t commands command commands ;;",
+                      "        argument)",
+                      "            case $line[1] in"]
+            for subcommand in subcommands:
+                pattern = '|'.join(shlex.quote(key) for key in (subcommand['name'],
+                                                                 *subcommand['aliases']))
+                lines.append(f"                {pattern}) " +
+                             f"{self._function_of(subcommand['name'])} ;;")
+            lines += ["            esac ;;",
+                      "    esac"]
+        lines.append("}")
+        return '\n'.join(lines) + '\n'
+
+    def _zsh_script(self, specs: Dict[str, Dict], fragments: List[str]) -> str:
+        del specs  # The main fragment dispatches to the subcommands by itself.
+        # pylint: disable=import-outside-toplevel
+        import shlex
+        lines: List[str] = [
+            f"#compdef {self._command}",
+            f"# zsh completion for {self._command}, generated by ArgCat. Do not edit.", "",
+            *fragments,
+            f"{self._function_name}() {{",
+            f"    {self._function_of(_ManifestConstants.MAIN)} \"$@\"",
+            "}",
+            # Called directly if it's autoloaded from $fpath, otherwise registered for sourcing.
+            "if [[ $zsh_eval_context[-1] == loadautoload ]]; then",
+            f"    {self._function_name} \"$@\"",
+            "else",
+            f"    compdef {self._function_name} {shlex.quote(self._command)}",
+            "fi"]
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _fish_quote(text: str) -> str:
+        if text and all(char.isalnum() or char in '@%+=:,./-_' for char in text):
+            return text
+        return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+    def _fish_fragment(self, parser_name: str, spec: Dict) -> str:
+        command = self._fish_quote(self._command)
+        subcommands: List[Dict] = spec.get('subcommands', [])
+        if parser_name != _ManifestConstants.MAIN:
+            # pylint: disable=import-outside-toplevel
+            import shlex
+            condition = ' -n ' + self._fish_quote(
+                '__fish_seen_subcommand_from ' + ' '.join(shlex.quote(key) for key in spec['keys']))
+        elif subcommands:
+            condition = ' -n __fish_use_subcommand'
+        else:
+            condition = ''
+        lines: List[str] = [f"# {parser_name}"]
+        for option in spec['options']:
+            switches = []
+            for string in option['strings']:
+                if string.startswith('--'):
+                    switches.append(f"-l {self._fish_quote(string[2:])}")
+                elif len(string) == 2:
+                    switches.append(f"-s {self._fish_quote(string[1:])}")
+                else:
+                    switches.append(f"-o {self._fish_quote(string[1:])}")
+            line = f"complete -c {command}{condition} {' '.join(switches)}"
+            if option['takes_value']:
+                line += ' -r'
+                if option['choices']:
+                    line += f" -a {self._fish_quote(' '.join(option['choices']))}"
+                elif option['files']:
+                    line += ' -F'
+            if option['help']:
+                line += f" -d {self._fish_quote(option['help'])}"
+            lines.append(line)
+        for subcommand in subcommands:
+            for key in (subcommand['name'], *subcommand['aliases']):
+                line = f"complete -c {command}{condition} -a {self._fish_quote(key)}"
+                if subcommand['help']:
+                    line += f" -d {self._fish_quote(subcommand['help'])}"
+                lines.append(line)
+        for positional in spec['positionals']:
+            if positional['choices']:
+                lines.append(f"complete -c {command}{condition} " +
+                             f"-a {self._fish_quote(' '.join(positional['choices']))}")
+            elif positional['files']:
+                lines.append(f"complete -c {command}{condition} -F")
+        return '\n'.join(lines) + '\n'
+
+    def _fish_script(self, specs: Dict[str, Dict], fragments: List[str]) -> str:
+        del specs  # Every fragment has its own condition.
+        lines: List[str] = [
+            f"# fish completion for {self._command}, generated by ArgCat. Do not edit.",
+            # No files unless an argument completes them.
+            f"complete -c {self._fish_quote(self._command)} -f", "",
+            *fragments]
+        return '\n'.join(lines)
+
+    def _fragment(self, shell: str, parser_name: str, spec: Dict) -> str:
+        return getattr(self, f"_{shell}_fragment")(parser_name, spec)
+
+    def _script(self, shell: str, specs: Dict[str, Dict], fragments: List[str]) -> str:
+        return getattr(self, f"_{shell}_script")(specs, fragments)
+
+    def _specs_with_keys(self) -> Dict[str, Dict]:
+        specs = self.specs()
+        # The names and aliases of a subparser are needed by its fish fragment.
+        for subcommand in specs[_ManifestConstants.MAIN]['subcommands']:
+            specs[subcommand['name']]['keys'] = [subcommand['name'], *subcommand['aliases']]
+        return specs
+
+    def generate(self, shell: str) -> str:
+        """Generate the completion script of a shell, which is one of SHELLS.
+
+        Returns the script.
+        """
+        if shell not in self.SHELLS:
+            raise ValueError(f"Unknown shell `{shell}`, which should be one of {self.SHELLS}.")
+        specs = self._specs_with_keys()
+        return self._script(shell, specs, [self._fragment(shell, parser_name, spec)
+                                           for parser_name, spec in specs.items()])
+
+    def write(self, directory: str, shells: Sequence[str] = SHELLS) -> Dict[str, List[str]]:
+        """Write the completion scripts of the shells into a dir, regenerating the fragments of
+        the parsers changed since the last time only.
+
+        The fragments and their hashes are kept in an index file in the dir, and a script whose
+        content doesn't change is not rewritten, so its modification time is kept too.
+
+        Returns a dict of the names of the parsers regenerated by the shells.
+        """
+        # pylint: disable=import-outside-toplevel
+        import hashlib
+        import json
+        for shell in shells:
+            if shell not in self.SHELLS:
+                raise ValueError(f"Unknown shell `{shell}`, which should be one of {self.SHELLS}.")
+        os.makedirs(directory, exist_ok=True)
+        index_path = os.path.join(directory, self.INDEX_FILE_NAME.format(command=self._command))
+        index: Dict = {}
+        try:
+            with open(index_path, 'r', encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            if index.get('version', None) != self.FORMAT_VERSION:
+                index = {}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as exc:
+            _ArgCatPrinter.print(f"Ignored the corrupted completion index `{index_path}`: {exc!r}",
+                                 level=_ArgCatPrintLevel.WARNING)
+            index = {}
+        specs = self._specs_with_keys()
+        regenerated: Dict[str, List[str]] = {}
+        # The fragments of the other shells are kept for their next time.
+        new_index: Dict = {'version': self.FORMAT_VERSION,
+                           'fragments': dict(index.get('fragments', {}))}
+        for shell in shells:
+            kept_fragments: Dict = index.get('fragments', {}).get(shell, {})
+            new_fragments: Dict = {}
+            regenerated[shell] = []
+            for parser_name, spec in specs.items():
+                spec_hash = hashlib.sha256(
+                    json.dumps([self._command, spec], sort_keys=True).encode('utf-8')).hexdigest()
+                kept_fragment = kept_fragments.get(parser_name, None)
+                if kept_fragment is not None and kept_fragment[0] == spec_hash:
+                    new_fragments[parser_name] = kept_fragment
+                    continue
+                new_fragments[parser_name] = [spec_hash, self._fragment(shell, parser_name, spec)]
+                regenerated[shell].append(parser_name)
+            new_index['fragments'][shell] = new_fragments
+            script = self._script(shell, specs, [fragment for _, fragment in
+                                                 new_fragments.values()])
+            script_path = os.path.join(directory,
+                                       self.FILE_NAMES[shell].format(command=self._command))
+            try:
+                with open(script_path, 'r', encoding='utf-8') as script_file:
+                    if script_file.read() == script:
+                        continue
+            except FileNotFoundError:
+                pass
+            with open(script_path, 'w', encoding='utf-8') as script_file:
+                script_file.write(script)
+            _ArgCatPrinter.print("Wrote the %s completion script `%s`.", shell, script_path)
+        with open(index_path, 'w', encoding='utf-8') as index_file:
+            json.dump(new_index, index_file)
+        return regenerated
+
 # Only public class for use. #
 class ArgCat:
     """ArgCat"""
+    # The environment variable of the path of the trace file. See trace_span().
+    TRACE_ENV_VAR: ClassVar[str] = 'ARGCAT_TRACE'
+    # The environment variable of the directory to dump the profiles of the handlers.
+    PROFILE_ENV_VAR: ClassVar[str] = 'ARGCAT_PROFILE'
+
     @staticmethod
-    def handler(parser_name):
+    def handler(parser_name, cache_size: Optional[int] = None, cache_ttl: Optional[float] = None,
+                cache_dir: Optional[str] = None):
         """ArgCat handler decorator.
 
         This is to make regular function/method become handler for ArgCat. And
         parser_name must be exactly the same as the parser's name. (Blah blah)
+
+        If any of `cache_size`, `cache_ttl` and `cache_dir` is set, the results of the handler are
+        cached by its kwargs, so it's called only once for the same kwargs. It's only for pure
+        handlers, whose results depend on nothing but the kwargs. Up to `cache_size` results, 128 by
+        default, are kept in memory. A result expires `cache_ttl` seconds after being cached if
+        it's set. With `cache_dir`, the results are also pickled there, and shared by processes.
+        The results of a method are cached by the repr of its object as well, so a method of an
+        object without a stable repr isn't cached. See `handler_cache_info()` and
+        `invalidate_handler_cache()`.
         """
         def decorator_handler(func):
-            # Add the attribute to the decorated func.
-            # In set_handler_provider(), all func with a valid
-            # argcat_argument_parser_name attribute will be found and
-            # recorded by the ArgCat instance for handling the parsed
-            # arguments.
+            # Add the attribute to the decorated func, and register its name.
+            # In add_handler_provider(), only the registered names are
+            # looked up, and all func with a valid argcat_argument_parser_name
+            # attribute will be recorded by the ArgCat instance for handling
+            # the parsed arguments.
             func.argcat_argument_parser_name = parser_name
+            _ArgCatHandlerRegistry.register(func)
+            if cache_size is not None or cache_ttl is not None or cache_dir is not None:
+                func.argcat_handler_cache = _ArgCatHandlerCache(
+                    f"{func.__module__}.{func.__qualname__}", cache_size, cache_ttl, cache_dir,
+                    getattr(func, '__code__', None))
             return func
         return decorator_handler
 
-    def __init__(self, chatter: bool=False):
+    @staticmethod
+    def register_type(name: str, converter: Callable[[str], Any]) -> None:
+        """Register a custom type converter for arguments.
+
+        Any argument whose `type` is the string `name` in the manifest of any ArgCat instance will
+        use `converter`, which takes the argument string and returns the converted value, as its
+        type. A registered converter overrides the type which `name` can be located to. It only
+        affects the parsers created after this call.
+
+        Returns None.
+        """
+        _ArgCatTypeRegistry.register(name, converter)
+
+    @staticmethod
+    def unregister_type(name: str) -> bool:
+        """Unregister the custom type converter registered with `name` by `register_type()`.
+
+        Returns True if there was such a converter, otherwise False.
+        """
+        return _ArgCatTypeRegistry.unregister(name)
+
+    def __init__(self, chatter: bool=False, lazy_subparsers: bool=False,
+                 stats: bool=False,
+                 stats_callback: Optional[Callable[[str, float, Optional[str]], None]]=None,
+                 trace_path: Optional[str]=None, profile_dir: Optional[str]=None,
+                 parse_cache_size: int=0, route_subcommands: bool=False,
+                 allow_subcommand_abbrev: bool=False):
         self._manifest_data: dict = None
         self.chatter: bool = chatter
         self._is_building: bool = False
-        _ArgCatPrinter.print("Your cute argument parsing helper. >v<")
-        self._reset()
+        # If True, only the subparser selected by parse_args() is built. See _create_parsers().
+        self._lazy_subparsers: bool = lazy_subparsers
+        # The instrumentation is on if stats is True or stats_callback is set. See stats().
+        self._stats: Optional[_ArgCatStats] = \
+            _ArgCatStats(stats_callback) if stats or stats_callback is not None else None
+        # The tracing is on if trace_path or the environment variable is set. See trace_span().
+        if trace_path is None:
+            trace_path = os.environ.get(self.TRACE_ENV_VAR, None) or None
+        self._tracer: Optional[_ArgCatTracer] = \
+            _ArgCatTracer(trace_path) if trace_path is not None else None
+        # If True, the phases are timed for the stats or the tracer. See _record_phase().
+        self._timed: bool = self._stats is not None or self._tracer is not None
+        # If set, every handler is run under cProfile. See _call_parser_handler_profiled().
+        # It's an environment variable rather than a CLI flag, so it never conflicts with the
+        # dests in the manifest.
+        self._profile_dir: Optional[str] = \
+            profile_dir or os.environ.get(self.PROFILE_ENV_VAR, None) or None
+        # Counted by itertools.count(), whose next() is atomic, since handlers may run in threads.
+        self._profile_counter: Optional[Iterator[int]] = None
+        if self._profile_dir is not None:
+            # pylint: disable=import-outside-toplevel
+            import itertools
+            self._profile_counter = itertools.count(1)
+        # If parse_cache_size is positive, the parsed results of args are memoized. See _parse().
+        self._parse_cache: Optional[_ArgCatParseCache] = \
+            _ArgCatParseCache(parse_cache_size) if parse_cache_size > 0 else None
+        # If True, the subcommand is found before argparse parses the args. See
+        # _ArgCatSubcommandRouter. Allowing abbreviations of the subcommands also turns it on.
+        self._route_subcommands: bool = route_subcommands or allow_subcommand_abbrev
+        self._allow_subcommand_abbrev: bool = allow_subcommand_abbrev
+        with _ArgCatFilterLevelScope(self._filter_level):
+            _ArgCatPrinter.print("Your cute argument parsing helper. >v<")
+            self._reset()
 
     @property
     def chatter(self) -> bool:
@@ -498,10 +2377,11 @@ class ArgCat:
 
         If chatter is True, ArgCat will display verbose prints. Otherwise,
         it will keep silence unless anything is wrong or something needs to tell.
+        It only affects this ArgCat, even if others run in other threads at the same time.
 
         Return a Boolean.
         """
-        return _ArgCatPrinter.filter_level is _ArgCatPrintLevel.VERBOSE
+        return self._filter_level is _ArgCatPrintLevel.VERBOSE
 
     @chatter.setter
     def chatter(self, value: bool) -> None:
@@ -511,9 +2391,9 @@ class ArgCat:
         it will keep silence unless anything is wrong or something needs to tell.
         """
         if value is True:
-            _ArgCatPrinter.filter_level = _ArgCatPrintLevel.VERBOSE
+            self._filter_level = _ArgCatPrintLevel.VERBOSE
         else:
-            _ArgCatPrinter.filter_level = _ArgCatPrintLevel.IF_NECESSARY
+            self._filter_level = _ArgCatPrintLevel.IF_NECESSARY
 
     def _reset(self) -> None:
         # A little bit of my naming convensions:
@@ -523,9 +2403,31 @@ class ArgCat:
         # information.
         self._arg_parsers: Dict = {}
         self._manifest_data: Optional[Dict] = {}
-
-    # pylint: disable=too-many-locals, too-many-statements, too-many-branches
-    def _create_parsers(self) -> None:
+        # Names of the subparsers registered as stubs but not built yet in lazy mode.
+        self._lazy_parser_names: set = set()
+        # Handlers set for lazy subparsers, which are checked once the subparsers are built.
+        self._pending_parser_handlers: Dict[str, Tuple[Callable, str]] = {}
+        # Parsers, types and usage from the compiled manifest if created from a compiled spec.
+        self._compiled_parsers: Dict[str, Dict] = {}
+        self._compiled_types: Dict[str, List[str]] = {}
+        self._compiled_usage: Optional[Tuple[int, str]] = None
+        # The rendered usages and helps by the kinds by the parser names by the terminal widths.
+        # See _help_text_of().
+        self._help_texts: Dict[int, Dict[str, Dict[str, str]]] = {}
+        # Held while rendering the texts, which may be done by many threads parsing at once.
+        self._help_lock: Any = _thread.allocate_lock()
+        # The args asking for nothing but the help of a parser, such as `('sub', '-h')`, to the
+        # parser names.
+        self._help_args: Dict[Tuple[str, ...], str] = {}
+        self._subparsers_action: Optional[_SubParsersAction] = None
+        # Lexical types resolved to real types.
+        self._located_types: Dict[str, Any] = {}
+        self._router: Optional[_ArgCatSubcommandRouter] = None
+        # The parsed results are of the parsers built from the previous manifest.
+        self.invalidate_parse_cache()
+
+    # If `compiled` is given, such as from a compiled spec, the subparsers are created from it.
+    def _create_parsers(self, compiled: Optional[Dict] = None) -> None:
         _ArgCatPrinter.print("Creating parsers ...")
 
         if not self._manifest_data:
@@ -533,6 +2435,16 @@ class ArgCat:
                                  level=_ArgCatPrintLevel.ERROR)
             return
 
+        lazy_subparsers: bool = self._lazy_subparsers
+        if compiled is not None:
+            _ArgCatPrinter.print("Using the compiled manifest ...")
+            self._compiled_parsers = compiled[_CompiledConstants.PARSERS]
+            self._compiled_types = compiled[_CompiledConstants.TYPES]
+            self._compiled_usage = (compiled[_CompiledConstants.USAGE_WIDTH],
+                                    compiled[_CompiledConstants.USAGE])
+            # The compiled manifest knows all the dests, so the subparsers can all be lazy.
+            lazy_subparsers = True
+
         meta_dict: Dict = self._manifest_data[_ManifestConstants.META]
 
         # Main parser created on data from _manifest_data
@@ -540,15 +2452,23 @@ class ArgCat:
         # In easy mode, ManifestConstants.SUBPARSER does not exist.
         if _ManifestConstants.SUBPARSER in main_parser_meta_dict:
             del main_parser_meta_dict[_ManifestConstants.SUBPARSER]
-        main_parser: ArgumentParser = argparse.ArgumentParser(**main_parser_meta_dict)
+        main_parser: ArgumentParser = _ArgCatArgumentParser(**main_parser_meta_dict)
 
         parsers_dict: Dict = self._manifest_data[_ManifestConstants.PARSERS]
 
         # Make meta dict for creating subparsers by add_subparsers()
         # In easy mode, ManifestConstants.SUBPARSER value is None and to make sure add_subparsers()
         # work in this case, we use an empty dict as subparser_meta_dict.
-        subparser_meta_dict: Dict = meta_dict.get(_ManifestConstants.SUBPARSER, {})
+        # It's copied, since the manifest may be shared, such as by the specs of other ArgCats, and
+        # must never be changed by creating parsers.
+        subparser_meta_dict: Dict = dict(meta_dict.get(_ManifestConstants.SUBPARSER, None) or {})
         subparser_meta_dict[_ManifestConstants.DEST] = _ManifestConstants.SUBPARSER_NAME # reserved
+        # In lazy mode, subparsers are registered as stubs and only built when being routed to.
+        if lazy_subparsers:
+            subparser_meta_dict[_ManifestConstants.ACTION] = _ArgCatLazySubParsersAction
+        # With the router, the subcommands are resolved the same way when argparse parses the args.
+        elif self._route_subcommands:
+            subparser_meta_dict[_ManifestConstants.ACTION] = _ArgCatSubParsersAction
 
         argument_subparsers: Optional[_SubParsersAction] = None
 
@@ -574,80 +2494,15 @@ class ArgCat:
                 if argument_subparsers is None:
                     argument_subparsers: _SubParsersAction = \
                         main_parser.add_subparsers(**subparser_meta_dict)
+                if lazy_subparsers:
+                    argument_subparsers.add_lazy_parser(parser_name, self._materialize_subparser,
+                                                        **parser_meta_dict)
+                    self._lazy_parser_names.add(parser_name)
+                    continue
                 new_parser = argument_subparsers.add_parser(parser_name, **parser_meta_dict)
 
-            # Add argument groups
-            argument_groups_dict = parser_dict.get(_ManifestConstants.ARGUMENT_GROUPS, None)
-            parser_argument_groups_dict: Optional[Dict]
-            if argument_groups_dict is not None:
-                parser_argument_groups_dict = {}
-                for group_name, group_meta_dict in argument_groups_dict.items():
-                    is_mutually_exclusive = \
-                    group_meta_dict[_ManifestConstants.IS_MUTUALLY_EXCLUSIVE]
-                    if is_mutually_exclusive is True:
-                        parser_argument_groups_dict[group_name] = \
-                            new_parser.add_mutually_exclusive_group()
-                    else:
-                        group_description = group_meta_dict[_ManifestConstants.DESCRIPTION]
-                        parser_argument_groups_dict[group_name] = \
-                            new_parser.add_argument_group(group_name, group_description)
-            else:
-                parser_argument_groups_dict = None
-            # Add arguments into this new parser
-            parser_arguments_list = parser_dict.get(_ManifestConstants.ARGUMENTS, [])
-            added_arguments = []  # For collecting added arguments
-            # Collect addtional argument information which cannot be provided by created argument
-            # instance, which is just a Action object.
-            additional_arguments_info = {}
-            for argument_dict in parser_arguments_list:
-                name_or_flags: Optional[List] = argument_dict.get(_ManifestConstants.NAME_OR_FLAGS,
-                                                                  None)
-                argument_meta_dict = dict(argument_dict)
-                ignored_by_subparser = True # This is true by default
-                if _ManifestConstants.IGNORED_BY_SUBPARSER in argument_meta_dict:
-                    ignored_by_subparser = \
-                        argument_meta_dict[_ManifestConstants.IGNORED_BY_SUBPARSER]
-                    del argument_meta_dict[_ManifestConstants.IGNORED_BY_SUBPARSER]
-                # from lexcical type to real type
-                # https://stackoverflow.com/questions/11775460/lexical-cast-from-string-to-type
-                lexical_type = argument_meta_dict.get(_ManifestConstants.TYPE, None)
-                if lexical_type and isinstance(lexical_type, str):
-                    argument_meta_dict[_ManifestConstants.TYPE] = locate(lexical_type)
-                # Add arguments considering we now support group and mutually exclusive group.
-                object_to_add_argument: Union[ArgumentParser, _ArgumentGroup,
-                                              _MutuallyExclusiveGroup]
-                # By default, the argument should be added into a ArgumentParser.
-                object_to_add_argument = new_parser
-                # However, if there is a specific `group` set, we add it into an accordingly group.
-                if parser_argument_groups_dict is not None:
-                    argument_group_name = argument_meta_dict.get(_ManifestConstants.GROUP, None)
-                    if argument_group_name is not None:
-                        created_group = parser_argument_groups_dict.get(argument_group_name, None)
-                        del argument_meta_dict[_ManifestConstants.GROUP]
-                        if created_group is not None:
-                            object_to_add_argument = created_group
-
-                if name_or_flags:
-                    if _ManifestConstants.NAME_OR_FLAGS in argument_meta_dict:
-                        del argument_meta_dict[_ManifestConstants.NAME_OR_FLAGS]
-                    added_arg = object_to_add_argument.add_argument(*name_or_flags,
-                                                                    **argument_meta_dict)
-                else:
-                    added_arg = object_to_add_argument.add_argument(**argument_meta_dict)
-
-                added_arguments.append(added_arg) # Collect and later save them into _ArgCatParser()
-                new_additional_argument_info = {}
-                if object_to_add_argument is not new_parser:
-                    new_additional_argument_info[_ManifestConstants.GROUP] = argument_group_name
-                new_additional_argument_info[_ManifestConstants.IGNORED_BY_SUBPARSER] = \
-                    ignored_by_subparser
-                additional_arguments_info[added_arg.dest] = new_additional_argument_info
-            # Add a new ArgCatPartser with None handler_func
-            self._arg_parsers[parser_name] = _ArgCatParser(parser=new_parser, name=parser_name,
-                                                           arguments=added_arguments,
-                                                           additional_arguments_info=\
-                                                               additional_arguments_info,
-                                                           groups=parser_argument_groups_dict)
+            self._arg_parsers[parser_name] = self._build_parser(parser_name, parser_dict,
+                                                                new_parser)
 
         if _ManifestConstants.MAIN not in self._arg_parsers:
             self._arg_parsers[_ManifestConstants.MAIN] = _ArgCatParser(parser=main_parser,
@@ -657,14 +2512,346 @@ class ArgCat:
         # A very private way to set a default main handler in case user doesn's provide any handler.
         self._arg_parsers[_ManifestConstants.MAIN].handler_func = self._default_main_handler
 
+        self._subparsers_action = argument_subparsers
+        self._help_args = self._help_args_of(parsers_dict)
+
+        if self._route_subcommands and argument_subparsers is not None:
+            router = _ArgCatSubcommandRouter(
+                main_parser, argument_subparsers,
+                {parser_name: parser_dict.get('aliases', ())
+                 for parser_name, parser_dict in parsers_dict.items()
+                 if parser_dict and parser_name != _ManifestConstants.MAIN},
+                allow_abbrev=self._allow_subcommand_abbrev)
+            argument_subparsers.set_resolver(router.lookup)
+            if router.enabled:
+                self._router = router
+            else:
+                _ArgCatPrinter.print("The subcommands can't be routed, since the main parser " +
+                                     "has positionals, a required subcommand or " +
+                                     "`fromfile_prefix_chars`.", level=_ArgCatPrintLevel.WARNING)
+
+    # Find the args asking for nothing but the help of a parser from the manifest, which are `-h` or
+    # `--help` alone for the main parser and them after a subcommand for the subparsers, so the
+    # help can be served without argparse. Others, like abbreviations, are left to argparse.
+    def _help_args_of(self, parsers_dict: Dict) -> Dict[Tuple[str, ...], str]:
+        def help_strings_of(parser_meta_dict: Dict, parser_dict: Optional[Dict]) -> Tuple[str, ...]:
+            if not parser_meta_dict.get('add_help', True) or \
+                '-' not in parser_meta_dict.get('prefix_chars', '-') or \
+                '-' in (parser_meta_dict.get('fromfile_prefix_chars', None) or ''):
+                return ()
+            # The help option may be overridden by arguments, such as with `conflict_handler`.
+            flags: set = {flag for argument_dict in (parser_dict or {}).get(
+                _ManifestConstants.ARGUMENTS, ()) for flag in
+                argument_dict.get(_ManifestConstants.NAME_OR_FLAGS, None) or ()}
+            return tuple(flag for flag in ('-h', '--help') if flag not in flags)
+
+        meta_dict: Dict = self._manifest_data[_ManifestConstants.META]
+        main_dict: Optional[Dict] = parsers_dict.get(_ManifestConstants.MAIN, None)
+        help_args: Dict[Tuple[str, ...], str] = {
+            (flag,): _ManifestConstants.MAIN for flag in help_strings_of(meta_dict, main_dict)}
+        # A subcommand could be taken by a positional of the main parser.
+        if any(not (argument_dict.get(_ManifestConstants.NAME_OR_FLAGS, None) or
+                    [argument_dict.get(_ManifestConstants.DEST, '')])[0].startswith('-')
+               for argument_dict in (main_dict or {}).get(_ManifestConstants.ARGUMENTS, ())):
+            return help_args
+        for parser_name, parser_dict in parsers_dict.items():
+            if parser_name == _ManifestConstants.MAIN or not parser_dict:
+                continue
+            for flag in help_strings_of(parser_dict, parser_dict):
+                for key in (parser_name, *parser_dict.get('aliases', ())):
+                    if not key.startswith('-'):
+                        help_args[(key, flag)] = parser_name
+        return help_args
+
+    # Get the usage or the help of a parser rendered in the current terminal width, which is
+    # rendered by argparse only once for each width, or never if it's the usage of the main parser
+    # in the compiled manifest.
+    def _help_text_of(self, parser_name: str, kind: str = _CompiledConstants.HELP) -> str:
+        # pylint: disable=import-outside-toplevel
+        import shutil
+        width: int = shutil.get_terminal_size().columns
+        text: Optional[str] = self._help_texts.get(width, {}).get(parser_name, {}).get(kind, None)
+        if text is not None:
+            return text
+        with self._help_lock:
+            help_texts: Optional[Dict[str, Dict[str, str]]] = self._help_texts.get(width, None)
+            if help_texts is None:
+                help_texts = {}
+                if self._compiled_usage is not None and self._compiled_usage[0] == width:
+                    help_texts.setdefault(_ManifestConstants.MAIN, {}).setdefault(
+                        _CompiledConstants.USAGE, self._compiled_usage[1])
+                self._help_texts[width] = help_texts
+            texts: Dict[str, str] = help_texts.setdefault(parser_name, {})
+            text = texts.get(kind, None)
+            if text is None:
+                if parser_name in self._lazy_parser_names:
+                    self._subparsers_action.materialize(parser_name)
+                parser: ArgumentParser = self._arg_parsers[parser_name].parser
+                text = parser.format_usage() if kind == _CompiledConstants.USAGE else \
+                    parser.format_help()
+                texts[kind] = text
+        return text
+
+    # Print the help of a parser and exit if the args ask for nothing but it, just as argparse does.
+    def _exit_with_help(self, args: Sequence[str]) -> None:
+        if len(args) > 2:
+            return
+        parser_name: Optional[str] = self._help_args.get(tuple(args), None)
+        if parser_name is None:
+            return
+        _ArgCatPrinter.print("Serving the help of `%s` ...", parser_name)
+        sys.stdout.write(self._help_text_of(parser_name))
+        sys.exit(0)
+
+    # `arg_parsers` are the parsers to compile, which are all the ones built by default.
+    def _compile_parsers(self, arg_parsers: Optional[Dict[str, _ArgCatParser]] = None) -> Dict:
+        if arg_parsers is None:
+            arg_parsers = self._arg_parsers
+        compiled_parsers: Dict = {}
+        for parser_name, parser in arg_parsers.items():
+            compiled_parsers[parser_name] = {
+                _CompiledConstants.DESTS: list(parser.dests),
+                _CompiledConstants.ADDITIONAL_ARGUMENTS_INFO: parser.additional_arguments_info or {}
+            }
+        # Only types which can be imported back by their paths are compiled.
+        compiled_types: Dict = {}
+        for lexical_type, located_type in self._located_types.items():
+            type_path = [getattr(located_type, '__module__', None),
+                         getattr(located_type, '__qualname__', None)]
+            if None not in type_path and \
+                _ArgCatTypeRegistry.import_type(*type_path) is located_type:
+                compiled_types[lexical_type] = type_path
+        main_parser: ArgumentParser = self._arg_parsers[_ManifestConstants.MAIN].parser
+        # pylint: disable=import-outside-toplevel
+        import shutil
+        return {
+            _CompiledConstants.VERSION: _CompiledConstants.FORMAT_VERSION,
+            _CompiledConstants.PARSERS: compiled_parsers,
+            _CompiledConstants.TYPES: compiled_types,
+            _CompiledConstants.USAGE: main_parser.format_usage(),
+            # argparse wraps the usage by the terminal width, so the usage is valid in this width.
+            _CompiledConstants.USAGE_WIDTH: shutil.get_terminal_size().columns
+        }
+
+    @_printing
+    def compile_spec(self) -> Dict:
+        """Compile the built parsers and the handlers into a spec, which can be pickled and sent to
+        worker processes or saved, and turned back into a ready ArgCat by `ArgCat.from_spec()`.
+
+        The spec has the manifest, the dests and the type paths of all parsers, and the handlers
+        referenced by their import paths, such as module level functions and static or class
+        methods. Handlers which cannot be imported back by their paths, such as lambdas and
+        methods bound to instances, are left out with a warning and should be set again after
+        `from_spec()`.
+
+        Returns a dict of plain data.
+        """
+        _ArgCatPrinter.print("Compiling the spec ...")
+        # The lazy subparsers not built yet are built aside just for being compiled.
+        arg_parsers: Dict[str, _ArgCatParser] = dict(self._arg_parsers)
+        parsers_dict: Dict = self._manifest_data[_ManifestConstants.PARSERS]
+        for parser_name in self._lazy_parser_names:
+            arg_parsers[parser_name] = self._build_parser(parser_name, parsers_dict[parser_name],
+                                                          _ArgCatArgumentParser())
+        handlers: Dict[str, Tuple[Callable, Optional[str]]] = dict(self._pending_parser_handlers)
+        for parser_name, parser in self._arg_parsers.items():
+            # pylint: disable=comparison-with-callable
+            if parser.handler_func is not None and \
+                parser.handler_func != self._default_main_handler:
+                handler_func = parser.handler_func
+                handlers[parser_name] = (handler_func, getattr(handler_func, '__name__', None))
+        handler_paths: Dict[str, List[str]] = {}
+        for parser_name, (handler, handler_name) in handlers.items():
+            handler_path = [getattr(handler, '__module__', None),
+                            getattr(handler, '__qualname__', None)]
+            if None in handler_path or \
+                _ArgCatTypeRegistry.import_type(*handler_path) != handler:
+                _ArgCatPrinter.print(f"Handler `{handler_name}` of `{parser_name}` cannot be " +
+                                     "imported by its path and is left out of the spec.",
+                                     level=_ArgCatPrintLevel.WARNING)
+                continue
+            handler_paths[parser_name] = handler_path + [handler_name]
+        return {
+            _CompiledConstants.VERSION: _CompiledConstants.FORMAT_VERSION,
+            _CompiledConstants.MANIFEST: self._manifest_data,
+            _CompiledConstants.COMPILED: self._compile_parsers(arg_parsers),
+            _CompiledConstants.HANDLERS: handler_paths
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Mapping, **kwargs: Any) -> ArgCat:
+        """Create a ready ArgCat from a spec made by `compile_spec()`, with its handlers set.
+
+        It's much faster than building the manifest again, since the subparsers are only built when
+        being parsed, and the handlers are checked and the types are imported with the compiled
+        dests and paths. `kwargs` are passed to `ArgCat()`, but `lazy_subparsers` is always on.
+
+        Returns an ArgCat. Raises ValueError if the spec is of another version.
+        """
+        if spec.get(_CompiledConstants.VERSION, None) != _CompiledConstants.FORMAT_VERSION:
+            raise ValueError(f"Unknown version of the spec: {spec.get(_CompiledConstants.VERSION)}")
+        argcat = cls(**kwargs)
+        with _ArgCatFilterLevelScope(argcat._filter_level):
+            argcat._manifest_data = spec[_CompiledConstants.MANIFEST]
+            argcat._create_parsers(spec[_CompiledConstants.COMPILED])
+            for parser_name, (module_name, qualname, handler_name) in \
+                spec[_CompiledConstants.HANDLERS].items():
+                handler = _ArgCatTypeRegistry.import_type(module_name, qualname)
+                if handler is None:
+                    _ArgCatPrinter.print(f"Handler `{module_name}.{qualname}` of " +
+                                         f"`{parser_name}` cannot be imported.",
+                                         level=_ArgCatPrintLevel.WARNING)
+                    continue
+                argcat.set_parser_handler(parser_name, handler, handler_name)
+        return argcat
+
+    def _completion_of(self, command: Optional[str]) -> _ArgCatCompletion:
+        if not self._manifest_data:
+            raise ValueError("Completion scripts can only be generated after the manifest is " +
+                             "loaded or built.")
+        return _ArgCatCompletion(self._manifest_data,
+                                 command or os.path.basename(sys.argv[0]) or 'prog')
+
+    def generate_completion(self, shell: str, command: Optional[str] = None) -> str:
+        """Generate a static completion script of `shell`, which is one of "bash", "zsh" and "fish",
+        for the program named `command`, which is the name of the running script by default.
+
+        The script is generated from the manifest only, so no parser is created, and it completes
+        without running the program.
+
+        Returns the script. Raises ValueError if the shell is unknown.
+        """
+        return self._completion_of(command).generate(shell)
+
+    @_printing
+    def write_completions(self, directory: str, command: Optional[str] = None,
+                          shells: Sequence[str] = _ArgCatCompletion.SHELLS) -> Dict[str, List[str]]:
+        """Write the static completion scripts of `shells` into `directory`, named by the
+        conventions of their completion dirs: "`command`" for bash, "_`command`" for zsh and
+        "`command`.fish" for fish.
+
+        The regeneration is incremental: only the parts of the subcommands changed since the last
+        time are regenerated, and the scripts not changed are not rewritten.
+
+        Returns a dict of the names of the parsers regenerated by the shells. Raises ValueError if a
+        shell is unknown.
+        """
+        return self._completion_of(command).write(directory, shells)
+
+    def _locate_type(self, lexical_type: str) -> Any:
+        if lexical_type in self._located_types:
+            return self._located_types[lexical_type]
+        start: float = time.perf_counter() if self._tracer is not None else 0.0
+        # Importing by the compiled path is much faster than pydoc.locate(), which tries to import
+        # every prefix of the lexical type as a module.
+        located_type = _ArgCatTypeRegistry.resolve(lexical_type,
+                                                   self._compiled_types.get(lexical_type, None))
+        if self._tracer is not None:
+            self._tracer.add_span(f"resolve_type {lexical_type}", start, time.perf_counter())
+        # Record the types used by this instance for compiling them. See _compile_parsers().
+        self._located_types[lexical_type] = located_type
+        return located_type
+
+    # pylint: disable=too-many-locals, too-many-branches
+    def _build_parser(self, parser_name: str, parser_dict: Dict,
+                      new_parser: ArgumentParser) -> _ArgCatParser:
+        start: float = time.perf_counter() if self._tracer is not None else 0.0
+        # Add argument groups
+        argument_groups_dict = parser_dict.get(_ManifestConstants.ARGUMENT_GROUPS, None)
+        parser_argument_groups_dict: Optional[Dict]
+        if argument_groups_dict is not None:
+            parser_argument_groups_dict = {}
+            for group_name, group_meta_dict in argument_groups_dict.items():
+                is_mutually_exclusive = \
+                group_meta_dict[_ManifestConstants.IS_MUTUALLY_EXCLUSIVE]
+                if is_mutually_exclusive is True:
+                    parser_argument_groups_dict[group_name] = \
+                        new_parser.add_mutually_exclusive_group()
+                else:
+                    group_description = group_meta_dict[_ManifestConstants.DESCRIPTION]
+                    parser_argument_groups_dict[group_name] = \
+                        new_parser.add_argument_group(group_name, group_description)
+        else:
+            parser_argument_groups_dict = None
+        # Add arguments into this new parser
+        parser_arguments_list = parser_dict.get(_ManifestConstants.ARGUMENTS, [])
+        added_arguments = []  # For collecting added arguments
+        # Collect addtional argument information which cannot be provided by created argument
+        # instance, which is just a Action object.
+        additional_arguments_info = {}
+        for argument_dict in parser_arguments_list:
+            name_or_flags: Optional[List] = argument_dict.get(_ManifestConstants.NAME_OR_FLAGS,
+                                                              None)
+            argument_meta_dict = dict(argument_dict)
+            ignored_by_subparser = True # This is true by default
+            if _ManifestConstants.IGNORED_BY_SUBPARSER in argument_meta_dict:
+                ignored_by_subparser = \
+                    argument_meta_dict[_ManifestConstants.IGNORED_BY_SUBPARSER]
+                del argument_meta_dict[_ManifestConstants.IGNORED_BY_SUBPARSER]
+            # from lexcical type to real type
+            # https://stackoverflow.com/questions/11775460/lexical-cast-from-string-to-type
+            lexical_type = argument_meta_dict.get(_ManifestConstants.TYPE, None)
+            if lexical_type and isinstance(lexical_type, str):
+                argument_meta_dict[_ManifestConstants.TYPE] = self._locate_type(lexical_type)
+            # Add arguments considering we now support group and mutually exclusive group.
+            object_to_add_argument: Union[ArgumentParser, _ArgumentGroup,
+                                          _MutuallyExclusiveGroup]
+            # By default, the argument should be added into a ArgumentParser.
+            object_to_add_argument = new_parser
+            # However, if there is a specific `group` set, we add it into an accordingly group.
+            if parser_argument_groups_dict is not None:
+                argument_group_name = argument_meta_dict.get(_ManifestConstants.GROUP, None)
+                if argument_group_name is not None:
+                    created_group = parser_argument_groups_dict.get(argument_group_name, None)
+                    del argument_meta_dict[_ManifestConstants.GROUP]
+                    if created_group is not None:
+                        object_to_add_argument = created_group
+
+            if name_or_flags:
+                if _ManifestConstants.NAME_OR_FLAGS in argument_meta_dict:
+                    del argument_meta_dict[_ManifestConstants.NAME_OR_FLAGS]
+                added_arg = object_to_add_argument.add_argument(*name_or_flags,
+                                                                **argument_meta_dict)
+            else:
+                added_arg = object_to_add_argument.add_argument(**argument_meta_dict)
+
+            added_arguments.append(added_arg) # Collect and later save them into _ArgCatParser()
+            new_additional_argument_info = {}
+            if object_to_add_argument is not new_parser:
+                new_additional_argument_info[_ManifestConstants.GROUP] = argument_group_name
+            new_additional_argument_info[_ManifestConstants.IGNORED_BY_SUBPARSER] = \
+                ignored_by_subparser
+            additional_arguments_info[added_arg.dest] = new_additional_argument_info
+        if self._tracer is not None:
+            self._tracer.add_span(f"build_parser {parser_name}", start, time.perf_counter())
+        # Add a new ArgCatPartser with None handler_func
+        return _ArgCatParser(parser=new_parser, name=parser_name, arguments=added_arguments,
+                             additional_arguments_info=additional_arguments_info,
+                             groups=parser_argument_groups_dict)
+
+    # Called by _ArgCatLazySubParsersAction once the main parser routes to a subparser stub.
+    def _materialize_subparser(self, parser_name: str, new_parser: ArgumentParser) -> None:
+        _ArgCatPrinter.print("Materializing the lazy parser `%s` ...", parser_name)
+        start: float = time.perf_counter() if self._timed else 0.0
+        parser_dict: Dict = self._manifest_data[_ManifestConstants.PARSERS][parser_name]
+        self._arg_parsers[parser_name] = self._build_parser(parser_name, parser_dict, new_parser)
+        if self._timed:
+            self._record_phase(_ArgCatStats.MATERIALIZE, start, parser_name)
+        self._lazy_parser_names.discard(parser_name)
+        # Handlers set before the materialization are checked against the parser only now.
+        pending_handler = self._pending_parser_handlers.pop(parser_name, None)
+        if pending_handler is not None:
+            handler, handler_name = pending_handler
+            self.set_parser_handler(parser_name=parser_name, handler=handler,
+                                    handler_name=handler_name)
+
     # The return value for this is mainly for unittest.
     def _default_main_handler(self, **kwargs: str) -> Dict:
         _ArgCatPrinter.print("The default `main` handler prints simple usage only. " +
                             "Please set your `main` handler if necessary.",
                             level=_ArgCatPrintLevel.VERBOSE)
-        main_parser = self._arg_parsers.get(_ManifestConstants.MAIN, None)
-        if main_parser:
-            main_parser.parser.print_usage()
+        if _ManifestConstants.MAIN in self._arg_parsers:
+            sys.stdout.write(self._help_text_of(_ManifestConstants.MAIN, _CompiledConstants.USAGE))
         else:
             _ArgCatPrinter.print("The default `main` handler is triggered but the main parser is " \
                                  + "invalid!",
@@ -672,31 +2859,203 @@ class ArgCat:
         return kwargs
 
     def _call_parser_handler(self, parser: _ArgCatParser, parameters: Dict) -> Any:
-        if parser.handler_func:
+        dispatch_plan = parser.dispatch_plan
+        if dispatch_plan is not None:
+            start: float = time.perf_counter() if self._timed else 0.0
+            # Let the handler add spans nested in the one of its own. See trace_span().
+            token: Optional[contextvars.Token] = \
+                _CURRENT_TRACER.set(self._tracer) if self._tracer is not None else None
             try:
-                _ArgCatPrinter.print(f"Handler `{parser.handler_func}` is handling " + \
-                    f"`{parser.name}` with args: `{parameters}` ...")
-                result = parser.handler_func(**parameters)
+                _ArgCatPrinter.print("Handler `%s` is handling `%s` with args: `%s` ...",
+                                     dispatch_plan.handler, parser.name, parameters)
+                if self._profile_dir is None:
+                    result = dispatch_plan.call(parameters)
+                else:
+                    result = self._call_parser_handler_profiled(parser, parameters)
             # Catch all exception to print the actual exception raised in the handler besides
             # TypeError. If we are only capturing TypeError, the actual error would be "covered" by
             # the TypeError, which means all error would be raised as TypeError.
             # This could be very confusing.
             # pylint: disable=broad-exception-caught
             except Exception:
-                func_sig = inspect.signature(parser.handler_func)
-                input_sig = str(tuple(parameters)).replace('\'','')
-                error_msg = f"Handling function sig: `{func_sig}` " + \
-                    f"and received parameters: `{input_sig}`."
-                _ArgCatPrinter.print(error_msg, level=_ArgCatPrintLevel.ERROR, indent=1)
-                # v0.4.2-feat: Add Traceback for error details.
-                traceback.print_exc()
+                if self._timed:
+                    self._record_phase(_ArgCatStats.DISPATCH, start, parser.name, failed=True)
+                self._print_handler_error(parser, parameters)
             else:
+                if self._timed:
+                    self._record_phase(_ArgCatStats.DISPATCH, start, parser.name)
                 return result
+            finally:
+                if token is not None:
+                    _CURRENT_TRACER.reset(token)
         else:
             _ArgCatPrinter.print(f"Parser `{parser.name}` does not have any handler.",
                                  level=_ArgCatPrintLevel.ERROR, indent=1)
         return None
 
+    # Run the handler under cProfile and dump the stats as `<parser>.<pid>.<count>.pstats` in
+    # the profile dir, which can be read by `pstats` or tools like snakeviz.
+    def _call_parser_handler_profiled(self, parser: _ArgCatParser, parameters: Dict) -> Any:
+        # pylint: disable=import-outside-toplevel
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(parser.dispatch_plan.call, parameters)
+        finally:
+            profile_path: str = os.path.join(
+                self._profile_dir,
+                f"{parser.name}.{os.getpid()}.{next(self._profile_counter)}.pstats")
+            try:
+                os.makedirs(self._profile_dir, exist_ok=True)
+                profiler.dump_stats(profile_path)
+                _ArgCatPrinter.print("Dumped the profile of the handler of `%s` to `%s`.",
+                                     parser.name, profile_path)
+            except OSError as exc:
+                _ArgCatPrinter.print(f"Failed to dump the profile `{profile_path}`: {exc!r}",
+                                     level=_ArgCatPrintLevel.WARNING)
+
+    async def _call_parser_handler_async(self, parser: _ArgCatParser, parameters: Dict) -> Any:
+        result = self._call_parser_handler(parser, parameters)
+        # Coroutine handlers fail when being awaited rather than being called.
+        # pylint: disable=import-outside-toplevel
+        import inspect
+        if inspect.isawaitable(result):
+            # The body of a coroutine handler only runs when it's awaited, so the spans it adds
+            # need the tracer set here too. See trace_span().
+            token: Optional[contextvars.Token] = \
+                _CURRENT_TRACER.set(self._tracer) if self._tracer is not None else None
+            try:
+                result = await result
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                self._print_handler_error(parser, parameters)
+                return None
+            finally:
+                if token is not None:
+                    _CURRENT_TRACER.reset(token)
+        return result
+
+    # Without `traceback_str`, it must be called in an except block, since it prints the traceback
+    # of the handled exception.
+    @staticmethod
+    def _print_handler_error(parser: _ArgCatParser, parameters: Dict,
+                             traceback_str: Optional[str] = None) -> None:
+        func_sig = parser.dispatch_plan.signature_str
+        input_sig = str(tuple(parameters)).replace('\'','')
+        error_msg = f"Handling function sig: `{func_sig}` " + \
+            f"and received parameters: `{input_sig}`."
+        _ArgCatPrinter.print(error_msg, level=_ArgCatPrintLevel.ERROR, indent=1)
+        # v0.4.2-feat: Add Traceback for error details.
+        if traceback_str is None:
+            # pylint: disable=import-outside-toplevel
+            import traceback
+            traceback.print_exc()
+        else:
+            sys.stderr.write(traceback_str)
+
+    def stats(self) -> Optional[Dict]:
+        """Get the statistics recorded by the instrumentation.
+
+        The instrumentation is off by default, and is turned on by `stats=True` or a
+        `stats_callback` when creating ArgCat. It records the wall time of every phase: build,
+        create_parsers, materialize (lazy subparsers only), tokenize, split and dispatch, and counts
+        every dispatch for each parser with a latency histogram. `stats_callback` is called with
+        the phase name, the seconds and the parser name (only for dispatch, otherwise None) every
+        time a phase is recorded. The handlers called in an executor by `parse_many()` are not
+        recorded.
+
+        Returns a dict like `{'phases': {...}, 'dispatches': {...}}`, or None if the
+        instrumentation is off.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
+
+    def parse_cache_info(self) -> Optional[Dict]:
+        """Get the counters of the parse cache, which is on if `parse_cache_size` is positive when
+        creating ArgCat.
+
+        Returns a dict of `hits`, `misses`, `invalidations`, `size` and `maxsize`, or None if the
+        parse cache is off.
+        """
+        if self._parse_cache is None:
+            return None
+        return self._parse_cache.info()
+
+    @_printing
+    def invalidate_parse_cache(self) -> None:
+        """Drop all the parsed results in the parse cache.
+
+        It's done automatically when the parsers are built again or a handler is set. Call it if
+        anything else which affects parsing is changed, such as the state used by a custom action
+        or type converter.
+
+        Returns None.
+        """
+        if self._parse_cache is not None:
+            self._parse_cache.invalidate()
+
+    # Returns the cache of the handler of the parser, which may be not built yet in lazy mode.
+    def _handler_cache_of(self, parser_name: str) -> Optional[_ArgCatHandlerCache]:
+        parser: Optional[_ArgCatParser] = self._arg_parsers.get(parser_name, None)
+        if parser is not None:
+            handler: Optional[Callable] = parser.handler_func
+        else:
+            handler = self._pending_parser_handlers.get(parser_name, (None, None))[0]
+        return getattr(handler, 'argcat_handler_cache', None)
+
+    def handler_cache_info(self, parser_name: str) -> Optional[Dict]:
+        """Get the counters of the result cache of the handler of a parser, which is set by the
+        caching options of `@ArgCat.handler`.
+
+        Returns a dict of `hits`, `disk_hits`, `misses`, `size`, `maxsize`, `ttl` and `cache_dir`,
+        or None if the handler is not cached.
+        """
+        handler_cache = self._handler_cache_of(parser_name)
+        if handler_cache is None:
+            return None
+        return handler_cache.info()
+
+    @_printing
+    def invalidate_handler_cache(self, parser_name: Optional[str] = None) -> None:
+        """Drop the cached results of the handler of a parser, including the ones on disk. If
+        `parser_name` is None, the caches of all handlers are dropped.
+
+        Returns None.
+        """
+        parser_names = [parser_name] if parser_name is not None else \
+            [*self._arg_parsers, *self._pending_parser_handlers]
+        for name in parser_names:
+            handler_cache = self._handler_cache_of(name)
+            if handler_cache is not None:
+                handler_cache.invalidate()
+
+    def reset_stats(self) -> None:
+        """Clear the statistics recorded by the instrumentation. See `stats()`.
+
+        Returns None.
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    @staticmethod
+    def trace_span(name: str, **kwargs: Any) -> _ArgCatTraceSpan:
+        """Make a span of the trace for a handler.
+
+        The tracing is off by default, and is turned on by `trace_path` when creating ArgCat or the
+        environment variable `ARGCAT_TRACE`, which is the path of the trace file. A trace has the
+        spans of building, creating every parser, resolving types, parsing and every handler in the
+        Chrome Trace Event format, which can be viewed in chrome://tracing or Perfetto.
+
+        In a handler, `with ArgCat.trace_span('load', file=file):` adds a span named `name` with
+        `kwargs` as its arguments, nested in the span of the handler. Spans can be nested in each
+        other too. If the tracing is off, or it's not called in a handler, it does nothing.
+
+        Returns a context manager.
+        """
+        return _ArgCatTraceSpan(_CURRENT_TRACER.get(), name, kwargs)
+
+    @_printing
     def build(self) -> _ArgCatBuilder:
         """Build arguments by an ArgCatBuilder.
 
@@ -710,17 +3069,24 @@ class ArgCat:
         self._reset()
         self._is_building = True
         _ArgCatPrinter.print("Building ...")
+        start: float = time.perf_counter() if self._timed else 0.0
         # Create the parsers once the build is done.
         def on_build_done(manifest_data):
             self._manifest_data = manifest_data
-            self._create_parsers()
+            if not self._timed:
+                self._create_parsers()
+            else:
+                build_done: float = self._record_phase(_ArgCatStats.BUILD, start)
+                self._create_parsers()
+                self._record_phase(_ArgCatStats.CREATE_PARSERS, build_done)
             self._is_building = False
             _ArgCatPrinter.print("Building DONE. Use print_xx functions for more information.")
 
-        return _ArgCatBuilder(on_build_done)
+        return _ArgCatBuilder(on_build_done, self._filter_level)
 
     # v0.4.2-feat: subparser_ignore_main is added to deal with the case in which user would like to
     # not trigger the main parser's handler if any subparser handler is called.
+    @_printing
     def parse_args(self, args: Optional[List[str]]=None, namespace: Optional[Namespace]=None,
                    subparser_ignore_main: bool = False) -> Dict:
         """Start to parse args.
@@ -735,10 +3101,304 @@ class ArgCat:
         """
         _ArgCatPrinter.print("Parsing args ...")
         # Call the main parser's parse_args() to parse the arguments input.
-        subparser_name, subparser_parsed_arguments_dict, main_parser_parsed_arguments_dict = \
-        self._arg_parsers[_ManifestConstants.MAIN].parse_args(args=args, namespace=namespace)
+        parsed: Tuple[str, Dict, Dict] = self._parse(args=args, namespace=namespace)
+        return self._dispatch(parsed, subparser_ignore_main)
+
+    # Parse args with the main parser, and time tokenizing and splitting if the phases are timed.
+    # The parsed result is memoized if the parse cache is on, unless a namespace is given.
+    def _parse(self, args: Optional[Sequence[str]], namespace: Optional[Namespace] = None
+               ) -> Tuple[str, Dict, Dict]:
+        if self._parse_cache is None or namespace is not None:
+            return self._parse_uncached(args, namespace)
+        key: Tuple[str, ...] = tuple(sys.argv[1:] if args is None else args)
+        parsed: Optional[Tuple[str, Dict, Dict]] = self._parse_cache.get(key)
+        if parsed is not None:
+            _ArgCatPrinter.print("Parsed args result from the cache: `%s`.", parsed)
+            return parsed
+        # Errors and exits of actions like `-h/--help` are never cached, so they act every time.
+        parsed = self._parse_uncached(key, None)
+        self._parse_cache.put(key, parsed)
+        return parsed
+
+    def _parse_uncached(self, args: Optional[Sequence[str]], namespace: Optional[Namespace]
+                        ) -> Tuple[str, Dict, Dict]:
+        self._exit_with_help(sys.argv[1:] if args is None else args)
+        main_parser: _ArgCatParser = self._arg_parsers[_ManifestConstants.MAIN]
+        if not self._timed:
+            if self._router is None:
+                return main_parser.parse_args(args=args, namespace=namespace)
+            parsed_args: Namespace = self._route(args, namespace)
+            _ArgCatPrinter.print("Parsed args result: `%s`.", parsed_args)
+            return main_parser.split_namespace(parsed_args)
+        start: float = time.perf_counter()
+        try:
+            parsed_args = self._route(args, namespace) if self._router is not None else \
+                main_parser.parser.parse_args(args=args, namespace=namespace)
+        # Both the parsing errors and the exits of actions like `-h/--help`.
+        except BaseException:
+            self._record_phase(_ArgCatStats.TOKENIZE, start, failed=True)
+            raise
+        tokenized: float = self._record_phase(_ArgCatStats.TOKENIZE, start)
+        _ArgCatPrinter.print("Parsed args result: `%s`.", parsed_args)
+        parsed: Tuple[str, Dict, Dict] = main_parser.split_namespace(parsed_args)
+        self._record_phase(_ArgCatStats.SPLIT, tokenized)
+        return parsed
+
+    # Parse args by the router, or by argparse as usual if the router gives up.
+    def _route(self, args: Optional[Sequence[str]], namespace: Optional[Namespace]) -> Namespace:
+        if namespace is None:
+            parsed_args: Optional[Namespace] = \
+                self._router.route(sys.argv[1:] if args is None else args)
+            if parsed_args is not None:
+                return parsed_args
+        return self._arg_parsers[_ManifestConstants.MAIN].parser.parse_args(args=args,
+                                                                           namespace=namespace)
+
+    # Record a phase from `start` to now for the stats and the tracer, and returns now.
+    # `parser_name` is the parser dispatched for the dispatch phase, or the parser materialized.
+    def _record_phase(self, phase: str, start: float, parser_name: Optional[str] = None,
+                      failed: bool = False) -> float:
+        end: float = time.perf_counter()
+        if self._stats is not None:
+            self._stats.record(phase, end - start,
+                               parser_name if phase == _ArgCatStats.DISPATCH else None, failed)
+        if self._tracer is not None:
+            name: str = phase if parser_name is None else f"{phase} {parser_name}"
+            self._tracer.add_span(name, start, end, {'failed': True} if failed else None)
+        return end
 
-        ret_result = {}
+    # pylint: disable=too-many-arguments
+    @_printing
+    def parse_many(self, args_list: Iterable[Sequence[str]], subparser_ignore_main: bool = False,
+                   executor: Optional[Any] = None, ordered: bool = True,
+                   max_in_flight: Optional[int] = None) -> List[_ArgCatParseResult]:
+        """Parse many args one by one with the built parsers.
+
+        This is the same as calling `parse_args()` on each args in `args_list`, but it never exits.
+        Any error of argparse, which would make `parse_args()` print the usage and exit, is
+        recorded in the result of the args instead, and the next args goes on. So, it's suitable
+        for replaying a lot of command lines in one process.
+
+        If `executor`, a `concurrent.futures.Executor` such as a ThreadPoolExecutor or a
+        ProcessPoolExecutor, is given, the args are still parsed here one by one, but the handlers
+        are called in the executor. At most `max_in_flight` args are submitted and not collected
+        at any time, which is 4 times the CPU count by default. If `ordered` is False, the results
+        are in the order they are completed rather than the order of `args_list`.
+
+        For a ProcessPoolExecutor, the handlers and the parameters are pickled to the workers. So,
+        handlers should be picklable, such as module level functions, and the ones which are not,
+        including the default `main` handler, are called here instead.
+
+        Returns a list of _ArgCatParseResult, one for each args.
+        """
+        return list(self.iter_parse_many(args_list, subparser_ignore_main=subparser_ignore_main,
+                                         executor=executor, ordered=ordered,
+                                         max_in_flight=max_in_flight))
+
+    # pylint: disable=too-many-arguments
+    def iter_parse_many(self, args_list: Iterable[Sequence[str]],
+                        subparser_ignore_main: bool = False, executor: Optional[Any] = None,
+                        ordered: bool = True,
+                        max_in_flight: Optional[int] = None) -> Iterable[_ArgCatParseResult]:
+        """Parse many args and yield the results once they are ready.
+
+        This is the generator version of `parse_many()`, with the same parameters. `args_list` is
+        consumed as the results are taken, so it can be a lazy iterable of any length.
+
+        Returns an iterator of _ArgCatParseResult.
+        """
+        if executor is None:
+            return _ArgCatFilterLevelScope.iterate(
+                self._filter_level, self._iter_parse(args_list, subparser_ignore_main))
+        if max_in_flight is None:
+            max_in_flight = 4 * (os.cpu_count() or 1)
+        return _ArgCatFilterLevelScope.iterate(
+            self._filter_level,
+            self._iter_parse_in_executor(args_list, subparser_ignore_main, executor, ordered,
+                                         max(1, max_in_flight)))
+
+    def _iter_parse(self, args_list: Iterable[Sequence[str]],
+                    subparser_ignore_main: bool) -> Iterable[_ArgCatParseResult]:
+        for args in args_list:
+            args = list(args)
+            parsed, error_result = self._try_parse(args)
+            if error_result is not None:
+                yield error_result
+                continue
+            yield _ArgCatParseResult(args, result=self._dispatch(parsed, subparser_ignore_main))
+
+    # pylint: disable=too-many-arguments, too-many-locals
+    def _iter_parse_in_executor(self, args_list: Iterable[Sequence[str]],
+                                subparser_ignore_main: bool, executor: Any, ordered: bool,
+                                max_in_flight: int) -> Iterable[_ArgCatParseResult]:
+        # pylint: disable=import-outside-toplevel
+        import collections
+        import concurrent.futures
+        import pickle
+        is_process_pool = isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+        # Whether a handler can be sent to the workers, by the id of the handler.
+        picklable_handlers: Dict[int, bool] = {}
+
+        def is_remote(handler: Optional[Callable]) -> bool:
+            # pylint: disable=comparison-with-callable
+            if handler is None or handler == self._default_main_handler:
+                return False
+            if not is_process_pool:
+                return True
+            if id(handler) not in picklable_handlers:
+                try:
+                    pickle.dumps(handler)
+                    picklable_handlers[id(handler)] = True
+                # pylint: disable=broad-exception-caught
+                except Exception:
+                    _ArgCatPrinter.print("Handler `%s` is not picklable and will be called " +
+                                         "locally.", handler)
+                    picklable_handlers[id(handler)] = False
+            return picklable_handlers[id(handler)]
+
+        def submit(args: List[str], parsed: Tuple[str, Dict, Dict]) -> Tuple:
+            handlers_to_call = self._handlers_to_call(parsed, subparser_ignore_main)
+            local_results: Dict = {}
+            remote_calls: List[Tuple[_ArgCatParser, Dict]] = []
+            for parser, parameters in handlers_to_call:
+                if is_remote(parser.handler_func):
+                    remote_calls.append((parser, parameters))
+                else:
+                    local_results[parser.name] = self._call_parser_handler(parser, parameters)
+            future = None
+            if remote_calls:
+                future = executor.submit(_call_handlers_in_worker,
+                                         [(parser.name, parser.handler_func, parameters)
+                                          for parser, parameters in remote_calls])
+            return args, handlers_to_call, local_results, remote_calls, future
+
+        def collect(pending: Tuple) -> _ArgCatParseResult:
+            args, handlers_to_call, local_results, remote_calls, future = pending
+            remote_results: Dict = {}
+            if future is not None:
+                try:
+                    remote_results = future.result()
+                # The args or the results cannot be pickled, or the workers are broken.
+                # pylint: disable=broad-exception-caught
+                except Exception:
+                    for parser, parameters in remote_calls:
+                        self._print_handler_error(parser, parameters)
+            for parser, parameters in remote_calls:
+                succeeded, value = remote_results.get(parser.name, (False, None))
+                if succeeded:
+                    local_results[parser.name] = value
+                    continue
+                if value is not None:
+                    self._print_handler_error(parser, parameters, value)
+                local_results[parser.name] = None
+            # Keep the same order of the handlers as parse_args().
+            return _ArgCatParseResult(args, result={parser.name: local_results[parser.name]
+                                                    for parser, _ in handlers_to_call})
+
+        def is_ready(pending: Union[_ArgCatParseResult, Tuple]) -> bool:
+            return isinstance(pending, _ArgCatParseResult) or pending[-1] is None or \
+                pending[-1].done()
+
+        def finish(pending: Union[_ArgCatParseResult, Tuple]) -> _ArgCatParseResult:
+            return pending if isinstance(pending, _ArgCatParseResult) else collect(pending)
+
+        # Results with parse errors or pending ones returned by submit(), in the order of args.
+        pendings: Any = collections.deque()
+        # Pending ones by their futures, for the unordered results.
+        futures: Dict[Any, Tuple] = {}
+        for args in args_list:
+            args = list(args)
+            parsed, error_result = self._try_parse(args)
+            pending = error_result if error_result is not None else submit(args, parsed)
+            if ordered:
+                pendings.append(pending)
+                # Yield the ready ones at the head, and wait for the head if too many are pending.
+                while pendings and (len(pendings) >= max_in_flight or is_ready(pendings[0])):
+                    yield finish(pendings.popleft())
+            elif is_ready(pending):
+                yield finish(pending)
+            else:
+                futures[pending[-1]] = pending
+                if len(futures) >= max_in_flight:
+                    done, _ = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield collect(futures.pop(future))
+        while pendings:
+            yield finish(pendings.popleft())
+        for future in concurrent.futures.as_completed(list(futures)):
+            yield collect(futures.pop(future))
+
+    def parse_stream(self, stream: Optional[Iterable[str]] = None,
+                     subparser_ignore_main: bool = False,
+                     flush_interval: float = 1.0) -> Iterable[_ArgCatParseResult]:
+        """Parse the command lines from `stream`, which is `sys.stdin` by default, line by line.
+
+        Each line is split into args by `shlex` as a shell does, then parsed and handled as soon as
+        it's read, the same as `iter_parse_many()`. Blank lines and `#` comments are skipped. The
+        stream is never read ahead, so the memory stays bounded for any length of input as long as
+        the results are not kept. A line which cannot be split, such as one with an unclosed quote,
+        has a result with the error and the exit status 2, and the next line goes on.
+
+        `sys.stdout` is flushed once `flush_interval` seconds have passed since the last flush, and
+        when the stream ends, so the output of the handlers is not held back in the buffer of a
+        pipe. With `flush_interval` 0, it's flushed after every line.
+
+        Returns an iterator of _ArgCatParseResult, one for each command line with its
+        `line_number`.
+        """
+        if stream is None:
+            stream = sys.stdin
+        return _ArgCatFilterLevelScope.iterate(
+            self._filter_level,
+            self._iter_parse_stream(stream, subparser_ignore_main, flush_interval))
+
+    def _iter_parse_stream(self, stream: Iterable[str], subparser_ignore_main: bool,
+                           flush_interval: float) -> Iterable[_ArgCatParseResult]:
+        # pylint: disable=import-outside-toplevel
+        import shlex
+        last_flush: float = time.monotonic()
+        try:
+            for line_number, line in enumerate(stream, 1):
+                try:
+                    args: List[str] = shlex.split(line, comments=True)
+                except ValueError as exc:
+                    result = _ArgCatParseResult([], error=str(exc), exit_status=2)
+                else:
+                    if not args:
+                        continue
+                    parsed, result = self._try_parse(args)
+                    if result is None:
+                        result = _ArgCatParseResult(
+                            args, result=self._dispatch(parsed, subparser_ignore_main))
+                result.line_number = line_number
+                if time.monotonic() - last_flush >= flush_interval:
+                    sys.stdout.flush()
+                    last_flush = time.monotonic()
+                yield result
+        finally:
+            sys.stdout.flush()
+
+    # Returns the parsed tuple and None, or None and the result with the error stopping the parsing.
+    def _try_parse(self, args: List[str]) -> Tuple[Optional[Tuple[str, Dict, Dict]],
+                                                   Optional[_ArgCatParseResult]]:
+        token = _RAISE_PARSE_ERROR.set(True)
+        try:
+            return self._parse(args), None
+        except _ArgCatParseError as exc:
+            return None, _ArgCatParseResult(args, error=exc.message, exit_status=2,
+                                            error_parser=exc.parser)
+        # Actions like `-h/--help` exit after printing by themselves.
+        except SystemExit as exc:
+            return None, _ArgCatParseResult(args, exit_status=_exit_status_of(exc))
+        finally:
+            _RAISE_PARSE_ERROR.reset(token)
+
+    def _handlers_to_call(self, parsed: Tuple[str, Dict, Dict],
+                          subparser_ignore_main: bool) -> List[Tuple[_ArgCatParser, Dict]]:
+        subparser_name, subparser_parsed_arguments_dict, main_parser_parsed_arguments_dict = parsed
+
+        handlers_to_call = []
 
         # The main parser's handler should be called for two cases:
         # 1. no subparser called or
@@ -747,34 +3407,267 @@ class ArgCat:
         # main_parser_parsed_arguments_dict can be considered as not None.
         if not subparser_name or \
             (not subparser_ignore_main and any(main_parser_parsed_arguments_dict.values())):
-            ret_result['main'] = \
-                self._call_parser_handler(parser=self._arg_parsers[_ManifestConstants.MAIN],
-                                          parameters=main_parser_parsed_arguments_dict)
+            handlers_to_call.append((self._arg_parsers[_ManifestConstants.MAIN],
+                                     main_parser_parsed_arguments_dict))
 
         # Only need to check subparser_name because subparser_parsed_arguments_dict can be None when
         # a subparser is called without any arguments.
         if subparser_name:
-            subparser = self._arg_parsers[subparser_name]
-            ret_result[subparser_name] = \
-                self._call_parser_handler(parser=subparser,
-                                          parameters=subparser_parsed_arguments_dict)
+            handlers_to_call.append((self._arg_parsers[subparser_name],
+                                     subparser_parsed_arguments_dict))
 
+        return handlers_to_call
+
+    def _dispatch(self, parsed: Tuple[str, Dict, Dict], subparser_ignore_main: bool) -> Dict:
+        ret_result = {}
+        for parser, parameters in self._handlers_to_call(parsed, subparser_ignore_main):
+            ret_result[parser.name] = self._call_parser_handler(parser=parser,
+                                                                parameters=parameters)
         return ret_result
 
+    async def _dispatch_async(self, parsed: Tuple[str, Dict, Dict], subparser_ignore_main: bool,
+                              concurrent_handlers: bool) -> Dict:
+        handlers_to_call = self._handlers_to_call(parsed, subparser_ignore_main)
+        if concurrent_handlers:
+            # pylint: disable=import-outside-toplevel
+            import asyncio
+            results = await asyncio.gather(*[self._call_parser_handler_async(parser, parameters)
+                                             for parser, parameters in handlers_to_call])
+        else:
+            results = [await self._call_parser_handler_async(parser, parameters)
+                       for parser, parameters in handlers_to_call]
+        return {parser.name: result for (parser, _), result in zip(handlers_to_call, results)}
+
+    @_printing_async
+    async def parse_args_async(self, args: Optional[List[str]]=None,
+                               namespace: Optional[Namespace]=None,
+                               subparser_ignore_main: bool = False,
+                               concurrent_handlers: bool = False) -> Dict:
+        """Start to parse args and await the handlers.
+
+        This is the same as `parse_args()`, but any handler returning an awaitable, such as an
+        `async def` handler, is awaited. Regular handlers are called as usual.
+
+        If both the `main` handler and the subparser's handler are triggered, they are awaited one
+        after another by default, the same order as `parse_args()`. With `concurrent_handlers` set
+        to True, they run concurrently instead.
+
+        Returns result from handler, the same as `parse_args()`.
+        """
+        _ArgCatPrinter.print("Parsing args ...")
+        parsed: Tuple[str, Dict, Dict] = self._parse(args=args, namespace=namespace)
+        return await self._dispatch_async(parsed, subparser_ignore_main, concurrent_handlers)
+
+    @_printing_async
+    async def parse_many_async(self, args_list: Iterable[Sequence[str]],
+                               subparser_ignore_main: bool = False,
+                               concurrent_handlers: bool = False,
+                               max_concurrency: int = 1) -> List[_ArgCatParseResult]:
+        """Parse many args on the running event loop and await their handlers.
+
+        This is the async version of `parse_many()`. All args are parsed in order, and up to
+        `max_concurrency` of them are handled concurrently. `concurrent_handlers` is the same as the
+        one of `parse_args_async()`.
+
+        Returns a list of _ArgCatParseResult, one for each args in order.
+        """
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def handle(args: List[str], parsed: Tuple[str, Dict, Dict]) -> _ArgCatParseResult:
+            try:
+                result = await self._dispatch_async(parsed, subparser_ignore_main,
+                                                    concurrent_handlers)
+            finally:
+                semaphore.release()
+            return _ArgCatParseResult(args, result=result)
+
+        # Either the result with a parse error or the task handling the parsed args.
+        pendings: List[Union[_ArgCatParseResult, Any]] = []
+        for args in args_list:
+            args = list(args)
+            # Parsing is synchronous, so it's done in order here, and waits for a free slot first
+            # to bound the parsed args waiting for being handled.
+            await semaphore.acquire()
+            parsed, error_result = self._try_parse(args)
+            if error_result is not None:
+                semaphore.release()
+                pendings.append(error_result)
+                continue
+            pendings.append(asyncio.create_task(handle(args, parsed)))
+        return [pending if isinstance(pending, _ArgCatParseResult) else await pending
+                for pending in pendings]
+
+    @_printing
+    def serve(self, socket_path: str, idle_timeout: float = 600.0,
+              subparser_ignore_main: bool = False) -> None:
+        """Serve `parse_args()` as a warm daemon on a Unix domain socket.
+
+        Each request from `ArgCat.call_daemon()` has the args, the current working directory and
+        the environment variables of the client. The daemon runs `parse_args()` with them as if it
+        was the client process, and sends the stdout, the stderr and the exit status back. So, the
+        client doesn't pay for the interpreter startup, the imports and the building again.
+
+        The requests are handled one by one, since the working directory, the environment variables
+        and the standard streams are process-wide. The daemon shuts down and removes the socket
+        file once there is no request for `idle_timeout` seconds. Only the user running the daemon
+        can connect to the socket.
+
+        Returns None when the daemon shuts down.
+        """
+        # pylint: disable=import-outside-toplevel
+        import socket
+        if os.path.exists(socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(socket_path)
+                except OSError:
+                    # A stale socket file left by a daemon which is not running anymore.
+                    try:
+                        os.remove(socket_path)
+                    except OSError as exc:
+                        # Such as a file of another user in a shared dir like /tmp.
+                        _ArgCatPrinter.print(f"Failed to remove `{socket_path}`: {exc!r}",
+                                             level=_ArgCatPrintLevel.ERROR)
+                        return
+                else:
+                    _ArgCatPrinter.print(f"A daemon is already serving on `{socket_path}`.",
+                                         level=_ArgCatPrintLevel.ERROR)
+                    return
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        server.settimeout(idle_timeout)
+        _ArgCatPrinter.print("Serving on `%s` ...", socket_path)
+        try:
+            while True:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    _ArgCatPrinter.print("No request for %s seconds. Shutting down ...",
+                                         idle_timeout)
+                    break
+                with connection:
+                    connection.settimeout(idle_timeout)
+                    try:
+                        self._serve_request(connection, subparser_ignore_main)
+                    except OSError as exc:
+                        _ArgCatPrinter.print(f"Failed to serve a request: {exc!r}",
+                                             level=_ArgCatPrintLevel.WARNING)
+        finally:
+            server.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    def _serve_request(self, connection: Any, subparser_ignore_main: bool) -> None:
+        # pylint: disable=import-outside-toplevel
+        import contextlib
+        import json
+        import traceback
+        stdout, stderr = io.StringIO(), io.StringIO()
+        try:
+            request: Dict = json.loads(_recv_all(connection))
+            args: List[str] = [str(arg) for arg in request['args']]
+            cwd: Optional[str] = request.get('cwd', None)
+            env: Optional[Dict[str, str]] = request.get('env', None)
+        except (ValueError, KeyError, TypeError) as exc:
+            response = {'stdout': '', 'stderr': f"Invalid request: {exc!r}\n", 'exit_status': 2}
+            connection.sendall(json.dumps(response).encode('utf-8'))
+            return
+        old_cwd: str = os.getcwd()
+        old_env: Dict[str, str] = dict(os.environ)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    if cwd is not None:
+                        os.chdir(cwd)
+                    if env is not None:
+                        os.environ.clear()
+                        os.environ.update(env)
+                    self.parse_args(args, subparser_ignore_main=subparser_ignore_main)
+                    exit_status = 0
+                except SystemExit as exc:
+                    exit_status = _exit_status_of(exc)
+                # The daemon must survive whatever happens in a request.
+                # pylint: disable=broad-exception-caught
+                except Exception:
+                    traceback.print_exc()
+                    exit_status = 1
+        finally:
+            os.chdir(old_cwd)
+            os.environ.clear()
+            os.environ.update(old_env)
+        response = {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue(),
+                    'exit_status': exit_status}
+        connection.sendall(json.dumps(response).encode('utf-8'))
+
+    @staticmethod
+    def call_daemon(socket_path: str, args: Optional[Sequence[str]] = None,
+                    stdout: Optional[Any] = None, stderr: Optional[Any] = None) -> int:
+        """Call the daemon started by `ArgCat.serve()` to parse args.
+
+        This is the thin client of the daemon, which needs nothing from ArgCat but this method.
+        `args` is `sys.argv[1:]` by default, and the current working directory and environment
+        variables are sent along with it. The stdout and the stderr from the daemon are written
+        into `stdout` and `stderr`, which are `sys.stdout` and `sys.stderr` by default.
+
+        Since the environment variables may have secrets, nothing is sent unless `socket_path` is a
+        socket owned by the current user, and so is the process listening on it if the platform
+        can tell. Otherwise, PermissionError is raised. Still, put the socket in a dir only the
+        user can access, such as `$XDG_RUNTIME_DIR`, rather than a shared one like /tmp.
+
+        Raises OSError, such as FileNotFoundError or ConnectionRefusedError, if the daemon is not
+        running, so the caller can fall back to parsing by itself.
+
+        Returns the exit status from the daemon.
+        """
+        # pylint: disable=import-outside-toplevel
+        import json
+        import socket
+        import stat
+        if args is None:
+            args = sys.argv[1:]
+        socket_stat = os.stat(socket_path)
+        if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != os.getuid():
+            raise PermissionError(f"`{socket_path}` is not a socket owned by the current user.")
+        request = {'args': list(args), 'cwd': os.getcwd(), 'env': dict(os.environ)}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            # The socket file may have been replaced since it was checked, but not the peer.
+            if hasattr(socket, 'SO_PEERCRED'):
+                import struct
+                _, peer_uid, _ = struct.unpack('3i', client.getsockopt(
+                    socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+                if peer_uid != os.getuid():
+                    raise PermissionError(f"The daemon on `{socket_path}` is not run by the " +
+                                          "current user.")
+            client.sendall(json.dumps(request).encode('utf-8'))
+            client.shutdown(socket.SHUT_WR)
+            response: Dict = json.loads(_recv_all(client))
+        (stdout or sys.stdout).write(response['stdout'])
+        (stderr or sys.stderr).write(response['stderr'])
+        return response['exit_status']
+
+    @_printing
     def add_handler_provider(self, handler_provider: Any) -> bool:
         """Set an object as the provider for ArgCat to find handlers.
 
         The provider can normally be a (meta) class (instance), namespace or
-        anything has @ArgCat.handler decorated method/function.
+        anything has @ArgCat.handler decorated method/function. Only the
+        names of the decorated functions are looked up on it, so a handler
+        should be an attribute of the provider by the name it's defined with.
 
         Returns a bool value which is whether all the handlers are set successfully.
         """
-        _ArgCatPrinter.print(f"Setting handlers from provider: `{handler_provider}` ...")
-        all_handler_func_dicts: List[Dict] = [{'name': name, 'func': obj}
-                                              for name, obj in inspect.getmembers(handler_provider)
-                                              if ((inspect.ismethod(obj) or \
-                                                  inspect.isfunction(obj)) and \
-                                                      hasattr(obj, "argcat_argument_parser_name"))]
+        _ArgCatPrinter.print("Setting handlers from provider: `%s` ...", handler_provider)
+        all_handler_func_dicts: List[Dict] = [
+            {'name': name, 'func': obj}
+            for name, obj in _ArgCatHandlerRegistry.handlers_of(handler_provider)]
         # The functions retrieved will be in alphabet order. So, if there are method/functions with
         # duplicate names, the first one in the sequence will be added and the other ones will be
         # discarded.
@@ -794,12 +3687,14 @@ class ArgCat:
                 all_done = False
         return all_done
 
+    @_printing
     def add_main_module_as_handler_provider(self) -> bool:
         """ A convenient method to add main module as a handler provider.
         Returns a bool value which is whether the handler provider is set successfully.
         """
         return self.add_handler_provider(sys.modules['__main__'])
 
+    @_printing
     def set_parser_handler(self, parser_name: str, handler: Callable,
                            handler_name: Optional[str] = None) -> bool:
         """ A flexible way to add handler for a specific parser.
@@ -808,49 +3703,38 @@ class ArgCat:
         if handler_name is None:
             handler_name = handler.__name__
         parser = self._arg_parsers.get(parser_name, None)
+        if parser is None and parser_name in self._lazy_parser_names:
+            if parser_name in self._pending_parser_handlers:
+                _ArgCatPrinter.print(f"Multiple handlers for one parser `{parser_name}`.",
+                level=_ArgCatPrintLevel.WARNING)
+                return False
+            # The parser's dests are known without building it only if it's from a compiled
+            # manifest. Otherwise, the handler can only be checked once the parser is built.
+            compiled_parser = self._compiled_parsers.get(parser_name, None)
+            if compiled_parser is not None and \
+                self._check_handler(parser_name, compiled_parser[_CompiledConstants.DESTS],
+                                    handler, handler_name) is None:
+                return False
+            self._pending_parser_handlers[parser_name] = (handler, handler_name)
+            self.invalidate_parse_cache()
+            _ArgCatPrinter.print("Added handler `%s` for the lazy parser `%s`, which will be set " +
+                                 "once the parser is built.", handler_name, parser_name,
+                                 level=_ArgCatPrintLevel.VERBOSE)
+            return True
         if parser:
             # If there is no handler or the handler is a default one provided by ArgCat.
             # pylint: disable=comparison-with-callable
             if not parser.handler_func or parser.handler_func == self._default_main_handler:
-                # Check the signature of the handler to make sure it can work.
-                func_sig = inspect.signature(handler)
-                handler_parameters = set(func_sig.parameters.keys())
-                # Find all arguments for `main` parser which are not ignored by subparser.
-                if parser_name == 'main':
-                    # If it's adding handler for 'main' parser, parser.dests is what we need.
-                    parser_required_parameters = parser.dests
-                else:
-                    # Otherwise, we should not only consider parser.dests but also considering all
-                    # arguments are not ignored by subparsers for `main` parser.
-                    main_additional_info_items = \
-                        self._arg_parsers['main'].additional_arguments_info.items()
-                    ignoreds = [k for k, v in main_additional_info_items \
-                        if v[_ManifestConstants.IGNORED_BY_SUBPARSER] is False]
-                    dests_in_main_parser_should_not_be_ignored = ignoreds
-                    # Add this parser's dests.
-                    dests_in_main_parser_should_not_be_ignored.extend(parser.dests)
-                    parser_required_parameters = dests_in_main_parser_should_not_be_ignored
-
-                # Compare two by putting them into sets and finding difference.
-                if set(handler_parameters) == set(parser_required_parameters):
-                    parser.handler_func = handler
-                    _ArgCatPrinter.print(f"Added handler `{handler_name}{func_sig}` for " + \
-                        f"the parser `{parser_name}`.", level=_ArgCatPrintLevel.VERBOSE)
+                func_sig = self._check_handler(parser_name, parser.dests, handler, handler_name)
+                if func_sig is not None:
+                    parser.set_handler(handler, func_sig)
+                    self.invalidate_parse_cache()
+                    _ArgCatPrinter.print("Added handler `%s%s` for the parser `%s`.", handler_name,
+                                         func_sig, parser_name, level=_ArgCatPrintLevel.VERBOSE)
                     return True
-                if parser_required_parameters:
-                    parser_require_parameters_str = functools.reduce(lambda a, b: f"{a}, {b}",
-                                                                        parser_required_parameters)
-                else:
-                    parser_require_parameters_str = ''
-                _ArgCatPrinter.print(f"Provided handler `{handler_name}{func_sig}` does not meet " +
-                                        f"the requirement of the parser `{parser_name}`, " +
-                                        "which requires a handler with parameters " +
-                                        f"`({parser_require_parameters_str})`.",
-                                        level=_ArgCatPrintLevel.WARNING)
                 return False
-            else:
-                _ArgCatPrinter.print(f"Multiple handlers for one parser `{parser_name}`.",
-                level=_ArgCatPrintLevel.WARNING)
+            _ArgCatPrinter.print(f"Multiple handlers for one parser `{parser_name}`.",
+            level=_ArgCatPrintLevel.WARNING)
         else:
             _ArgCatPrinter.print(f"Unknown parser `{parser_name}` to set " +
                                  f"with handler `{handler_name}`.",
@@ -858,6 +3742,40 @@ class ArgCat:
 
         return False
 
+    # Returns the handler's signature if it meets the parser's requirement, otherwise None.
+    def _check_handler(self, parser_name: str, parser_dests: List[str], handler: Callable,
+                       handler_name: str) -> Optional[inspect.Signature]:
+        # pylint: disable=import-outside-toplevel
+        import inspect
+        # Check the signature of the handler to make sure it can work.
+        func_sig = inspect.signature(handler)
+        handler_parameters = set(func_sig.parameters.keys())
+        # Find all arguments for `main` parser which are not ignored by subparser.
+        if parser_name == 'main':
+            # If it's adding handler for 'main' parser, parser.dests is what we need.
+            parser_required_parameters = list(parser_dests)
+        else:
+            # Otherwise, we should not only consider parser.dests but also considering all
+            # arguments are not ignored by subparsers for `main` parser.
+            parser_required_parameters = \
+                self._arg_parsers['main'].dests_for_subparser + list(parser_dests)
+
+        # Compare two by putting them into sets and finding difference.
+        if handler_parameters == set(parser_required_parameters):
+            return func_sig
+        if parser_required_parameters:
+            parser_require_parameters_str = functools.reduce(lambda a, b: f"{a}, {b}",
+                                                                parser_required_parameters)
+        else:
+            parser_require_parameters_str = ''
+        _ArgCatPrinter.print(f"Provided handler `{handler_name}{func_sig}` does not meet " +
+                                f"the requirement of the parser `{parser_name}`, " +
+                                "which requires a handler with parameters " +
+                                f"`({parser_require_parameters_str})`.",
+                                level=_ArgCatPrintLevel.WARNING)
+        return None
+
+    @_printing
     def print_parser_handlers(self) -> None:
         """Show information of all handlers."""
         if not self._arg_parsers:
@@ -865,13 +3783,20 @@ class ArgCat:
                                  level=_ArgCatPrintLevel.IF_NECESSARY)
             return
         _ArgCatPrinter.print("Handlers: ", level=_ArgCatPrintLevel.IF_NECESSARY)
+        # pylint: disable=import-outside-toplevel
+        import inspect
         for parser_name, parser in self._arg_parsers.items():
             func_sig: Optional[inspect.Signature] = None
             if parser.handler_func is not None:
                 func_sig = inspect.signature(parser.handler_func)
             _ArgCatPrinter.print(f"{parser_name} => {parser.handler_func} : {func_sig}", indent=1,
             level=_ArgCatPrintLevel.IF_NECESSARY)
+        for parser_name in sorted(self._lazy_parser_names):
+            handler, _ = self._pending_parser_handlers.get(parser_name, (None, None))
+            _ArgCatPrinter.print(f"{parser_name} => {handler} : (not built yet)", indent=1,
+            level=_ArgCatPrintLevel.IF_NECESSARY)
 
+    @_printing
     def print_parsers(self) -> None:
         """Show information of all parsers."""
         if not self._arg_parsers:
@@ -889,3 +3814,6 @@ class ArgCat:
                     name = dest
                 _ArgCatPrinter.print(f"{name} -> {dest}", indent=2,
                                      level=_ArgCatPrintLevel.IF_NECESSARY)
+        for parser_name in sorted(self._lazy_parser_names):
+            _ArgCatPrinter.print(f"{parser_name}: (not built yet)", indent=1,
+                                 level=_ArgCatPrintLevel.IF_NECESSARY)
@@ -0,0 +1,45 @@
+#!/usr/bin/python
+"""
+Benchmark of generating a manifest of tens of thousands of arguments with _ArgCatBuilder, whose
+methods return read-only views, against deep copying every result as the builder used to do.
+
+Run: python -m benchmarks.bench_builder
+"""
+from copy import deepcopy
+from typing import Callable, Mapping
+
+from argcat import _ArgCatBuilder
+from benchmarks.common import measure
+
+NUM_SUBPARSERS = 1000
+NUM_ARGUMENTS = 10
+
+def generate(wrap: Callable[[Mapping], object]) -> None:
+    """
+    Generate a manifest of NUM_SUBPARSERS * NUM_ARGUMENTS arguments, passing each result of the
+    builder to `wrap`.
+    """
+    with _ArgCatBuilder(on_build_done=lambda manifest_data: None) as builder:
+        wrap(builder.set_prog_info(prog='bench'))
+        for parser_index in range(NUM_SUBPARSERS):
+            parser_name = f'cmd{parser_index}'
+            wrap(builder.add_subparser(parser_name, help=f'Command {parser_index}.'))
+            parser_builder = builder.subparser(parser_name)
+            wrap(parser_builder.add_group('options', description='Options.'))
+            for argument_index in range(NUM_ARGUMENTS):
+                wrap(parser_builder.add_argument(f'--opt{argument_index}', type='int', default=0,
+                                                 choices=[0, 1, 2], group='options',
+                                                 help=f'Option {argument_index}.'))
+
+def main():
+    """
+    Main func
+    """
+    views = measure(lambda: generate(lambda result: result), repeat=3)
+    copies = measure(lambda: generate(lambda result: deepcopy(dict(result))), repeat=3)
+    print(f"Generating a manifest of {NUM_SUBPARSERS * NUM_ARGUMENTS} arguments:")
+    print(f"  deep copied results   : {copies * 1000:8.2f} ms")
+    print(f"  read-only views       : {views * 1000:8.2f} ms")
+
+if __name__ == '__main__':
+    main()
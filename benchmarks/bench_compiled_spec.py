@@ -0,0 +1,35 @@
+#!/usr/bin/python
+"""
+Benchmark of reconstructing a ready ArgCat in a worker process from a pickled compiled spec, against
+replaying the builder as the worker would have to do otherwise, eagerly or with lazy subparsers.
+
+Run: python -m benchmarks.bench_compiled_spec
+"""
+import pickle
+
+from argcat import ArgCat
+from benchmarks.common import build_synthetic_cli, measure
+
+NUM_SUBPARSERS = 200
+NUM_ARGUMENTS = 20
+
+def main():
+    """
+    Main func
+    """
+    argcat = ArgCat()
+    build_synthetic_cli(argcat, NUM_SUBPARSERS, NUM_ARGUMENTS)
+    spec_bytes = pickle.dumps(argcat.compile_spec())
+
+    replay = measure(lambda: build_synthetic_cli(ArgCat(), NUM_SUBPARSERS, NUM_ARGUMENTS))
+    replay_lazy = measure(lambda: build_synthetic_cli(ArgCat(lazy_subparsers=True),
+                                                      NUM_SUBPARSERS, NUM_ARGUMENTS))
+    from_spec = measure(lambda: ArgCat.from_spec(pickle.loads(spec_bytes)))
+    print(f"Reconstructing {NUM_SUBPARSERS} subparsers x {NUM_ARGUMENTS} arguments " +
+          f"(spec: {len(spec_bytes) / 1024:.1f} KiB):")
+    print(f"  replaying the builder : {replay * 1000:8.2f} ms")
+    print(f"  ... lazy_subparsers   : {replay_lazy * 1000:8.2f} ms")
+    print(f"  from the pickled spec : {from_spec * 1000:8.2f} ms")
+
+if __name__ == '__main__':
+    main()
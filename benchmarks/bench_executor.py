@@ -0,0 +1,45 @@
+#!/usr/bin/python
+"""
+Benchmark of parse_many() dispatching CPU-bound handlers sequentially and in a process pool.
+
+Run: python -m benchmarks.bench_executor
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from argcat import ArgCat
+from benchmarks.common import measure
+
+NUM_ARGS = 200
+
+def work_handler(n):
+    """
+    A CPU-bound handler, which is module level so that it can be sent to the workers.
+    """
+    return sum(index * index for index in range(n))
+
+def main():
+    """
+    Main func
+    """
+    argcat = ArgCat()
+    with argcat.build() as builder:
+        builder.add_subparser('work')
+        builder.subparser('work').add_argument('n', type='int')
+    argcat.set_parser_handler('work', work_handler)
+    args_list = [['work', '200000'] for _ in range(NUM_ARGS)]
+
+    sequential = measure(lambda: argcat.parse_many(args_list), repeat=3)
+    print(f"{NUM_ARGS} CPU-bound args on {os.cpu_count()} CPUs:")
+    print(f"  {'sequential':<27}: {sequential * 1000:9.2f} ms")
+    with ProcessPoolExecutor() as executor:
+        # Warm up the workers first.
+        argcat.parse_many(args_list[:os.cpu_count() or 1], executor=executor)
+        for ordered in [True, False]:
+            pooled = measure(lambda o=ordered: argcat.parse_many(args_list, executor=executor,
+                                                                 ordered=o), repeat=3)
+            label = 'process pool (ordered)' if ordered else 'process pool (as completed)'
+            print(f"  {label:<27}: {pooled * 1000:9.2f} ms ({sequential / pooled:.1f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/python
+"""
+Benchmark of registering thousands of handlers and dispatching the parsed arguments to them with
+the compiled dispatch plans, against calling them with keyword arguments.
+
+Run: python -m benchmarks.bench_handler_dispatch
+"""
+from argcat import ArgCat, _ArgCatDispatchPlan
+from benchmarks.common import make_handler, measure
+
+NUM_SUBPARSERS = 2000
+NUM_ARGUMENTS = 5
+NUM_MAIN_ARGUMENTS = 300
+
+def build() -> ArgCat:
+    """
+    Build a plugin-like CLI with a large global flags layer and many small subcommands.
+    """
+    argcat = ArgCat(lazy_subparsers=False)
+    with argcat.build() as builder:
+        for index in range(NUM_MAIN_ARGUMENTS):
+            builder.main_parser().add_exclusive_argument(f'--global{index}')
+        for parser_index in range(NUM_SUBPARSERS):
+            builder.add_subparser(f'cmd{parser_index}')
+            for index in range(NUM_ARGUMENTS):
+                builder.subparser(f'cmd{parser_index}').add_argument(f'--opt{index}')
+    return argcat
+
+def main():
+    """
+    Main func
+    """
+    # pylint: disable=protected-access
+    argcat = build()
+    handlers = [make_handler([f'opt{index}' for index in range(NUM_ARGUMENTS)])
+                for _ in range(NUM_SUBPARSERS)]
+
+    def register():
+        for parser_index, handler in enumerate(handlers):
+            argcat._arg_parsers[f'cmd{parser_index}'].handler_func = None
+            argcat.set_parser_handler(f'cmd{parser_index}', handler)
+
+    registration = measure(register, repeat=3)
+    print(f"Registering {NUM_SUBPARSERS} handlers with {NUM_MAIN_ARGUMENTS} main arguments: "
+          f"{registration * 1000:.2f} ms")
+
+    parser = argcat._arg_parsers['cmd0']
+    parameters = {f'opt{index}': index for index in range(NUM_ARGUMENTS)}
+    keyword_plan = _ArgCatDispatchPlan(parser.handler_func)
+    compiled = measure(lambda: parser.dispatch_plan.call(parameters), number=100000)
+    keyword = measure(lambda: keyword_plan.call(parameters), number=100000)
+    dispatch = measure(lambda: argcat._call_parser_handler(parser, parameters), number=100000)
+    print(f"Calling a handler of {NUM_ARGUMENTS} parameters:")
+    print(f"  keyword arguments     : {keyword * 1e9:8.1f} ns")
+    print(f"  compiled plan         : {compiled * 1e9:8.1f} ns")
+    print(f"  _call_parser_handler  : {dispatch * 1e9:8.1f} ns")
+
+if __name__ == '__main__':
+    main()
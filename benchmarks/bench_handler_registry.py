@@ -0,0 +1,92 @@
+#!/usr/bin/python
+"""
+Benchmark of binding handler providers with thousands of members by the names registered by
+@ArgCat.handler, against going through all their members with `inspect.getmembers()`.
+
+Run: python -m benchmarks.bench_handler_registry
+"""
+import inspect
+import types
+from typing import Any, List, Tuple
+
+from argcat import ArgCat, _ArgCatHandlerRegistry
+from benchmarks.common import measure, measure_with_setup
+
+NUM_MEMBERS = 5000
+NUM_HANDLERS = 20
+
+def make_handler(index: int):
+    """
+    Make a handler for the subparser `cmd<index>`.
+    """
+    def handler():
+        return index
+    handler.__name__ = handler.__qualname__ = f'cmd{index}_handler'
+    return ArgCat.handler(f'cmd{index}')(handler)
+
+def make_module_provider() -> types.ModuleType:
+    """
+    Make a module of `NUM_MEMBERS` globals and `NUM_HANDLERS` handlers, like a large `__main__`.
+    """
+    module = types.ModuleType('bench_main')
+    vars(module).update({f'value{index}': index for index in range(NUM_MEMBERS)})
+    for index in range(NUM_HANDLERS):
+        handler = make_handler(index)
+        setattr(module, handler.__name__, handler)
+    return module
+
+def make_instance_provider() -> Any:
+    """
+    Make an instance of a class of `NUM_MEMBERS` properties and methods, and `NUM_HANDLERS`
+    handlers. The properties are only as expensive as a function call.
+    """
+    members = {}
+    for index in range(NUM_MEMBERS // 2):
+        members[f'prop{index}'] = property(lambda self: sum(range(100)))
+        members[f'method{index}'] = lambda self: None
+    for index in range(NUM_HANDLERS):
+        handler = make_handler(index)
+        members[handler.__name__] = staticmethod(handler)
+    return type('BenchProvider', (), members)()
+
+def handlers_by_getmembers(handler_provider: Any) -> List[Tuple[str, Any]]:
+    """
+    Find the handlers by going through all the members, which is the way before the registry.
+    """
+    return [(name, obj) for name, obj in inspect.getmembers(handler_provider)
+            if (inspect.ismethod(obj) or inspect.isfunction(obj)) and \
+                hasattr(obj, 'argcat_argument_parser_name')]
+
+def build() -> ArgCat:
+    """
+    Build an ArgCat with a subparser for each handler.
+    """
+    argcat = ArgCat(lazy_subparsers=False)
+    with argcat.build() as builder:
+        for index in range(NUM_HANDLERS):
+            builder.add_subparser(f'cmd{index}')
+    return argcat
+
+def main():
+    """
+    Main func
+    """
+    for label, handler_provider in (('a module', make_module_provider()),
+                                    ('an instance', make_instance_provider())):
+        registered = _ArgCatHandlerRegistry.handlers_of(handler_provider)
+        assert [name for name, _ in registered] == \
+            [name for name, _ in handlers_by_getmembers(handler_provider)], \
+            "Both should find the same handlers!"
+        by_registry = measure(lambda provider=handler_provider:
+                              _ArgCatHandlerRegistry.handlers_of(provider), number=10)
+        by_getmembers = measure(lambda provider=handler_provider:
+                                handlers_by_getmembers(provider), number=10)
+        add_provider = measure_with_setup(build, lambda argcat, provider=handler_provider:
+                                          argcat.add_handler_provider(provider))
+        print(f"Finding {NUM_HANDLERS} handlers of {label} of {NUM_MEMBERS} members:")
+        print(f"  inspect.getmembers    : {by_getmembers * 1000:8.3f} ms")
+        print(f"  registry              : {by_registry * 1000:8.3f} ms")
+        print(f"  add_handler_provider  : {add_provider * 1000:8.3f} ms")
+
+if __name__ == '__main__':
+    main()
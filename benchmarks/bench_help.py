@@ -0,0 +1,50 @@
+#!/usr/bin/python
+"""
+Benchmark of answering `-h` and `<subcommand> -h` of a CLI with hundreds of subcommands by
+argparse against serving the help rendered before in the same process.
+
+Run: python -m benchmarks.bench_help
+"""
+import contextlib
+import io
+from argcat import ArgCat
+from benchmarks.common import build_synthetic_cli, measure
+
+NUM_SUBPARSERS = 400
+NUM_ARGUMENTS = 10
+
+def ask_help(argcat: ArgCat, args: list) -> None:
+    """
+    Parse the args asking for a help, which prints it and exits.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            argcat.parse_args(args)
+        except SystemExit:
+            pass
+
+def build() -> ArgCat:
+    """
+    Build the synthetic CLI.
+    """
+    argcat = ArgCat()
+    build_synthetic_cli(argcat, num_subparsers=NUM_SUBPARSERS, num_arguments=NUM_ARGUMENTS)
+    return argcat
+
+def main():
+    """
+    Main func
+    """
+    last_name = f'cmd{NUM_SUBPARSERS - 1}'
+    print(f"{'args':>14} {'argparse':>12} {'served':>12}  (us, in one process)")
+    for args in (['-h'], [last_name, '-h']):
+        argparse_argcat = build()
+        # pylint: disable=protected-access
+        argparse_argcat._help_args = {}
+        served_argcat = build()
+        times = [measure(lambda a=argcat: ask_help(a, args), repeat=5, number=20)
+                 for argcat in (argparse_argcat, served_argcat)]
+        print(f"{' '.join(args):>14} {times[0] * 1e6:>12.1f} {times[1] * 1e6:>12.1f}")
+
+if __name__ == '__main__':
+    main()
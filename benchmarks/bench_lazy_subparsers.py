@@ -0,0 +1,53 @@
+#!/usr/bin/python
+"""
+Benchmark of the startup cost of the eager and the lazy subparsers. Parser creation of the lazy
+subparsers only registers stubs, so building the selected subcommand does not depend on the number
+of the other subcommands.
+
+Run: python -m benchmarks.bench_lazy_subparsers
+"""
+from argcat import ArgCat
+from benchmarks.common import build_synthetic_cli, make_handler, measure
+
+NUM_ARGUMENTS = 10
+
+def create_parsers(argcat: ArgCat) -> None:
+    """
+    Recreate all parsers of a built ArgCat from its manifest.
+    """
+    # pylint: disable=protected-access
+    argcat._arg_parsers = {}
+    argcat._lazy_parser_names = set()
+    argcat._create_parsers()
+
+def startup(num_subparsers: int, lazy_subparsers: bool) -> None:
+    """
+    Build a CLI and dispatch a single subcommand, which is what one invocation does.
+    """
+    argcat = ArgCat(lazy_subparsers=lazy_subparsers)
+    build_synthetic_cli(argcat, num_subparsers=num_subparsers, num_arguments=NUM_ARGUMENTS)
+    argcat.set_parser_handler('cmd0', make_handler(
+        ['verbose'] + [f'opt{index}' for index in range(NUM_ARGUMENTS)]))
+    argcat.parse_args(['cmd0', '--opt1', '1'])
+
+def main():
+    """
+    Main func
+    """
+    print(f"{'subcommands':>12} {'create eager':>13} {'create lazy':>12} "
+          f"{'startup eager':>14} {'startup lazy':>13}  (ms)")
+    for num_subparsers in [10, 100, 400, 1000]:
+        argcats = {}
+        for lazy_subparsers in [False, True]:
+            argcats[lazy_subparsers] = ArgCat(lazy_subparsers=lazy_subparsers)
+            build_synthetic_cli(argcats[lazy_subparsers], num_subparsers=num_subparsers,
+                                num_arguments=NUM_ARGUMENTS)
+        create_eager = measure(lambda: create_parsers(argcats[False]), repeat=3)
+        create_lazy = measure(lambda: create_parsers(argcats[True]), repeat=3)
+        startup_eager = measure(lambda n=num_subparsers: startup(n, False), repeat=3)
+        startup_lazy = measure(lambda n=num_subparsers: startup(n, True), repeat=3)
+        print(f"{num_subparsers:>12} {create_eager * 1000:>13.2f} {create_lazy * 1000:>12.2f} "
+              f"{startup_eager * 1000:>14.2f} {startup_lazy * 1000:>13.2f}")
+
+if __name__ == '__main__':
+    main()
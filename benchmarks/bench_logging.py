@@ -0,0 +1,58 @@
+#!/usr/bin/python
+"""
+Benchmark of the logging cost on the dispatch path when ArgCat is not chatter.
+
+It compares a filtered out log message built by an f-string, which formats its arguments anyway,
+with the deferred one. Then it times the dispatch through `_call_parser_handler()` with the logs
+filtered out and enabled, against calling the handler by its compiled dispatch plan, which is the
+same calling convention without any logging.
+
+Run: python -m benchmarks.bench_logging
+"""
+import contextlib
+import io
+
+from argcat import ArgCat, _ArgCatFilterLevelScope, _ArgCatPrinter, _ArgCatPrintLevel
+from benchmarks.common import make_handler, measure
+
+NUM_ARGUMENTS = 200
+NUMBER = 20000
+
+def main():
+    """
+    Main func
+    """
+    # pylint: disable=protected-access
+    argcat = ArgCat(chatter=False)
+    with argcat.build() as builder:
+        builder.add_subparser('run')
+        for index in range(NUM_ARGUMENTS):
+            builder.subparser('run').add_argument(f'--opt{index}', default=index)
+    dests = [f'opt{index}' for index in range(NUM_ARGUMENTS)]
+    handler = make_handler(dests)
+    argcat.set_parser_handler('run', handler)
+    parser = argcat._arg_parsers['run']
+    parameters = {dest: index for index, dest in enumerate(dests)}
+
+    eager = measure(lambda: _ArgCatPrinter.print(f"args: `{parameters}` ..."), number=NUMBER)
+    deferred = measure(lambda: _ArgCatPrinter.print("args: `%s` ...", parameters), number=NUMBER)
+    print(f"Filtered out log with {NUM_ARGUMENTS} args:")
+    print(f"  f-string : {eager * 1e6:8.2f} us")
+    print(f"  deferred : {deferred * 1e6:8.2f} us")
+
+    def dispatch(filter_level: _ArgCatPrintLevel) -> float:
+        # The enabled logs are written, but not to the terminal.
+        with _ArgCatFilterLevelScope(filter_level), contextlib.redirect_stdout(io.StringIO()):
+            return measure(lambda: argcat._call_parser_handler(parser, parameters),
+                           number=NUMBER)
+
+    direct = measure(lambda: parser.dispatch_plan.call(parameters), number=NUMBER)
+    filtered_out = dispatch(_ArgCatPrintLevel.IF_NECESSARY)
+    enabled = dispatch(_ArgCatPrintLevel.VERBOSE)
+    print(f"Handler dispatch with {NUM_ARGUMENTS} args:")
+    print(f"  dispatch plan only                 : {direct * 1e6:8.2f} us")
+    print(f"  _call_parser_handler, logs off     : {filtered_out * 1e6:8.2f} us")
+    print(f"  _call_parser_handler, logs enabled : {enabled * 1e6:8.2f} us")
+
+if __name__ == '__main__':
+    main()
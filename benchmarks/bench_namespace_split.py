@@ -0,0 +1,76 @@
+#!/usr/bin/python
+"""
+Benchmark of splitting the parsed Namespace of a main parser with several hundred options into the
+arguments for the main parser and the subparser, against the previous list-based routine.
+
+Run: python -m benchmarks.bench_namespace_split
+"""
+from typing import Dict, Optional, Tuple
+from argparse import Namespace
+
+from argcat import ArgCat, _ArgCatParser, _ManifestConstants
+from benchmarks.common import measure
+
+NUM_MAIN_ARGUMENTS = 500
+NUM_SHARED_ARGUMENTS = 50
+NUM_ARGUMENTS = 5
+
+def build() -> ArgCat:
+    """
+    Build a CLI with a large global flags layer, some of which are shared with the subparsers.
+    """
+    argcat = ArgCat()
+    with argcat.build() as builder:
+        for index in range(NUM_MAIN_ARGUMENTS):
+            if index < NUM_SHARED_ARGUMENTS:
+                builder.main_parser().add_argument(f'--global{index}')
+            else:
+                builder.main_parser().add_exclusive_argument(f'--global{index}')
+        builder.add_subparser('cmd')
+        for index in range(NUM_ARGUMENTS):
+            builder.subparser('cmd').add_argument(f'--opt{index}')
+    return argcat
+
+def legacy_split(parser: _ArgCatParser, parsed_args: Namespace) -> Tuple[str, Dict, Dict]:
+    """
+    The routine _ArgCatParser.parse_args() used before the dest partitions were precomputed.
+    """
+    # pylint: disable=protected-access
+    parsed_arguments_dict: Dict = dict(vars(parsed_args))
+    subparser_name: str = parsed_arguments_dict.get(_ManifestConstants.SUBPARSER_NAME, None)
+    if _ManifestConstants.SUBPARSER_NAME in parsed_arguments_dict:
+        del parsed_arguments_dict[_ManifestConstants.SUBPARSER_NAME]
+    parsed_arguments_dict_for_cur_parser = {}
+    for key, value in parsed_arguments_dict.items():
+        if key in parser.dests:
+            parsed_arguments_dict_for_cur_parser[key] = value
+    result: Optional[Dict] = parsed_arguments_dict
+    if subparser_name:
+        for argument in parser._arguments:
+            dest: str = argument.dest
+            if parser.additional_arguments_info[dest].get(_ManifestConstants.IGNORED_BY_SUBPARSER,
+                                                          True):
+                del parsed_arguments_dict[dest]
+    else:
+        result = None
+    return subparser_name, result, parsed_arguments_dict_for_cur_parser
+
+def main():
+    """
+    Main func
+    """
+    # pylint: disable=protected-access
+    argcat = build()
+    parser = argcat._arg_parsers['main']
+    for argv in (['cmd', '--opt0', '1'], []):
+        parsed_args = parser.parser.parse_args(argv)
+        assert legacy_split(parser, parsed_args) == parser.split_namespace(parsed_args)
+        legacy = measure(lambda: legacy_split(parser, parsed_args), number=200)
+        split = measure(lambda: parser.split_namespace(parsed_args), number=200)
+        print(f"Splitting {len(vars(parsed_args))} parsed arguments of `{' '.join(argv)}` "
+              f"with {NUM_MAIN_ARGUMENTS} main arguments:")
+        print(f"  list-based routine    : {legacy * 1e6:8.1f} us")
+        print(f"  precomputed partitions: {split * 1e6:8.1f} us")
+
+if __name__ == '__main__':
+    main()
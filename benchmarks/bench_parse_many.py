@@ -0,0 +1,53 @@
+#!/usr/bin/python
+"""
+Benchmark of parse_many() against the naive loop of parse_args(), which has to catch SystemExit
+and swallow the usage and the error printed for each bad args.
+
+Run: python -m benchmarks.bench_parse_many
+"""
+import contextlib
+import io
+
+from argcat import ArgCat
+from benchmarks.common import build_synthetic_cli, make_handler, measure
+
+NUM_ARGUMENTS = 20
+NUM_ARGS = 2000
+# One in every BAD_RATIO args is invalid.
+BAD_RATIO = 4
+
+def naive_loop(argcat: ArgCat, args_list: list) -> list:
+    """
+    Call parse_args() for each args, which is what a job replayer does without parse_many().
+    """
+    results = []
+    for args in args_list:
+        try:
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                results.append(argcat.parse_args(args))
+        except SystemExit:
+            results.append(stderr.getvalue())
+    return results
+
+def main():
+    """
+    Main func
+    """
+    argcat = ArgCat()
+    build_synthetic_cli(argcat, num_subparsers=50, num_arguments=NUM_ARGUMENTS)
+    parameters = ['verbose'] + [f'opt{index}' for index in range(NUM_ARGUMENTS)]
+    for parser_index in range(50):
+        argcat.set_parser_handler(f'cmd{parser_index}', make_handler(parameters))
+    args_list = []
+    for index in range(NUM_ARGS):
+        value = 'bad' if index % BAD_RATIO == 0 else str(index)
+        args_list.append([f'cmd{index % 50}', '--opt1', value, '--opt7', '7'])
+
+    naive = measure(lambda: naive_loop(argcat, args_list), repeat=3)
+    batch = measure(lambda: argcat.parse_many(args_list), repeat=3)
+    print(f"{NUM_ARGS} args, 1/{BAD_RATIO} of them invalid:")
+    print(f"  parse_args() loop : {naive * 1000:8.2f} ms")
+    print(f"  parse_many()      : {batch * 1000:8.2f} ms ({naive / batch:.1f}x)")
+
+if __name__ == '__main__':
+    main()
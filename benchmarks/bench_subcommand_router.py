@@ -0,0 +1,37 @@
+#!/usr/bin/python
+"""
+Benchmark of parsing args with thousands of subcommands by argparse alone against routing the
+subcommand first with ArgCat's subcommand router, which lets the main parser and the selected
+subparser each parse their own slice of the args.
+
+Run: python -m benchmarks.bench_subcommand_router
+"""
+from argcat import ArgCat
+from benchmarks.common import build_synthetic_cli, measure
+
+NUM_ARGUMENTS = 10
+NUMBER = 200
+
+def main():
+    """
+    Main func
+    """
+    print(f"{'subcommands':>12} {'args':>30} {'argparse':>9} {'routed':>9} "
+          f"{'routed+abbrev':>14}  (us)")
+    for num_subparsers in [1000, 5000]:
+        argcats = []
+        for options in ({}, {'route_subcommands': True}, {'allow_subcommand_abbrev': True}):
+            argcat = ArgCat(**options)
+            build_synthetic_cli(argcat, num_subparsers=num_subparsers, num_arguments=NUM_ARGUMENTS)
+            argcats.append(argcat)
+        last_name = f'cmd{num_subparsers - 1}'
+        for args in ([last_name, '--opt1', '1', '--opt9', '9'],
+                     ['-v', last_name, '--opt1', '1', '--opt9', '9']):
+            # pylint: disable=protected-access
+            times = [measure(lambda a=argcat: a._parse(args), repeat=5, number=NUMBER)
+                     for argcat in argcats]
+            print(f"{num_subparsers:>12} {' '.join(args):>30} {times[0] * 1e6:>9.1f} "
+                  f"{times[1] * 1e6:>9.1f} {times[2] * 1e6:>14.1f}")
+
+if __name__ == '__main__':
+    main()
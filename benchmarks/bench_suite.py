@@ -0,0 +1,280 @@
+#!/usr/bin/python
+"""
+Benchmark suite timing every phase of ArgCat separately over synthetic manifests:
+- build: generating the manifest with the builder of `ArgCat.build()`;
+- create_parsers: `ArgCat._create_parsers()`, which creates the argparse parsers from the manifest;
+- parse: `_ArgCatParser.parse_args()` of the main parser, which parses and splits the arguments;
+- dispatch: calling the handlers with the parsed arguments;
+- parse_args: `ArgCat.parse_args()`, which is parse and dispatch together.
+
+Every synthetic manifest is also built with raw argparse to report the overhead of ArgCat, as well
+as `examples/hello_argparse.py` against the equivalent of `examples/hello_argcat.py`.
+
+The results are saved as JSON. Compare them with those of a previous run to catch regressions:
+
+Run: python -m benchmarks.bench_suite --output new.json --compare old.json
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import platform
+import sys
+import time
+from copy import deepcopy
+from typing import Dict, List, Optional, Tuple
+
+from argcat import ArgCat, _ArgCatBuilder
+from benchmarks.common import make_handler, measure, measure_with_setup
+from examples import hello_argcat, hello_argparse
+
+SUBPARSER_COUNTS = [10, 100, 1000]
+ARGUMENT_COUNTS = [1, 10, 100]
+MAX_TOTAL_ARGUMENTS = 10000
+FULL_SUBPARSER_COUNTS = [10, 100, 1000, 10000]
+FULL_ARGUMENT_COUNTS = [1, 10, 100, 1000]
+FULL_MAX_TOTAL_ARGUMENTS = 100000
+PARSE_NUMBER = 200
+HELLO_ARGV = ['config', '--name', 'cool_name']
+
+def generate_manifest(num_subparsers: int, num_arguments: int) -> Dict:
+    """
+    Generate a manifest of `num_subparsers` subparsers named `cmd<N>`. Each of them has
+    `num_arguments` optional arguments named `--opt<N>`, half of which are in a group, and a
+    mutually exclusive group of `--fast` and `--slow`.
+    """
+    manifests = []
+    with _ArgCatBuilder(on_build_done=manifests.append) as builder:
+        builder.set_prog_info(prog='bench')
+        builder.main_parser().add_argument('-v', '--verbose', action='store_true', default=False)
+        for parser_index in range(num_subparsers):
+            parser_name = f'cmd{parser_index}'
+            builder.add_subparser(parser_name, help=f'Command {parser_index}.')
+            parser_builder = builder.subparser(parser_name)
+            parser_builder.add_group('options', description='Options.')
+            parser_builder.add_group('mode', is_mutually_exclusive=True)
+            parser_builder.add_argument('--fast', action='store_true', group='mode')
+            parser_builder.add_argument('--slow', action='store_true', group='mode')
+            for argument_index in range(num_arguments):
+                group_kwargs = {'group': 'options'} if argument_index % 2 == 0 else {}
+                parser_builder.add_argument(f'--opt{argument_index}', type='int', default=0,
+                                            help=f'Option {argument_index}.', **group_kwargs)
+    return manifests[0]
+
+def create_argparse(num_subparsers: int, num_arguments: int) -> argparse.ArgumentParser:
+    """
+    Create the raw argparse equivalent of the parsers from `generate_manifest()`.
+    """
+    parser = argparse.ArgumentParser(prog='bench')
+    parser.add_argument('-v', '--verbose', action='store_true', default=False)
+    subparsers = parser.add_subparsers(dest='sub_command')
+    for parser_index in range(num_subparsers):
+        subparser = subparsers.add_parser(f'cmd{parser_index}', help=f'Command {parser_index}.')
+        group = subparser.add_argument_group('options', description='Options.')
+        mode = subparser.add_mutually_exclusive_group()
+        mode.add_argument('--fast', action='store_true')
+        mode.add_argument('--slow', action='store_true')
+        for argument_index in range(num_arguments):
+            target = group if argument_index % 2 == 0 else subparser
+            target.add_argument(f'--opt{argument_index}', type=int, default=0,
+                                help=f'Option {argument_index}.')
+    return parser
+
+def create_argcat(manifest: Dict, lazy_subparsers: bool) -> ArgCat:
+    """
+    Make an ArgCat with `manifest` whose parsers are not created yet.
+    """
+    # pylint: disable=protected-access
+    argcat = ArgCat(lazy_subparsers=lazy_subparsers)
+    argcat._manifest_data = deepcopy(manifest)
+    return argcat
+
+def bench_case(num_subparsers: int, num_arguments: int, lazy_subparsers: bool,
+               repeat: int) -> Dict:
+    """
+    Time every phase of ArgCat and raw argparse for one synthetic manifest.
+    """
+    # pylint: disable=protected-access
+    manifest = generate_manifest(num_subparsers, num_arguments)
+    argv = [f'cmd{num_subparsers - 1}', '--fast'] + \
+        [item for index in range(min(num_arguments, 10)) for item in (f'--opt{index}', '1')]
+    parameter_names = ['verbose', 'fast', 'slow'] + \
+        [f'opt{index}' for index in range(num_arguments)]
+
+    argcat = create_argcat(manifest, lazy_subparsers)
+    argcat._create_parsers()
+    argcat.set_parser_handler(f'cmd{num_subparsers - 1}', make_handler(parameter_names))
+    main_parser = argcat._arg_parsers['main']
+    parsed = main_parser.parse_args(args=argv)
+
+    raw_parser = create_argparse(num_subparsers, num_arguments)
+    raw_handlers = {f'cmd{num_subparsers - 1}': make_handler(parameter_names)}
+    raw_parsed = raw_parser.parse_args(argv)
+
+    def raw_dispatch():
+        parameters = dict(vars(raw_parsed))
+        return raw_handlers[parameters.pop('sub_command')](**parameters)
+
+    argcat_phases = {
+        'build': measure(lambda: generate_manifest(num_subparsers, num_arguments), repeat=repeat),
+        'create_parsers': measure_with_setup(lambda: create_argcat(manifest, lazy_subparsers),
+                                             lambda new_argcat: new_argcat._create_parsers(),
+                                             repeat=repeat),
+        'parse': measure(lambda: main_parser.parse_args(args=argv), number=PARSE_NUMBER),
+        'dispatch': measure(lambda: argcat._dispatch(parsed, True), number=PARSE_NUMBER),
+        'parse_args': measure(lambda: argcat.parse_args(argv, subparser_ignore_main=True),
+                              number=PARSE_NUMBER),
+    }
+    argparse_phases = {
+        'create_parsers': measure(lambda: create_argparse(num_subparsers, num_arguments),
+                                  repeat=repeat),
+        'parse': measure(lambda: raw_parser.parse_args(argv), number=PARSE_NUMBER),
+        'dispatch': measure(raw_dispatch, number=PARSE_NUMBER),
+    }
+    return {
+        'name': f's{num_subparsers}_a{num_arguments}',
+        'subparsers': num_subparsers,
+        'arguments': num_arguments,
+        'argcat': argcat_phases,
+        'argparse': argparse_phases,
+    }
+
+def run_hello_argcat() -> None:
+    """
+    The equivalent of `examples/hello_argcat.py` without printing the parsers and the handlers.
+    """
+    argcat = ArgCat(chatter=False)
+    with argcat.build() as builder:
+        builder.set_prog_info(prog='Cool program name', description='Awesome description')
+        builder.set_subparsers_info(title='The subparsers title',
+                                    description='The subparsers description',
+                                    help='The subparsers help')
+        builder.main_parser().add_exclusive_argument('test', nargs='?', metavar='TEST', type=str,
+                                                     help='Just for test')
+        builder.add_subparser('init', help='Initialize something.')
+        builder.add_subparser('info', help='Show information of something.')
+        builder.subparser('info').add_argument('detail', nargs='?', metavar='DETAIL', type='str',
+                                               help='The detail of the information')
+        builder.add_subparser('config', help="Config something.")
+        builder.subparser('config').add_group('a_group', description="Group description",
+                                              is_mutually_exclusive=True)
+        builder.subparser('config').add_argument('-n', '--name', nargs='?', dest='name',
+                                                 metavar='NAME', type='str', help='The name.',
+                                                 group='a_group')
+        builder.subparser('config').add_argument('-u', '--username', nargs='?', dest='user_name',
+                                                 metavar='USER_NAME', type='str',
+                                                 help='The user name.', group='a_group')
+    argcat.add_handler_provider(hello_argcat.FooCls())
+    argcat.set_parser_handler(parser_name='main', handler=hello_argcat.main_handler)
+    argcat.parse_args()
+
+def bench_hello(repeat: int) -> Dict:
+    """
+    Time one invocation of `examples/hello_argparse.py` and its ArgCat equivalent.
+    """
+    def invoke(main_func):
+        saved_argv = sys.argv
+        sys.argv = ['hello'] + HELLO_ARGV
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                main_func()
+        finally:
+            sys.argv = saved_argv
+
+    return {
+        'argv': HELLO_ARGV,
+        'argcat': measure(lambda: invoke(run_hello_argcat), repeat=repeat, number=20),
+        'argparse': measure(lambda: invoke(hello_argparse.main), repeat=repeat, number=20),
+    }
+
+def make_cases(full: bool) -> List[Tuple[int, int]]:
+    """
+    Make the (subparsers, arguments) pairs to run.
+    """
+    subparser_counts = FULL_SUBPARSER_COUNTS if full else SUBPARSER_COUNTS
+    argument_counts = FULL_ARGUMENT_COUNTS if full else ARGUMENT_COUNTS
+    max_total = FULL_MAX_TOTAL_ARGUMENTS if full else MAX_TOTAL_ARGUMENTS
+    return [(num_subparsers, num_arguments)
+            for num_subparsers, num_arguments in itertools.product(subparser_counts,
+                                                                   argument_counts)
+            if num_subparsers * num_arguments <= max_total]
+
+def print_case(case: Dict) -> None:
+    """
+    Print the phases of one case with the overhead against raw argparse.
+    """
+    print(f"{case['subparsers']} subparsers x {case['arguments']} arguments:")
+    for phase, seconds in case['argcat'].items():
+        line = f"  {phase:<16}{seconds * 1e6:>14.1f} us"
+        raw_seconds = case['argparse'].get(phase, None)
+        if raw_seconds:
+            line += f"  (argparse {raw_seconds * 1e6:.1f} us, x{seconds / raw_seconds:.2f})"
+        print(line)
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Compare the ArgCat phases of `results` with `baseline`.
+
+    Returns the descriptions of the phases slower than the baseline by more than `threshold`.
+    """
+    baseline_cases = {case['name']: case for case in baseline.get('cases', [])}
+    regressions = []
+    for case in results['cases']:
+        baseline_case = baseline_cases.get(case['name'], None)
+        if baseline_case is None:
+            continue
+        for phase, seconds in case['argcat'].items():
+            baseline_seconds: Optional[float] = baseline_case['argcat'].get(phase, None)
+            if baseline_seconds and seconds > baseline_seconds * (1 + threshold):
+                regressions.append(f"{case['name']} {phase}: {baseline_seconds * 1e6:.1f} us -> "
+                                   f"{seconds * 1e6:.1f} us")
+    return regressions
+
+def main():
+    """
+    Main func
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 2)[1])
+    parser.add_argument('--full', action='store_true',
+                        help=f'Run up to {FULL_SUBPARSER_COUNTS[-1]} subparsers and '
+                        f'{FULL_ARGUMENT_COUNTS[-1]} arguments, which takes minutes.')
+    parser.add_argument('--lazy', action='store_true', help='Use lazy subparsers.')
+    parser.add_argument('--repeat', type=int, default=3, help='Rounds of every measurement.')
+    parser.add_argument('--output', default='bench_suite_results.json',
+                        help='The JSON file to save the results.')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='The JSON file of a previous run to compare with.')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='The ratio of slowdown reported as a regression.')
+    options = parser.parse_args()
+
+    results = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'lazy_subparsers': options.lazy,
+        'cases': [],
+    }
+    for num_subparsers, num_arguments in make_cases(options.full):
+        case = bench_case(num_subparsers, num_arguments, options.lazy, options.repeat)
+        print_case(case)
+        results['cases'].append(case)
+    results['hello'] = bench_hello(options.repeat)
+    print(f"hello {' '.join(HELLO_ARGV)}: argcat {results['hello']['argcat'] * 1e6:.1f} us, "
+          f"argparse {results['hello']['argparse'] * 1e6:.1f} us")
+
+    with open(options.output, 'w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"Results saved to {options.output}.")
+
+    if options.compare:
+        with open(options.compare, encoding='utf-8') as baseline_file:
+            regressions = compare(results, json.load(baseline_file), options.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
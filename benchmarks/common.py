@@ -0,0 +1,54 @@
+"""
+Shared helpers for the benchmarks of ArgCat.
+"""
+import time
+import timeit
+from typing import Any, Callable, List
+
+from argcat import ArgCat
+
+def build_synthetic_cli(argcat: ArgCat, num_subparsers: int, num_arguments: int) -> None:
+    """
+    Build `num_subparsers` subparsers named `cmd<N>` into `argcat`, each of which has
+    `num_arguments` optional arguments named `--opt<N>`.
+    """
+    with argcat.build() as builder:
+        builder.set_prog_info(prog='bench')
+        builder.main_parser().add_argument('-v', '--verbose', action='store_true', default=False)
+        for parser_index in range(num_subparsers):
+            parser_name = f'cmd{parser_index}'
+            builder.add_subparser(parser_name, help=f'Command {parser_index}.')
+            parser_builder = builder.subparser(parser_name)
+            for argument_index in range(num_arguments):
+                parser_builder.add_argument(f'--opt{argument_index}', type='int', default=0,
+                                            help=f'Option {argument_index}.')
+
+def measure(func: Callable[[], object], repeat: int = 5, number: int = 1) -> float:
+    """
+    Run `func` `number` times for `repeat` rounds and return the best seconds per call.
+    """
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+def measure_with_setup(setup: Callable[[], Any], func: Callable[[Any], object],
+                       repeat: int = 5) -> float:
+    """
+    Call `func` with the result of `setup` for `repeat` rounds and return the best seconds of
+    `func`. This is for the code which consumes what it works on, such as creating parsers.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        prepared = setup()
+        start = time.perf_counter()
+        func(prepared)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def make_handler(parameter_names: List[str]) -> Callable:
+    """
+    Make a handler function whose signature is exactly `parameter_names`, which is required by
+    ArgCat's handler check. The handler returns its keyword arguments.
+    """
+    namespace = {}
+    # pylint: disable=exec-used
+    exec(f"def handler({', '.join(parameter_names)}):\n    return locals()", namespace)
+    return namespace['handler']
@@ -57,14 +57,10 @@ def main_handler(test):
     """
     print(f"main_handler {test}")
 
-def main():
+def build(argcat):
     """
-    Main func
+    Build the parsers of this example.
     """
-    argcat = ArgCat(chatter=False)
-    foo_cls_instance = FooCls()
-    foo_cls_instance.value = "new value"
-
     with argcat.build() as builder:
         # Set basic information
         builder.set_prog_info(prog='Cool program name', description='Awesome description')
@@ -95,6 +91,16 @@ def main():
                                                  metavar='USER_NAME',
                                                 type='str', help='The user name.', group='a_group')
 
+def main():
+    """
+    Main func
+    """
+    argcat = ArgCat(chatter=False)
+    foo_cls_instance = FooCls()
+    foo_cls_instance.value = "new value"
+
+    build(argcat)
+
     argcat.add_handler_provider(foo_cls_instance)
     argcat.set_parser_handler(parser_name='main', handler=main_handler)
 
@@ -6,12 +6,10 @@ parser handler" errors.
 """
 from argcat import ArgCat
 
-def main():
+def build(argcat):
     """
-    Main func
+    Build the parsers of this example.
     """
-    argcat = ArgCat()
-
     with argcat.build() as builder:
         # Set descriptive information of the program
         builder.set_prog_info(prog='PROG')
@@ -28,6 +26,14 @@ def main():
         builder.add_subparser('b', help='b help')
         builder.subparser('b').add_argument('--baz', choices='XYZ', help='baz help')
 
+def main():
+    """
+    Main func
+    """
+    argcat = ArgCat()
+
+    build(argcat)
+
     # parse some argument lists
     argcat.parse_args(['a', '12'])
     argcat.parse_args(['--foo', 'b', '--baz', 'Z'])
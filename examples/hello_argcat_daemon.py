@@ -0,0 +1,64 @@
+#!/usr/bin/python
+"""
+Example codes for running ArgCat as a warm daemon and calling it from a thin client.
+
+The first run finds no daemon, so it parses the args by itself and starts a daemon in the
+background. The following runs within the idle timeout are handled by the daemon.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from argcat import ArgCat
+
+SERVE_ENV = 'HELLO_ARGCAT_SERVE'
+
+def socket_path():
+    """
+    Get the path of the socket in a dir only the current user can access. The client sends its
+    environment variables to the daemon, so the socket must never be in a shared dir like /tmp.
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime_dir:
+        runtime_dir = os.path.join(tempfile.gettempdir(), f'hello_argcat_{os.getuid()}')
+        os.makedirs(runtime_dir, mode=0o700, exist_ok=True)
+        # The dir may have been made by someone else first.
+        dir_stat = os.stat(runtime_dir)
+        if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+            raise PermissionError(f"`{runtime_dir}` is not private to the current user.")
+    return os.path.join(runtime_dir, 'hello_argcat.sock')
+
+def build_argcat():
+    """
+    Build the ArgCat, which is the expensive part a daemon saves.
+    """
+    def foo_handler(x, y):
+        print(x * y)
+
+    argcat = ArgCat()
+    with argcat.build() as builder:
+        builder.add_subparser('foo')
+        builder.subparser('foo').add_argument('-x', type=int, default=1)
+        builder.subparser('foo').add_argument('y', type=float)
+    argcat.set_parser_handler('foo', foo_handler)
+    return argcat
+
+def main():
+    """
+    Main func
+    """
+    if os.environ.get(SERVE_ENV):
+        build_argcat().serve(socket_path(), idle_timeout=60)
+        return
+    try:
+        sys.exit(ArgCat.call_daemon(socket_path()))
+    except OSError:
+        # No daemon yet. Start one for the next runs and handle this run by ourselves.
+        subprocess.Popen([sys.executable, '-m', 'examples.hello_argcat_daemon'],
+                         env=dict(os.environ, **{SERVE_ENV: '1'}),
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        build_argcat().parse_args()
+
+if __name__ == '__main__':
+    main()
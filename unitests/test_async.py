@@ -0,0 +1,81 @@
+"""All UnitTests for ArgCat's async parsing."""
+import asyncio
+import contextlib
+import io
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestAsync(ArgCatUnitTest):
+    """UnitTest class for ArgCat's parse_args_async() and parse_many_async()."""
+    def setUp(self):
+        self._argcat = ArgCat()
+        with self._argcat.build() as builder:
+            builder.main_parser().add_argument('-t', '--tag', default=None)
+            builder.add_subparser('sleep')
+            builder.subparser('sleep').add_argument('seconds', type='float')
+            builder.add_subparser('echo')
+            builder.subparser('echo').add_argument('text')
+        self._events = []
+
+        async def main_handler(tag):
+            self._events.append(f'main start {tag}')
+            await asyncio.sleep(0.05)
+            self._events.append(f'main end {tag}')
+            return tag
+
+        async def sleep_handler(tag, seconds):
+            self._events.append(f'sleep start {seconds}')
+            await asyncio.sleep(seconds)
+            self._events.append(f'sleep end {seconds}')
+            return seconds
+
+        def echo_handler(tag, text):
+            return text
+
+        self._argcat.set_parser_handler('main', main_handler)
+        self._argcat.set_parser_handler('sleep', sleep_handler)
+        self._argcat.set_parser_handler('echo', echo_handler)
+
+    def test_parse_args_async(self) -> None:
+        """Test coroutine handlers and regular handlers are both supported."""
+        result = asyncio.run(self._argcat.parse_args_async(['sleep', '0']))
+        self.assertEqual(result, {'sleep': 0.0}, "Incorrect result for the coroutine handler!")
+        result = asyncio.run(self._argcat.parse_args_async(['echo', 'meow']))
+        self.assertEqual(result, {'echo': 'meow'}, "Incorrect result for the regular handler!")
+
+    def test_sequential_and_concurrent_handlers(self) -> None:
+        """Test main and subparser handlers are sequential by default and concurrent if asked."""
+        result = asyncio.run(self._argcat.parse_args_async(['-t', 'a', 'sleep', '0.01']))
+        self.assertEqual(result, {'main': 'a', 'sleep': 0.01}, "Incorrect result!")
+        self.assertEqual(self._events, ['main start a', 'main end a',
+                                        'sleep start 0.01', 'sleep end 0.01'],
+                         "Handlers should be awaited one after another by default!")
+        self._events.clear()
+        asyncio.run(self._argcat.parse_args_async(['-t', 'b', 'sleep', '0.01'],
+                                                  concurrent_handlers=True))
+        self.assertEqual(self._events, ['main start b', 'sleep start 0.01',
+                                        'sleep end 0.01', 'main end b'],
+                         "Handlers should run concurrently!")
+
+    def test_failed_coroutine_handler(self) -> None:
+        """Test an exception raised by a coroutine handler is reported as a regular one."""
+        async def echo_handler(tag, text):
+            raise ValueError(text)
+        self._argcat._arg_parsers['echo'].handler_func = echo_handler # pylint: disable=protected-access
+        with contextlib.redirect_stderr(io.StringIO()) as stderr, \
+            contextlib.redirect_stdout(io.StringIO()):
+            result = asyncio.run(self._argcat.parse_args_async(['echo', 'oops']))
+        self.assertEqual(result, {'echo': None}, "A failed handler should have None result!")
+        self.assertIn('ValueError: oops', stderr.getvalue(), "The traceback should be printed!")
+
+    def test_parse_many_async(self) -> None:
+        """Test parse_many_async() handles args concurrently and keeps the order."""
+        args_list = [['sleep', '0.05'], ['sleep', '0.01'], ['bad'], ['echo', 'x']]
+        with contextlib.redirect_stderr(io.StringIO()):
+            results = asyncio.run(self._argcat.parse_many_async(args_list, max_concurrency=4))
+        self.assertEqual([result.result for result in results],
+                         [{'sleep': 0.05}, {'sleep': 0.01}, None, {'echo': 'x'}],
+                         "Results should be in the order of the args!")
+        self.assertEqual(results[2].exit_status, 2, "The parse error should be recorded!")
+        self.assertLess(self._events.index('sleep end 0.01'), self._events.index('sleep end 0.05'),
+                        "Args should be handled concurrently!")
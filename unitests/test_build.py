@@ -1,6 +1,6 @@
 """All UnitTests for ArgCat's build()"""
 from argparse import _StoreTrueAction, _ArgumentGroup, _MutuallyExclusiveGroup
-from argcat import ArgCat
+from argcat import ArgCat, _ArgCatBuilder
 from unitests.argcat_unittest import ArgCatUnitTest
 
 
@@ -200,3 +200,54 @@ class TestBuild(ArgCatUnitTest):
         self.assertEqual(process_parser.handler_func, process_handler_with_correct_parameters,
                          "`process` parser's handler should be valid after receiving \
                              a correct handler!")
+
+    def test_read_only_build_results(self) -> None:
+        """Test the results of the builder cannot modify the manifest."""
+        with self._argcat.build() as builder:
+            prog_info = builder.set_prog_info(prog='Program for read-only test.')
+            parser_info = builder.add_subparser('process', help='Process something.')
+            group_info = builder.subparser('process').add_group('process_group')
+            argument_info = builder.subparser('process').add_argument('-f', '--file',
+                                                                      dest='filename')
+
+            self.assertEqual(prog_info, {'prog': 'Program for read-only test.'},
+                             "Incorrect result of set_prog_info().")
+            self.assertEqual(parser_info, {'arguments': (), 'help': 'Process something.'},
+                             "Incorrect result of add_subparser().")
+            self.assertEqual(argument_info['dest'], 'filename',
+                             "Incorrect result of add_argument().")
+            for info in (prog_info, parser_info, group_info, argument_info):
+                with self.assertRaises(TypeError, msg="The result should be read-only."):
+                    info['dest'] = 'hacked'
+
+            # Adding arguments later should not change the result of add_subparser().
+            builder.subparser('process').add_argument('-l', '--link', dest='link')
+            self.assertEqual(parser_info['arguments'], (),
+                             "The result of add_subparser() should not be changed.")
+
+        # pylint: disable=protected-access
+        self.assertEqual(self._argcat._arg_parsers['process'].dests, ['filename', 'link'],
+                         "`process` parser's dests are incorrect!")
+
+    def test_read_only_nested_build_results(self) -> None:
+        """Test the nested values of the results of the builder cannot modify the manifest."""
+        manifests = []
+        with _ArgCatBuilder(on_build_done=manifests.append) as builder:
+            prog_info = builder.set_prog_info(prog='nested', parents=[], epilog={'a': [1]})
+            builder.add_subparser('process')
+            argument_info = builder.subparser('process').add_argument(
+                '--n', choices=[0, 1, 2], default=[[0]], metavar={'n'})
+            for value in (argument_info['choices'], argument_info['default'],
+                          argument_info['default'][0], prog_info['parents'],
+                          prog_info['epilog']['a']):
+                with self.assertRaises(AttributeError, msg="The nested list should be read-only."):
+                    value.append(3)
+            with self.assertRaises(TypeError, msg="The nested dict should be read-only."):
+                prog_info['epilog']['b'] = 2
+            with self.assertRaises(AttributeError, msg="The nested set should be read-only."):
+                argument_info['metavar'].add('m')
+        argument = manifests[0]['parsers']['process']['arguments'][0]
+        self.assertEqual((argument['choices'], argument['default'], argument['metavar']),
+                         ([0, 1, 2], [[0]], {'n'}), "The manifest should not be changed.")
+        self.assertEqual((manifests[0]['meta']['parents'], manifests[0]['meta']['epilog']),
+                         ([], {'a': [1]}), "The manifest should not be changed.")
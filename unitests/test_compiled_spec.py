@@ -0,0 +1,98 @@
+"""All UnitTests for ArgCat's compiled spec."""
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+def add_handler(x, y):
+    """A module level handler for the subparser `add`."""
+    return x + y
+
+# pylint: disable=too-few-public-methods
+class SpecHandlerProvider:
+    """A handler provider with handlers which can be imported by their paths."""
+    @staticmethod
+    @ArgCat.handler('scale')
+    def scale_handler(value, factor):
+        """A static method handler for the subparser `scale`."""
+        return value * factor
+
+    @classmethod
+    @ArgCat.handler('main')
+    def main_handler(cls, verbose):
+        """A class method handler for the main parser."""
+        return cls.__name__, verbose
+
+def build_argcat(lazy_subparsers: bool = False) -> ArgCat:
+    """Build an ArgCat with the handlers set."""
+    argcat = ArgCat(lazy_subparsers=lazy_subparsers)
+    with argcat.build() as builder:
+        builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true')
+        builder.add_subparser('add', help='Add two numbers.')
+        builder.subparser('add').add_argument('x', type='int')
+        builder.subparser('add').add_argument('y', type='decimal.Decimal')
+        builder.add_subparser('scale')
+        builder.subparser('scale').add_argument('value', type='float')
+        builder.subparser('scale').add_argument('--factor', type='float', default=2.0)
+    argcat.add_handler_provider(SpecHandlerProvider)
+    argcat.set_parser_handler('add', add_handler)
+    return argcat
+
+def parse_with_spec(spec_bytes: bytes, args: list) -> dict:
+    """Reconstruct an ArgCat from the pickled spec in a worker process and parse `args`."""
+    return ArgCat.from_spec(pickle.loads(spec_bytes)).parse_args(args)
+
+class TestCompiledSpec(ArgCatUnitTest):
+    """UnitTest class for ArgCat's compiled spec."""
+    def test_round_trip(self) -> None:
+        """Test the ArgCat from a pickled spec parses and dispatches the same as the original."""
+        for lazy_subparsers in (False, True):
+            argcat = build_argcat(lazy_subparsers)
+            spec = pickle.loads(pickle.dumps(argcat.compile_spec()))
+            with mock.patch('pydoc.locate') as mock_locate:
+                spec_argcat = ArgCat.from_spec(spec)
+                for args in (['add', '1', '2.5'], ['scale', '3', '--factor', '4'], ['-v']):
+                    self.assertEqual(spec_argcat.parse_args(args), argcat.parse_args(args),
+                                     f"Incorrect result of `{args}`!")
+            mock_locate.assert_not_called()
+            self.assertEqual(spec_argcat.parse_args(['-v', 'add', '1', '2']),
+                             {'main': ('SpecHandlerProvider', True), 'add': 3},
+                             "Handlers should be imported by their paths!")
+
+    def test_from_spec_is_lazy(self) -> None:
+        """Test the subparsers are not built until they are parsed."""
+        spec_argcat = ArgCat.from_spec(build_argcat().compile_spec())
+        # pylint: disable=protected-access
+        self.assertEqual(sorted(spec_argcat._lazy_parser_names), ['add', 'scale'],
+                         "The subparsers should not be built!")
+        self.assertEqual(spec_argcat.parse_args(['scale', '1.5'])['scale'], 3.0,
+                         "Incorrect result of the lazy subparser!")
+
+    def test_handlers_not_importable(self) -> None:
+        """Test the handlers which cannot be imported by their paths are left out."""
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.add_subparser('init')
+        argcat.set_parser_handler('init', lambda: 'init')
+        spec = argcat.compile_spec()
+        self.assertEqual(spec['handlers'], {}, "A lambda should be left out!")
+        spec_argcat = ArgCat.from_spec(spec)
+        self.assertTrue(spec_argcat.set_parser_handler('init', lambda: 'again'),
+                        "The handler should be set again!")
+        self.assertEqual(spec_argcat.parse_args(['init']), {'init': 'again'},
+                         "Incorrect result of the handler set again!")
+
+    def test_unknown_version(self) -> None:
+        """Test a spec of another version is rejected."""
+        spec = build_argcat().compile_spec()
+        spec['version'] = -1
+        with self.assertRaises(ValueError, msg="A spec of another version should be rejected!"):
+            ArgCat.from_spec(spec)
+
+    def test_worker_process(self) -> None:
+        """Test a worker process reconstructs the ArgCat from the pickled spec."""
+        spec_bytes = pickle.dumps(build_argcat().compile_spec())
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(parse_with_spec, spec_bytes, ['add', '20', '22']).result()
+        self.assertEqual(result, {'add': 42}, "Incorrect result from the worker process!")
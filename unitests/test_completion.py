@@ -0,0 +1,131 @@
+"""All UnitTests for ArgCat's shell completion scripts."""
+import os
+import tempfile
+from unittest import mock
+from argcat import ArgCat
+from examples import hello_argcat, hello_argcat_build
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestCompletion(ArgCatUnitTest):
+    """UnitTest class for ArgCat's shell completion scripts."""
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    @staticmethod
+    def _build(argcat: ArgCat, files_type: str = 'pathlib.Path') -> None:
+        with argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true')
+            builder.add_subparser('checkout', aliases=['co'], help='Check out a branch.')
+            builder.subparser('checkout').add_argument('branch', choices=['main', 'dev'])
+            builder.subparser('checkout').add_argument('--log', type='pathlib.Path')
+            builder.add_subparser('tag', help='Tag files.')
+            builder.subparser('tag').add_argument('files', nargs='*', type=files_type)
+
+    def test_hello_argcat(self) -> None:
+        """Test the scripts of `examples/hello_argcat.py` complete its subcommands and options."""
+        argcat = ArgCat(chatter=False)
+        hello_argcat.build(argcat)
+        bash_script = argcat.generate_completion('bash', 'hello')
+        self.assertIn("COMPREPLY=($(compgen -W 'init info config' -- \"$cur\"))", bash_script,
+                      "The subcommands should be completed!")
+        self.assertIn("COMPREPLY=($(compgen -W '-h --help -n --name -u --username' -- \"$cur\"))",
+                      bash_script, "The options of `config` should be completed!")
+        self.assertIn("        -n|--name) COMPREPLY=(); return ;;", bash_script,
+                      "Nothing should be completed for the value of `--name`!")
+        self.assertTrue(bash_script.endswith("complete -F _argcat_hello hello\n"),
+                        "The function should be registered for the command!")
+
+        zsh_script = argcat.generate_completion('zsh', 'hello')
+        self.assertTrue(zsh_script.startswith("#compdef hello\n"), "Incorrect zsh header!")
+        self.assertIn("                'info:Show information of something.'\n", zsh_script,
+                      "The subcommands should be described!")
+        self.assertIn("        '(-u --username)--username[The user name.]:username: '",
+                      zsh_script, "Incorrect zsh spec of `--username`!")
+        self.assertIn("        '::detail: '", zsh_script, "Incorrect zsh spec of `detail`!")
+
+        fish_script = argcat.generate_completion('fish', 'hello')
+        self.assertIn("complete -c hello -n '__fish_seen_subcommand_from config' -s n -l name " +
+                      "-r -d 'The name.'\n", fish_script, "Incorrect fish completion of `--name`!")
+        self.assertIn("complete -c hello -n __fish_use_subcommand -a init " +
+                      "-d 'Initialize something.'\n", fish_script,
+                      "Incorrect fish completion of `init`!")
+
+    def test_hello_argcat_build(self) -> None:
+        """Test the scripts of `examples/hello_argcat_build.py` complete the choices."""
+        argcat = ArgCat(chatter=False)
+        hello_argcat_build.build(argcat)
+        self.assertIn("        --baz) COMPREPLY=($(compgen -W 'X Y Z' -- \"$cur\")); return ;;",
+                      argcat.generate_completion('bash', 'PROG'),
+                      "The choices of `--baz` should be completed by bash!")
+        self.assertIn("        '--baz[baz help]:baz:(X Y Z)'",
+                      argcat.generate_completion('zsh', 'PROG'),
+                      "The choices of `--baz` should be completed by zsh!")
+        self.assertIn("complete -c PROG -n '__fish_seen_subcommand_from b' -l baz -r " +
+                      "-a 'X Y Z' -d 'baz help'\n", argcat.generate_completion('fish', 'PROG'),
+                      "The choices of `--baz` should be completed by fish!")
+
+    def test_aliases_and_files(self) -> None:
+        """Test the aliases and the files of path types are completed."""
+        argcat = ArgCat(chatter=False)
+        self._build(argcat)
+        bash_script = argcat.generate_completion('bash', 'vcs')
+        self.assertIn("            checkout|co) cmd=checkout; break ;;", bash_script,
+                      "The alias should be routed to the subcommand!")
+        self.assertIn("        --log) COMPREPLY=($(compgen -f -- \"$cur\")); return ;;",
+                      bash_script, "Files should be completed for `--log`!")
+        self.assertIn("    COMPREPLY=($(compgen -W 'main dev' -- \"$cur\"))", bash_script,
+                      "The choices of the positional should be completed!")
+        zsh_script = argcat.generate_completion('zsh', 'vcs')
+        self.assertIn("                'co:Check out a branch.'\n", zsh_script,
+                      "The alias should be described!")
+        self.assertIn("        '*:files:_files'", zsh_script, "Files should be completed by zsh!")
+        fish_script = argcat.generate_completion('fish', 'vcs')
+        self.assertIn("complete -c vcs -n '__fish_seen_subcommand_from checkout co' -l log -r -F\n",
+                      fish_script, "Files should be completed for `--log` by fish!")
+        self.assertIn("complete -c vcs -n '__fish_seen_subcommand_from tag' -F\n", fish_script,
+                      "Files should be completed for `files` by fish!")
+        with self.assertRaises(ValueError, msg="An unknown shell should be rejected!"):
+            argcat.generate_completion('csh', 'vcs')
+
+    def test_no_parsers_created(self) -> None:
+        """Test the scripts are generated from the manifest without creating any parser."""
+        argcat = ArgCat(chatter=False, lazy_subparsers=True)
+        self._build(argcat)
+        with mock.patch('argparse.ArgumentParser.add_argument') as mock_add_argument:
+            argcat.generate_completion('bash', 'vcs')
+        mock_add_argument.assert_not_called()
+
+    def test_incremental_write(self) -> None:
+        """Test only the changed subcommands are regenerated and the unchanged scripts are kept."""
+        directory = self._temp_dir.name
+        argcat = ArgCat(chatter=False)
+        self._build(argcat)
+        self.assertEqual(argcat.write_completions(directory, 'vcs'),
+                         {shell: ['main', 'checkout', 'tag'] for shell in ('bash', 'zsh', 'fish')},
+                         "All parsers should be generated at first!")
+        paths = [os.path.join(directory, file_name) for file_name in ('vcs', '_vcs', 'vcs.fish')]
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as script_file:
+                self.assertEqual(script_file.read(),
+                                 argcat.generate_completion(
+                                     {'vcs': 'bash', '_vcs': 'zsh'}.get(
+                                         os.path.basename(path), 'fish'), 'vcs'),
+                                 "The written script should be the same as the generated one!")
+            os.utime(path, (0, 0))
+
+        self.assertEqual(argcat.write_completions(directory, 'vcs', shells=['bash']),
+                         {'bash': []}, "Nothing should be regenerated!")
+        self.assertEqual(os.path.getmtime(paths[0]), 0, "The unchanged script is rewritten!")
+
+        another_argcat = ArgCat(chatter=False)
+        self._build(another_argcat, files_type='str')
+        self.assertEqual(another_argcat.write_completions(directory, 'vcs'),
+                         {shell: ['tag'] for shell in ('bash', 'zsh', 'fish')},
+                         "Only the changed subcommand should be regenerated!")
+        with open(paths[2], 'r', encoding='utf-8') as script_file:
+            self.assertEqual(script_file.read(),
+                             another_argcat.generate_completion('fish', 'vcs'),
+                             "The script should be updated!")
@@ -0,0 +1,134 @@
+"""All UnitTests for parsing with ArgCats in many threads at the same time."""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from argcat import ArgCat, _ArgCatPrinter, _ArgCatPrintLevel
+from unitests.argcat_unittest import ArgCatUnitTest
+
+NUM_THREADS = 8
+
+def verbose_enabled(value):
+    """A handler returning whether the verbose logs are printed where it's called."""
+    return _ArgCatPrinter.is_enabled(_ArgCatPrintLevel.VERBOSE), value
+
+def make_handler(index: int):
+    """Make the handler of the subparser `cmd<index>`."""
+    return lambda value, tag: (index, value, tag)
+
+# pylint: disable=protected-access
+class TestConcurrency(ArgCatUnitTest):
+    """UnitTest class for parsing with ArgCats in many threads at the same time."""
+    def setUp(self):
+        # Switch the threads as often as possible to interleave them.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self._switch_interval)
+
+    @staticmethod
+    def _build(argcat: ArgCat, num_subparsers: int = 20) -> ArgCat:
+        with argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true')
+            for index in range(num_subparsers):
+                builder.add_subparser(f'cmd{index}')
+                builder.subparser(f'cmd{index}').add_argument('value', type='int')
+                builder.subparser(f'cmd{index}').add_argument('--tag', action='append',
+                                                              default=[])
+        for index in range(num_subparsers):
+            argcat.set_parser_handler(f'cmd{index}', make_handler(index))
+        return argcat
+
+    @staticmethod
+    def _args_list(num_subparsers: int = 20) -> list:
+        return [[f'cmd{index % num_subparsers}', str(index), '--tag', str(index % 5)]
+                for index in range(400)]
+
+    def test_concurrent_parse_args(self) -> None:
+        """Test parse_args() from a thread pool gets the same results as parsing one by one."""
+        argcats = [self._build(ArgCat(**options)) for options in
+                   ({}, {'lazy_subparsers': True}, {'parse_cache_size': 16},
+                    {'lazy_subparsers': True, 'route_subcommands': True, 'parse_cache_size': 16})]
+        args_list = self._args_list()
+        expected = [{f'cmd{index % 20}': (index % 20, index, [str(index % 5)])}
+                    for index in range(len(args_list))]
+        materialize_calls = []
+        for argcat in argcats:
+            with mock.patch.object(argcat, '_build_parser', side_effect=lambda *args, a=argcat:
+                                   materialize_calls.append(args[0]) or
+                                   ArgCat._build_parser(a, *args)):
+                with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+                    results = list(executor.map(
+                        lambda args, a=argcat: a.parse_args(args, subparser_ignore_main=True),
+                        args_list))
+            self.assertEqual(results, expected, "Incorrect results from the threads!")
+        self.assertEqual(sorted(materialize_calls), sorted(f'cmd{index}' for index in range(20)
+                                                           for _ in range(2)),
+                         "Each lazy subparser should be created only once!")
+
+    def test_several_definitions(self) -> None:
+        """Test threads parsing with different ArgCats at the same time don't interfere."""
+        small_argcat = self._build(ArgCat(lazy_subparsers=True), num_subparsers=3)
+        large_argcat = self._build(ArgCat(lazy_subparsers=True), num_subparsers=50)
+        barrier = threading.Barrier(NUM_THREADS)
+
+        def parse(thread_index: int) -> list:
+            barrier.wait()
+            argcat, num_subparsers = (small_argcat, 3) if thread_index % 2 else (large_argcat, 50)
+            return [argcat.parse_args(args, subparser_ignore_main=True)
+                    for args in self._args_list(num_subparsers)]
+
+        with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+            results = list(executor.map(parse, range(NUM_THREADS)))
+        for thread_index, thread_results in enumerate(results):
+            num_subparsers = 3 if thread_index % 2 else 50
+            self.assertEqual(thread_results[-1], {f'cmd{399 % num_subparsers}':
+                                                  (399 % num_subparsers, 399, ['4'])},
+                             "Incorrect result of the definition!")
+
+    def test_per_instance_chatter(self) -> None:
+        """Test the chatter of an ArgCat affects only itself, even in other threads."""
+        filter_level = _ArgCatPrinter.filter_level
+        quiet_argcat = ArgCat(chatter=False)
+        with mock.patch('builtins.print'):
+            chatter_argcat = ArgCat(chatter=True)
+        self.assertFalse(quiet_argcat.chatter, "Another ArgCat should not change the chatter!")
+        self.assertIs(_ArgCatPrinter.filter_level, filter_level,
+                      "The class filter level should not be changed!")
+        for argcat in (quiet_argcat, chatter_argcat):
+            with mock.patch('builtins.print'), argcat.build() as builder:
+                builder.add_subparser('check')
+                builder.subparser('check').add_argument('value')
+            argcat.set_parser_handler('check', verbose_enabled)
+        barrier = threading.Barrier(NUM_THREADS)
+
+        def parse(thread_index: int) -> bool:
+            argcat = chatter_argcat if thread_index % 2 else quiet_argcat
+            barrier.wait()
+            results = [argcat.parse_args(['check', str(index)], subparser_ignore_main=True)
+                       ['check'][0] for index in range(50)]
+            self.assertEqual(len(set(results)), 1, "The filter level should never change!")
+            return results[0]
+
+        with mock.patch('builtins.print'), ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+            results = list(executor.map(parse, range(NUM_THREADS)))
+        self.assertEqual(results, [index % 2 == 1 for index in range(NUM_THREADS)],
+                         "Each ArgCat should print by its own chatter!")
+        self.assertFalse(_ArgCatPrinter.is_enabled(_ArgCatPrintLevel.VERBOSE),
+                         "The filter level should be restored out of the ArgCat!")
+
+    def test_manifest_not_changed(self) -> None:
+        """Test creating parsers never changes the manifest, which may be shared."""
+        spec = self._build(ArgCat(), num_subparsers=2).compile_spec()
+        meta_dict = spec['manifest']['meta']
+        self.assertNotIn('dest', meta_dict.get('subparser', None) or {},
+                         "The manifest should not be changed by creating the parsers!")
+        with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+            results = list(executor.map(
+                lambda index: ArgCat.from_spec(spec).parse_args(['cmd1', str(index)]),
+                range(NUM_THREADS)))
+        self.assertEqual(results, [{'cmd1': None}] * NUM_THREADS,
+                         "Incorrect results of the ArgCats from the same spec!")
+        self.assertNotIn('dest', meta_dict.get('subparser', None) or {},
+                         "The shared manifest should not be changed by the ArgCats!")
@@ -0,0 +1,101 @@
+"""All UnitTests for ArgCat's daemon mode."""
+import io
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestDaemon(ArgCatUnitTest):
+    """UnitTest class for ArgCat's serve() and call_daemon()."""
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._socket_path = os.path.join(self._temp_dir.name, 'argcat.sock')
+        self._argcat = ArgCat()
+        with self._argcat.build() as builder:
+            builder.add_subparser('where')
+            builder.add_subparser('env')
+            builder.subparser('env').add_argument('name')
+            builder.add_subparser('fail')
+        self._argcat.set_parser_handler('where', lambda: print(os.getcwd()))
+        self._argcat.set_parser_handler('env', lambda name: print(os.environ.get(name)))
+        def fail_handler():
+            raise SystemExit(3)
+        self._argcat.set_parser_handler('fail', fail_handler)
+        self._server = threading.Thread(target=self._argcat.serve,
+                                        args=(self._socket_path, 0.5))
+        self._server.start()
+        # Wait for the socket file.
+        for _ in range(100):
+            if os.path.exists(self._socket_path):
+                break
+            time.sleep(0.01)
+
+    def tearDown(self):
+        self._server.join()
+        self._temp_dir.cleanup()
+
+    def _call(self, args: list) -> tuple:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_status = ArgCat.call_daemon(self._socket_path, args, stdout=stdout, stderr=stderr)
+        return exit_status, stdout.getvalue(), stderr.getvalue()
+
+    def test_call_daemon(self) -> None:
+        """Test the daemon runs args with the client's cwd and env, and relays the outputs."""
+        cwd = os.getcwd()
+        try:
+            os.chdir(self._temp_dir.name)
+            exit_status, stdout, _ = self._call(['where'])
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(exit_status, 0, "Exit status should be 0!")
+        self.assertEqual(os.path.realpath(stdout.strip()), os.path.realpath(self._temp_dir.name),
+                         "The daemon should run with the client's cwd!")
+
+        os.environ['ARGCAT_DAEMON_TEST'] = 'meow'
+        try:
+            exit_status, stdout, _ = self._call(['env', 'ARGCAT_DAEMON_TEST'])
+        finally:
+            del os.environ['ARGCAT_DAEMON_TEST']
+        self.assertEqual(stdout, 'meow\n', "The daemon should run with the client's env!")
+        self.assertNotIn('ARGCAT_DAEMON_TEST', os.environ, "The env should not be leaked!")
+
+        exit_status, stdout, stderr = self._call(['unknown'])
+        self.assertEqual(exit_status, 2, "Exit status of an argparse error should be 2!")
+        self.assertIn("invalid choice: 'unknown'", stderr, "The error should be relayed!")
+
+        exit_status, _, _ = self._call(['fail'])
+        self.assertEqual(exit_status, 3, "Exit status from the handler should be relayed!")
+
+    def test_idle_timeout(self) -> None:
+        """Test the daemon shuts down and removes the socket file after the idle timeout."""
+        self._server.join(5)
+        self.assertFalse(self._server.is_alive(), "The daemon should shut down when idle!")
+        self.assertFalse(os.path.exists(self._socket_path), "The socket file should be removed!")
+        with self.assertRaises(OSError):
+            self._call(['where'])
+
+    def test_untrusted_socket(self) -> None:
+        """Test nothing is sent to a path which is not a socket of the current user."""
+        file_path = os.path.join(self._temp_dir.name, 'not.sock')
+        with open(file_path, 'w', encoding='utf-8'):
+            pass
+        with self.assertRaises(PermissionError, msg="A regular file should be refused!"):
+            ArgCat.call_daemon(file_path, ['where'], stdout=io.StringIO())
+        with mock.patch('os.getuid', return_value=os.getuid() + 1), \
+            self.assertRaises(PermissionError, msg="A socket of another user should be refused!"):
+            self._call(['where'])
+
+    def test_stale_socket_not_removable(self) -> None:
+        """Test the daemon reports a stale socket file which can't be removed."""
+        stale_path = os.path.join(self._temp_dir.name, 'stale.sock')
+        with open(stale_path, 'w', encoding='utf-8'):
+            pass
+        with mock.patch('os.remove', side_effect=PermissionError('Operation not permitted')), \
+            mock.patch('argcat._ArgCatPrinter.print') as mock_print:
+            self._argcat.serve(stale_path, 0.1)
+        self.assertIn("Failed to remove", mock_print.call_args.args[0],
+                      "The error should be reported!")
+        self.assertTrue(os.path.exists(stale_path), "The file should be left there!")
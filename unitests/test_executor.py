@@ -0,0 +1,92 @@
+"""All UnitTests for ArgCat's parse_many() with executors."""
+import contextlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+def pid_handler(seconds):
+    """A picklable handler returning the pid of the process calling it."""
+    time.sleep(seconds)
+    return os.getpid()
+
+def failing_handler(seconds):
+    """A picklable handler which always fails."""
+    raise ValueError(f'failed after {seconds}')
+
+class TestExecutor(ArgCatUnitTest):
+    """UnitTest class for ArgCat's parse_many() with executors."""
+    def setUp(self):
+        # The handler of `wait` blocks until the event is set, so it's completed in a known order
+        # instead of by the scheduling of the threads.
+        self._event = threading.Event()
+        self._argcat = ArgCat()
+        with self._argcat.build() as builder:
+            builder.add_subparser('pid')
+            builder.subparser('pid').add_argument('seconds', type='float')
+            builder.add_subparser('local')
+            builder.subparser('local').add_argument('seconds', type='float')
+            builder.add_subparser('fail')
+            builder.subparser('fail').add_argument('seconds', type='float')
+            builder.add_subparser('wait')
+        self._argcat.set_parser_handler('pid', pid_handler)
+        self._argcat.set_parser_handler('local', lambda seconds: os.getpid())
+        self._argcat.set_parser_handler('fail', failing_handler)
+        self._argcat.set_parser_handler('wait', lambda: self._event.wait(10))
+
+    def test_thread_pool_ordered_and_unordered(self) -> None:
+        """Test results are in order by default and in completed order if not ordered."""
+        args_list = [['wait'], ['pid', '0'], ['bad'], ['pid', '0.05']]
+        with ThreadPoolExecutor(max_workers=4) as executor, \
+            contextlib.redirect_stderr(io.StringIO()):
+            results = []
+            for result in self._argcat.iter_parse_many(args_list, executor=executor,
+                                                       ordered=False):
+                results.append(result)
+                if len(results) == len(args_list) - 1:
+                    self._event.set()
+            self.assertEqual(sorted(result.args for result in results[:-1]),
+                             [['bad'], ['pid', '0'], ['pid', '0.05']],
+                             "Incorrect results completed first!")
+            self.assertEqual(results[-1].args, ['wait'],
+                             "Results should be in the completed order!")
+
+            results = self._argcat.parse_many(args_list, executor=executor)
+            self.assertEqual([result.args for result in results], args_list,
+                             "Results should be in the order of the args!")
+            self.assertEqual(results[0].result, {'wait': True}, "Incorrect result!")
+            self.assertEqual(results[1].result, {'pid': os.getpid()}, "Incorrect result!")
+            self.assertEqual(results[2].exit_status, 2, "The parse error should be recorded!")
+
+    def test_max_in_flight(self) -> None:
+        """Test args are not consumed ahead more than max_in_flight."""
+        consumed = []
+        def args_list():
+            for index in range(10):
+                consumed.append(index)
+                yield ['pid', '0']
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = self._argcat.iter_parse_many(args_list(), executor=executor, max_in_flight=3)
+            next(results)
+            self.assertLessEqual(len(consumed), 3, "Too many args are in flight!")
+            self.assertEqual(len(list(results)), 9, "All results should be yielded!")
+
+    def test_process_pool(self) -> None:
+        """Test picklable handlers run in the workers and the others run locally."""
+        with ProcessPoolExecutor(max_workers=2) as executor, \
+            contextlib.redirect_stderr(io.StringIO()) as stderr, \
+            contextlib.redirect_stdout(io.StringIO()):
+            results = self._argcat.parse_many([['pid', '0'], ['local', '0'], ['fail', '1'], []],
+                                              executor=executor)
+        self.assertNotEqual(results[0].result['pid'], os.getpid(),
+                            "A picklable handler should run in a worker process!")
+        self.assertEqual(results[1].result['local'], os.getpid(),
+                         "A handler which is not picklable should run locally!")
+        self.assertEqual(results[2].result, {'fail': None}, "A failed handler should be None!")
+        self.assertIn('ValueError: failed after 1.0', stderr.getvalue(),
+                      "The traceback from the worker should be printed!")
+        self.assertEqual(results[3].result, {'main': {}},
+                         "The default main handler should run locally!")
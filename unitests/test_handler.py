@@ -1,4 +1,7 @@
 """All UnitTests for ArgCat's handler"""
+import sys
+import types
+from unittest import mock
 from argcat import ArgCat
 from unitests.argcat_unittest import ArgCatUnitTest
 
@@ -74,6 +77,32 @@ class DifferentKindsOfHandlerProvider:
         """A normal function handler"""
         return 'normal_function_init'
 
+@ArgCat.handler(parser_name='init')
+def init_handler() -> str:
+    """A module level handler for the subparser `init`."""
+    return 'module_init'
+
+# pylint: disable=unused-argument
+class LookedUpHandlerProvider(DifferentKindsOfHandlerProvider):
+    """A handler provider whose members other than the handlers must not be touched."""
+    def __init__(self):
+        self.touched = []
+
+    @property
+    def expensive(self) -> str:
+        """A property which should never be evaluated."""
+        self.touched.append('expensive')
+        return 'expensive'
+
+    def __getattr__(self, name):
+        self.touched.append(name)
+        raise AttributeError(name)
+
+    @ArgCat.handler(parser_name='config')
+    def config_handler(self, name: str=None, user_name: str=None) -> str:
+        """A handler defined by the subclass."""
+        return 'config'
+
 class TestHandler(ArgCatUnitTest):
     """UnitText class for ArgCat's handler."""
 
@@ -219,3 +248,66 @@ class TestHandler(ArgCatUnitTest):
         self.assertEqual(self._argcat.set_parser_handler(parser_name='invalid',
                                                          handler=a_handler), False,
                          "Parser handler for a not existed `test` parser should not be set!")
+
+    def test_dispatch_plan(self) -> None:
+        """Test handlers set by set_parser_handler() are called by their compiled plans."""
+        def config_handler(user_name, name) -> str:
+            return f'config_handler:{name},{user_name}'
+        self._argcat.set_parser_handler(parser_name='config', handler=config_handler)
+        config_plan = self._argcat._arg_parsers['config'].dispatch_plan
+        self.assertEqual(config_plan.parameter_names, ('user_name', 'name'),
+                         "Parameters of `config` handler should be passed positionally!")
+        self.assertEqual(config_plan.signature_str, '(user_name, name) -> str',
+                         "Signature string of `config` handler is wrong!")
+        self.assertEqual(self._argcat.parse_args(['test', 'config', '-n', 'Kevin'],
+                                                 subparser_ignore_main=True),
+                         {'config': 'config_handler:Kevin,None'},
+                         "Parameters should be passed to `config` handler by their names!")
+
+        # Keyword-only parameters cannot be passed positionally.
+        def info_handler(*, detail) -> str:
+            return f'info_handler:{detail}'
+        self._argcat.set_parser_handler(parser_name='info', handler=info_handler)
+        info_plan = self._argcat._arg_parsers['info'].dispatch_plan
+        self.assertEqual(info_plan.parameter_names, (),
+                         "Keyword-only parameters should be passed as keyword arguments!")
+        self.assertEqual(self._argcat.parse_args(['test', 'info', 'cute'],
+                                                 subparser_ignore_main=True),
+                         {'info': 'info_handler:cute'},
+                         "`info` handler should be called with keyword arguments!")
+
+        # Setting handler_func directly drops the compiled plan.
+        self._argcat._arg_parsers['config'].handler_func = lambda name, user_name: name
+        self.assertEqual(self._argcat._arg_parsers['config'].dispatch_plan.parameter_names, (),
+                         "A handler set directly should be called with keyword arguments!")
+
+    def test_handlers_looked_up(self) -> None:
+        """Test only the decorated functions are looked up on the handler provider."""
+        handler_provider = LookedUpHandlerProvider()
+        self.assertTrue(self._argcat.add_handler_provider(handler_provider),
+                        "All the handlers should be set!")
+        self.assertEqual(handler_provider.touched, [],
+                         "Neither the property nor `__getattr__` should be called!")
+        for parser_name, result in (('main', 'static_main'), ('info', 'class_info'),
+                                    ('init', 'normal_function_init'), ('config', 'config')):
+            self.assertEqual(self._argcat._arg_parsers[parser_name].handler_func(), result,
+                             f"Parser handler for `{parser_name}` is wrong!")
+
+    def test_main_module_handler_provider(self) -> None:
+        """Test the handlers in the main module are found among its globals, even by other
+        names."""
+        main_module = types.ModuleType('__main__')
+        vars(main_module).update({f'value_{index}': index for index in range(1000)})
+        # Like `from module import init_handler as imported_init`.
+        main_module.imported_init = init_handler
+        main_module.main_lambda = ArgCat.handler('main')(lambda test: 'main')
+        main_module.not_a_handler = lambda detail: 'info'
+        with mock.patch.dict(sys.modules, {'__main__': main_module}):
+            self.assertTrue(self._argcat.add_main_module_as_handler_provider(),
+                            "The handlers should be set!")
+        self.assertEqual(self._argcat._arg_parsers['init'].handler_func(), 'module_init',
+                         "Parser handler for `init` is wrong!")
+        self.assertEqual(self._argcat._arg_parsers['main'].handler_func(None), 'main',
+                         "Parser handler for `main` is wrong!")
+        self.assertIsNone(self._argcat._arg_parsers['info'].handler_func,
+                          "A function not decorated should not be a handler!")
@@ -0,0 +1,182 @@
+"""All UnitTests for caching the results of ArgCat's handlers."""
+import os
+import tempfile
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestHandlerCache(ArgCatUnitTest):
+    """UnitTest class for caching the results of ArgCat's handlers."""
+    def setUp(self):
+        self._calls = []
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _make_argcat(self, **cache_options) -> ArgCat:
+        calls = self._calls
+
+        # pylint: disable=too-few-public-methods
+        class CachedHandlerProvider:
+            """A handler provider with a cached handler."""
+            @staticmethod
+            @ArgCat.handler('plan', **cache_options)
+            def plan_handler(target, steps):
+                calls.append((target, steps))
+                return [target] * steps
+
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.add_subparser('plan')
+            builder.subparser('plan').add_argument('target')
+            builder.subparser('plan').add_argument('--steps', type='int', default=1)
+            builder.add_subparser('init')
+        argcat.add_handler_provider(CachedHandlerProvider)
+        return argcat
+
+    def test_handler_cache_off(self) -> None:
+        """Test handlers are not cached without the caching options."""
+        argcat = self._make_argcat()
+        for _ in range(2):
+            argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        self.assertEqual(len(self._calls), 2, "The handler should be called every time!")
+        self.assertIsNone(argcat.handler_cache_info('plan'), "There should be no cache info!")
+
+    def test_handler_cache(self) -> None:
+        """Test the results are cached by the kwargs and the LRU is bounded."""
+        argcat = self._make_argcat(cache_size=2)
+        for args in (['plan', 'a'], ['plan', 'a'], ['plan', 'a', '--steps', '2'],
+                     ['plan', 'b'], ['plan', 'a']):
+            result = argcat.parse_args(args, subparser_ignore_main=True)
+        self.assertEqual(result, {'plan': ['a']}, "Incorrect result!")
+        self.assertEqual(self._calls, [('a', 1), ('a', 2), ('b', 1), ('a', 1)],
+                         "The handler should be called only for the args not cached!")
+        info = argcat.handler_cache_info('plan')
+        self.assertEqual((info['hits'], info['misses'], info['size'], info['maxsize']),
+                         (1, 4, 2, 2), "Incorrect handler cache info!")
+
+        argcat.invalidate_handler_cache('plan')
+        argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        self.assertEqual(len(self._calls), 5, "The handler should be called after invalidation!")
+
+    def test_handler_cache_ttl(self) -> None:
+        """Test the results expire after the TTL."""
+        argcat = self._make_argcat(cache_ttl=60)
+        with mock.patch('time.time', return_value=1000.0):
+            argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        with mock.patch('time.time', return_value=1059.0):
+            argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        self.assertEqual(len(self._calls), 1, "The result should be cached within the TTL!")
+        with mock.patch('time.time', return_value=1060.0):
+            argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        self.assertEqual(len(self._calls), 2, "The result should expire after the TTL!")
+
+    def test_handler_cache_on_disk(self) -> None:
+        """Test the results are shared through the cache dir."""
+        cache_dir = self._temp_dir.name
+        argcat = self._make_argcat(cache_dir=cache_dir)
+        argcat.parse_args(['plan', 'a', '--steps', '3'], subparser_ignore_main=True)
+
+        # The decorator is run again, so the new handler has an empty memory cache.
+        another_argcat = self._make_argcat(cache_dir=cache_dir)
+        self.assertEqual(another_argcat.parse_args(['plan', 'a', '--steps', '3'],
+                                                   subparser_ignore_main=True),
+                         {'plan': ['a', 'a', 'a']}, "Incorrect result from the disk!")
+        self.assertEqual(len(self._calls), 1, "The result should be loaded from the disk!")
+        self.assertEqual(another_argcat.handler_cache_info('plan')['disk_hits'], 1,
+                         "Incorrect disk hits!")
+
+        another_argcat.invalidate_handler_cache()
+        self.assertEqual([file_name for _, _, file_names in os.walk(cache_dir)
+                          for file_name in file_names], [],
+                         "The results on the disk should be removed!")
+        argcat.parse_args(['plan', 'b'], subparser_ignore_main=True)
+        self.assertEqual(len(self._calls), 2, "The handler should be called after invalidation!")
+
+    def test_handler_cache_dir_in_home(self) -> None:
+        """Test `~` in the cache dir is expanded to the home dir."""
+        home_dir = self._temp_dir.name
+        with mock.patch.dict(os.environ, {'HOME': home_dir}):
+            argcat = self._make_argcat(cache_dir='~/plans')
+            argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        self.assertTrue(os.path.isdir(os.path.join(home_dir, 'plans')),
+                        "The results should be saved in the home dir!")
+        self.assertFalse(os.path.exists('~'), "`~` should not be created in the current dir!")
+
+    def _make_plan_argcat(self, handler) -> ArgCat:
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.add_subparser('plan')
+            builder.subparser('plan').add_argument('target')
+        argcat.set_parser_handler('plan', handler)
+        return argcat
+
+    def test_handler_cache_of_methods(self) -> None:
+        """Test the results of a method are cached by the object it's bound to."""
+        calls = self._calls
+
+        class Planner:
+            """A planner with a cached method handler."""
+            def __init__(self, name, stable):
+                self.name = name
+                self.stable = stable
+
+            def __repr__(self):
+                return f'Planner({self.name!r})' if self.stable else super().__repr__()
+
+            @ArgCat.handler('plan', cache_size=8)
+            def plan_handler(self, target):
+                calls.append((self.name, target))
+                return f'{self.name}:{target}'
+
+        for name in ('a', 'b', 'a'):
+            argcat = self._make_plan_argcat(Planner(name, stable=True).plan_handler)
+            self.assertEqual(argcat.parse_args(['plan', 'x'], subparser_ignore_main=True),
+                             {'plan': f'{name}:x'}, "The result of another object is returned!")
+        self.assertEqual(calls, [('a', 'x'), ('b', 'x')],
+                         "The results should be cached by the repr of the object!")
+
+        argcat = self._make_plan_argcat(Planner('c', stable=False).plan_handler)
+        for _ in range(2):
+            argcat.parse_args(['plan', 'x'], subparser_ignore_main=True)
+        self.assertEqual(calls[2:], [('c', 'x'), ('c', 'x')],
+                         "An object without a stable repr should not be cached!")
+
+    def test_handler_cache_of_changed_code(self) -> None:
+        """Test the results saved by another version of the handler are not loaded."""
+        def old_plan_handler(target):
+            self._calls.append('old')
+            return 'old'
+
+        def new_plan_handler(target):
+            self._calls.append('new')
+            return 'new'
+
+        for handler in (old_plan_handler, new_plan_handler):
+            handler.__qualname__ = handler.__name__ = 'plan_handler'
+        for handler in (old_plan_handler, new_plan_handler, new_plan_handler):
+            handler = ArgCat.handler('plan', cache_dir=self._temp_dir.name)(handler)
+            self._make_plan_argcat(handler).parse_args(['plan', 'x'])
+        self.assertEqual(self._calls, ['old', 'new'],
+                         "Only the results of the same code should be loaded!")
+
+    def test_failures_not_cached(self) -> None:
+        """Test a handler raising an exception is not cached."""
+        failures = []
+
+        @ArgCat.handler('plan', cache_size=8)
+        def failing_handler(target, steps):
+            failures.append(target)
+            raise ValueError(target)
+
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.add_subparser('plan')
+            builder.subparser('plan').add_argument('target')
+            builder.subparser('plan').add_argument('--steps', type='int', default=1)
+        argcat.set_parser_handler('plan', failing_handler)
+        with mock.patch('traceback.print_exc'):
+            for _ in range(2):
+                argcat.parse_args(['plan', 'a'], subparser_ignore_main=True)
+        self.assertEqual(len(failures), 2, "Failures should not be cached!")
@@ -0,0 +1,93 @@
+"""All UnitTests for ArgCat's precomputed help."""
+import contextlib
+import io
+import os
+from argparse import ArgumentParser
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+# pylint: disable=protected-access
+class TestHelpCache(ArgCatUnitTest):
+    """UnitTest class for ArgCat's precomputed help."""
+    @staticmethod
+    def _build(argcat: ArgCat) -> ArgCat:
+        with argcat.build() as builder:
+            builder.set_prog_info(prog='tool', description='A tool.')
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true')
+            builder.add_subparser('commit', aliases=['ci'], help='Record changes.')
+            builder.subparser('commit').add_argument('-m', '--message', help='The message.')
+            builder.add_subparser('status', help='Show the status.')
+        return argcat
+
+    @staticmethod
+    def _output(argcat: ArgCat, args: list) -> tuple:
+        """Parse args and returns the stdout and the exit code."""
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            try:
+                argcat.parse_args(args)
+                code = None
+            except SystemExit as exc:
+                code = exc.code
+        return stdout.getvalue(), code
+
+    def test_same_as_argparse(self) -> None:
+        """Test the served help is the same as the one printed by argparse."""
+        for lazy_subparsers in (False, True):
+            argcat = self._build(ArgCat(lazy_subparsers=lazy_subparsers))
+            self.assertEqual(len(argcat._help_args), 8, "Incorrect args asking for the helps!")
+            for args in (['-h'], ['--help'], ['commit', '-h'], ['ci', '--help'], ['status', '-h']):
+                argparse_argcat = self._build(ArgCat(lazy_subparsers=lazy_subparsers))
+                argparse_argcat._help_args = {}
+                help_text, code = self._output(argcat, args)
+                self.assertEqual((help_text, code), self._output(argparse_argcat, args),
+                                 f"The help of `{args}` should be the same as argparse's!")
+                self.assertEqual(code, 0, "The help should exit with 0!")
+                self.assertTrue(help_text.startswith('usage: tool'), "Incorrect help!")
+
+    def test_rendered_once(self) -> None:
+        """Test the help is rendered by argparse only once for each terminal width."""
+        argcat = self._build(ArgCat(lazy_subparsers=True))
+        with mock.patch.object(ArgumentParser, 'format_help', autospec=True,
+                               side_effect=ArgumentParser.format_help) as mock_format_help:
+            first_help = self._output(argcat, ['commit', '-h'])[0]
+            self.assertEqual(self._output(argcat, ['ci', '-h'])[0], first_help,
+                             "The alias should be served the same help!")
+            self.assertEqual(mock_format_help.call_count, 1, "The help should be rendered once!")
+            with mock.patch('shutil.get_terminal_size', return_value=os.terminal_size((40, 24))):
+                narrow_help = self._output(argcat, ['commit', '-h'])[0]
+            self.assertEqual(mock_format_help.call_count, 2,
+                             "The help should be rendered again in another width!")
+        self.assertTrue(all(len(line) <= 40 for line in narrow_help.splitlines()),
+                        "The help should be wrapped in the new width!")
+
+    def test_usage_in_compiled_spec(self) -> None:
+        """Test the usage compiled into a spec is served without rendering it again."""
+        spec = self._build(ArgCat()).compile_spec()
+        argcat = ArgCat.from_spec(spec)
+        with mock.patch.object(ArgumentParser, 'format_usage') as mock_format_usage:
+            self.assertIn('usage: tool', self._output(argcat, [])[0],
+                          "The default main handler should print the compiled usage!")
+        mock_format_usage.assert_not_called()
+        self.assertEqual(list(argcat._arg_parsers), ['main'], "No subparser should be built!")
+
+    def test_left_to_argparse(self) -> None:
+        """Test the args which can be parsed differently are left to argparse."""
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.main_parser().add_argument('target', nargs='?')
+            builder.add_subparser('run', add_help=False)
+            builder.add_subparser('stop')
+        self.assertEqual(sorted(argcat._help_args.values()), ['main', 'main'],
+                         "A subcommand could be the positional of the main parser!")
+
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.set_prog_info(add_help=False)
+            builder.add_subparser('run', add_help=False)
+            builder.add_subparser('stop', conflict_handler='resolve')
+            builder.subparser('stop').add_argument('--help', action='store_true')
+        self.assertEqual(argcat._help_args, {('stop', '-h'): 'stop'},
+                         "The parsers without the help option should be left to argparse!")
+        self.assertEqual(self._output(argcat, ['stop', '--help'])[1], None,
+                         "`--help` of `stop` should be parsed as its own argument!")
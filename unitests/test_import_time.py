@@ -0,0 +1,71 @@
+"""UnitTests for the import time of ArgCat."""
+import os
+import subprocess
+import sys
+from typing import Dict, Tuple
+from unitests.argcat_unittest import ArgCatUnitTest
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _import_times(module_name: str) -> Dict[str, Tuple[int, int]]:
+    """Import `module_name` in a new interpreter with `-X importtime`.
+
+    Returns a dict of every module imported to its (self, cumulative) import time in microseconds.
+    """
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+                            cwd=_PACKAGE_DIR, capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_time), int(cumulative_time))
+    return times
+
+class TestImportTime(ArgCatUnitTest):
+    """UnitTest class for the import time of ArgCat."""
+    # The modules which are only needed by handler registration, error reporting, caching,
+    # printing or type checking, and so must not be imported by `import argcat`.
+    DEFERRED_MODULES = ('inspect', 'traceback', 'pydoc', 'copy', 'json', 'hashlib', 'shutil',
+                        'typing', 'contextlib', 'asyncio', 'concurrent.futures', 'socket',
+                        'pickle')
+    # The budget of the modules imported by `import argcat`, as a ratio of `import argparse` alone,
+    # which ArgCat can never be faster than. A ratio is used rather than a fixed time so the test
+    # does not depend on the speed of the machine.
+    BUDGET_RATIO = 1.5
+    ROUNDS = 3
+
+    def test_deferred_modules(self) -> None:
+        """Test the heavy modules are not imported by `import argcat`."""
+        imported_modules = set(_import_times('argcat')) - set(_import_times('sys'))
+        self.assertEqual(sorted(imported_modules.intersection(self.DEFERRED_MODULES)), [],
+                         "These modules should be imported only when they are used!")
+
+    def test_import_time_budget(self) -> None:
+        """Test the modules imported by `import argcat` are within the budget."""
+        # The self time of argcat is left out, since it's mostly compiling argcat.py if the
+        # bytecode is not cached.
+        argcat_time = min(cumulative_time - self_time for self_time, cumulative_time in
+                          (_import_times('argcat')['argcat'] for _ in range(self.ROUNDS)))
+        argparse_time = min(_import_times('argparse')['argparse'][1] for _ in range(self.ROUNDS))
+        self.assertLessEqual(argcat_time, argparse_time * self.BUDGET_RATIO,
+                             f"Importing the modules for argcat takes {argcat_time} us, which is " +
+                             f"over the budget of {self.BUDGET_RATIO} x {argparse_time} us " +
+                             "of argparse!")
+
+    def test_lazy_startup_without_threading(self) -> None:
+        """Test building and parsing with lazy subparsers and the parse cache, which are guarded by
+        locks, don't import threading."""
+        script = ("import sys\n"
+                  "from argcat import ArgCat\n"
+                  "argcat = ArgCat(lazy_subparsers=True, parse_cache_size=8)\n"
+                  "with argcat.build() as builder:\n"
+                  "    builder.add_subparser('run')\n"
+                  "    builder.subparser('run').add_argument('target')\n"
+                  "argcat.set_parser_handler('run', lambda target: target)\n"
+                  "assert argcat.parse_args(['run', 'all']) == {'run': 'all'}\n"
+                  "print('threading' in sys.modules)\n")
+        output = subprocess.run([sys.executable, '-c', script], cwd=_PACKAGE_DIR,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'False', "threading should not be imported!")
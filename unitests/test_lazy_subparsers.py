@@ -0,0 +1,87 @@
+"""All UnitTests for ArgCat's lazy subparsers."""
+import contextlib
+import io
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+# pylint: disable=protected-access
+class TestLazySubparsers(ArgCatUnitTest):
+    """UnitTest class for ArgCat's lazy subparsers."""
+    def setUp(self):
+        self._argcat = ArgCat(lazy_subparsers=True)
+        with self._argcat.build() as builder:
+            builder.main_parser().add_argument('-d', '--debug', action='store_true', default=False)
+            builder.add_subparser('init', help='Initialize something.')
+            builder.add_subparser('info', help='Show information of something.')
+            builder.subparser('info').add_argument('detail', nargs='?', type='str')
+            builder.add_subparser('config', help="Config something.")
+            builder.subparser('config').add_group('a_group', is_mutually_exclusive=True)
+            builder.subparser('config').add_argument('-n', '--name', dest='name', type='str',
+                                                     group='a_group')
+            builder.subparser('config').add_argument('-u', '--username', dest='user_name',
+                                                     type='str', group='a_group')
+
+    def test_subparsers_are_not_built(self) -> None:
+        """Test only the main parser is built after the build."""
+        self.assertEqual(list(self._argcat._arg_parsers), ['main'],
+                         "Only `main` parser should be built in lazy mode!")
+        self.assertEqual(self._argcat._lazy_parser_names, {'init', 'info', 'config'},
+                         "All subparsers should be stubs in lazy mode!")
+
+    def test_only_selected_subparser_is_built(self) -> None:
+        """Test parse_args() builds the selected subparser only."""
+        def info_handler(debug, detail):
+            return f'info {debug} {detail}'
+        self.assertTrue(self._argcat.set_parser_handler('info', info_handler),
+                        "Handler for a lazy parser should be accepted!")
+        result = self._argcat.parse_args(['info', 'this'])
+        self.assertEqual(result, {'info': 'info False this'},
+                         "Incorrect result for the lazy `info` parser!")
+        self.assertEqual(set(self._argcat._arg_parsers), {'main', 'info'},
+                         "Only `main` and `info` parsers should be built!")
+        self.assertEqual(self._argcat._arg_parsers['info'].dests, ['detail'],
+                         "`info` parser's dests are incorrect!")
+        self.assertEqual(self._argcat._arg_parsers['info'].handler_func, info_handler,
+                         "Pending handler of `info` should be set after being built!")
+        # Parse again with the built parser.
+        result = self._argcat.parse_args(['-d', 'info'])
+        self.assertEqual(result, {'main': {'debug': True}, 'info': 'info True None'},
+                         "Incorrect result for the built `info` parser!")
+
+    def test_incorrect_pending_handler(self) -> None:
+        """Test an incorrect handler for a lazy parser is dropped once the parser is built."""
+        def config_handler(name):
+            return f'config {name}'
+        self._argcat.set_parser_handler('config', config_handler)
+        self.assertFalse(self._argcat.set_parser_handler('config', config_handler),
+                         "Multiple handlers for a lazy parser should not be accepted!")
+        result = self._argcat.parse_args(['config', '-n', 'cat'])
+        self.assertEqual(result, {'config': None},
+                         "Incorrect handler for `config` should not be called!")
+        self.assertIsNone(self._argcat._arg_parsers['config'].handler_func,
+                          "Incorrect handler for `config` should not be set!")
+        self.assertTrue(self._argcat._arg_parsers['config'].groups['a_group'],
+                        "`config` parser's group should be built!")
+
+    def test_help_lists_lazy_subparsers(self) -> None:
+        """Test the main parser's help lists all subparsers without building them."""
+        help_str = self._argcat._arg_parsers['main'].parser.format_help()
+        for parser_name in ['init', 'info', 'config', 'Initialize something.']:
+            self.assertIn(parser_name, help_str, f"`{parser_name}` should be in the help!")
+        self.assertEqual(list(self._argcat._arg_parsers), ['main'],
+                         "Formatting help should not build any subparser!")
+
+    def test_failed_materialization(self) -> None:
+        """Test a subparser failing to be built raises the same error on every parse."""
+        argcat = ArgCat(lazy_subparsers=True)
+        with argcat.build() as builder:
+            builder.add_subparser('broken')
+            builder.subparser('broken').add_argument('-x')
+            builder.subparser('broken').add_argument('-x')
+        for _ in range(2):
+            with contextlib.redirect_stderr(io.StringIO()) as stderr, \
+                self.assertRaises(SystemExit, msg="The parse should fail!"):
+                argcat.parse_args(['broken'])
+            self.assertIn('conflicting option string: -x', stderr.getvalue(),
+                          "The error of building the parser should be reported!")
+        self.assertEqual(argcat._lazy_parser_names, {'broken'}, "`broken` should be a stub!")
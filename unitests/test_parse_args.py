@@ -192,3 +192,24 @@ class TestParseArgs(ArgCatUnitTest):
         # -f/--file`
         self._argcat.print_parser_handlers()
         self._argcat.print_parsers()
+
+    def test_split_namespace(self) -> None:
+        """Test splitting the parsed Namespace with the dest partitions of the main parser."""
+        with self._argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true')
+            builder.main_parser().add_argument('-d', '--debug', action='store_true')
+            builder.add_subparser('process')
+            builder.subparser('process').add_argument('-f', '--file', dest='filename')
+
+        # pylint: disable=protected-access
+        main_parser = self._argcat._arg_parsers['main']
+        self.assertEqual(main_parser.dests_for_subparser, ['debug'],
+                         "Only the dests not ignored by subparser should be shared.")
+
+        self.assertEqual(main_parser.parse_args(['-v', 'process', '-f', 'foo.py']),
+                         ('process', {'debug': False, 'filename': 'foo.py'},
+                          {'verbose': True, 'debug': False}),
+                         "Failed to split the arguments for both main parser and sub parser.")
+        self.assertEqual(main_parser.parse_args(['-d']),
+                         (None, None, {'verbose': False, 'debug': True}),
+                         "The arguments for sub parser should be None without a sub parser.")
@@ -0,0 +1,118 @@
+"""All UnitTests for ArgCat's parse cache."""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestParseCache(ArgCatUnitTest):
+    """UnitTest class for ArgCat's parse cache."""
+    @staticmethod
+    def _build(argcat: ArgCat) -> None:
+        with argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose',
+                                                         action='store_true')
+            builder.add_subparser('add')
+            builder.subparser('add').add_argument('x', type='int')
+            builder.subparser('add').add_argument('y', type='int')
+            builder.add_subparser('tag')
+            builder.subparser('tag').add_argument('--name', dest='names', action='append',
+                                                  default=[])
+
+    @staticmethod
+    def _append_handler(names):
+        names.append('appended')
+        return names
+
+    def test_parse_cache_off(self) -> None:
+        """Test there is no parse cache by default."""
+        argcat = ArgCat()
+        self._build(argcat)
+        self.assertIsNone(argcat.parse_cache_info(), "The parse cache should be off by default!")
+
+    def test_parse_cache(self) -> None:
+        """Test the repeated args are parsed by argparse only once and the LRU is bounded."""
+        for lazy_subparsers in (False, True):
+            argcat = ArgCat(lazy_subparsers=lazy_subparsers, parse_cache_size=2)
+            self._build(argcat)
+            argcat.set_parser_handler('add', lambda x, y: x + y)
+            argcat.parse_args(['add', '1', '2'], subparser_ignore_main=True)
+            main_parser = argcat._arg_parsers['main'].parser
+            with mock.patch.object(main_parser, 'parse_args',
+                                   wraps=main_parser.parse_args) as mock_parse_args:
+                for _ in range(3):
+                    self.assertEqual(argcat.parse_args(['add', '1', '2'],
+                                                       subparser_ignore_main=True),
+                                     {'add': 3}, "Incorrect result from the cache!")
+                mock_parse_args.assert_not_called()
+
+                argcat.parse_args(['add', '3', '4'], subparser_ignore_main=True)
+                argcat.parse_args(['add', '5', '6'], subparser_ignore_main=True)
+                argcat.parse_args(['add', '1', '2'], subparser_ignore_main=True)
+                self.assertEqual(mock_parse_args.call_count, 3,
+                                 "The least recently used args should be evicted!")
+            info = argcat.parse_cache_info()
+            self.assertEqual((info['hits'], info['size'], info['maxsize']), (3, 2, 2),
+                             "Incorrect parse cache info!")
+
+    def test_errors_not_cached(self) -> None:
+        """Test the args failed to parse are never cached."""
+        argcat = ArgCat(parse_cache_size=8)
+        self._build(argcat)
+        for _ in range(2):
+            with contextlib.redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit, msg="Invalid args should exit every time!"):
+                argcat.parse_args(['add', '1', 'two'])
+        self.assertEqual(argcat.parse_cache_info()['size'], 0, "Errors should not be cached!")
+
+    def test_mutable_defaults(self) -> None:
+        """Test a handler changing its kwargs never changes the cached ones."""
+        argcat = ArgCat(parse_cache_size=8)
+        self._build(argcat)
+        argcat.set_parser_handler('tag', self._append_handler, 'append_handler')
+        for _ in range(3):
+            self.assertEqual(argcat.parse_args(['tag', '--name', 'a'],
+                                               subparser_ignore_main=True),
+                             {'tag': ['a', 'appended']}, "The cached kwargs are changed!")
+            self.assertEqual(argcat.parse_args(['tag'], subparser_ignore_main=True),
+                             {'tag': ['appended']}, "The cached default is changed!")
+
+    def test_invalidation(self) -> None:
+        """Test the cache is invalidated when a handler is set or the parsers are built again."""
+        argcat = ArgCat(parse_cache_size=8)
+        self._build(argcat)
+        argcat.parse_args(['add', '1', '2'])
+        argcat.set_parser_handler('add', lambda x, y: x * y)
+        self.assertEqual(argcat.parse_cache_info()['size'], 0,
+                         "Setting a handler should invalidate the cache!")
+
+        argcat.parse_args(['add', '1', '2'])
+        self._build(argcat)
+        info = argcat.parse_cache_info()
+        self.assertEqual((info['size'], info['invalidations']), (0, 2),
+                         "Building again should invalidate the cache!")
+        self.assertEqual(argcat.parse_args(['add', '1', '2']), {'add': None},
+                         "The parsers built again, which have no handler, should be used!")
+
+    def test_values_with_side_effects(self) -> None:
+        """Test the args whose values have side effects, such as opened files, are never cached."""
+        argcat = ArgCat(parse_cache_size=8)
+        with argcat.build() as builder:
+            builder.add_subparser('read')
+            builder.subparser('read').add_argument('file', type=argparse.FileType('r'))
+        files = []
+        argcat.set_parser_handler('read', lambda file: files.append(file) or file.read())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'input.txt')
+            with open(path, 'w', encoding='utf-8') as input_file:
+                input_file.write('content')
+            for _ in range(2):
+                self.assertEqual(argcat.parse_args(['read', path], subparser_ignore_main=True),
+                                 {'read': 'content'}, "The file should be opened every time!")
+            for file in files:
+                file.close()
+        self.assertIsNot(files[0], files[1], "The file should not be replayed from the cache!")
+        self.assertEqual(argcat.parse_cache_info()['size'], 0, "Files should not be cached!")
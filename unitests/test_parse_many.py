@@ -0,0 +1,75 @@
+"""All UnitTests for ArgCat's parse_many()."""
+import contextlib
+import io
+import sys
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestParseMany(ArgCatUnitTest):
+    """UnitTest class for ArgCat's parse_many()."""
+    def setUp(self):
+        self._argcat = ArgCat()
+        with self._argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true',
+                                                         default=False)
+            builder.add_subparser('add')
+            builder.subparser('add').add_argument('x', type='int')
+            builder.subparser('add').add_argument('y', type='int')
+        self._argcat.set_parser_handler('add', lambda x, y: x + y)
+
+    def test_parse_many(self) -> None:
+        """Test parse_many() returns results and errors in order without exiting."""
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            results = self._argcat.parse_many([['add', '1', '2'],
+                                               ['add', '1', 'two'],
+                                               ['sub', '1', '2'],
+                                               ('add', '3', '4')])
+        self.assertEqual(stderr.getvalue(), '', "Errors should not be printed!")
+        self.assertEqual([result.succeeded for result in results], [True, False, False, True],
+                         "Incorrect succeeded flags for the results!")
+        self.assertEqual(results[0].result, {'add': 3}, "Incorrect result for the first args!")
+        self.assertEqual(results[3].result, {'add': 7}, "Incorrect result for the last args!")
+        self.assertEqual(results[3].args, ['add', '3', '4'], "Args should be kept as a list!")
+
+        self.assertEqual(results[1].exit_status, 2, "Errors should have the exit status 2!")
+        self.assertIn("invalid int value: 'two'", results[1].error,
+                      "Incorrect error for the invalid int!")
+        self.assertTrue(results[1].usage.startswith('usage:') and 'add' in results[1].usage,
+                        "The usage should be from the `add` parser!")
+        self.assertIsNone(results[1].result, "Failed args should not have any result!")
+        self.assertIn("invalid choice: 'sub'", results[2].error,
+                      "Incorrect error for the unknown subparser!")
+
+    def test_parse_many_with_help(self) -> None:
+        """Test `-h` in parse_many() is recorded with its exit status."""
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            results = self._argcat.parse_many([['-h'], ['add', '5', '6']])
+        self.assertIn('usage:', stdout.getvalue(), "Help should be printed as usual!")
+        self.assertEqual(results[0].exit_status, 0, "`-h` should have the exit status 0!")
+        self.assertIsNone(results[0].error, "`-h` should not have any error!")
+        self.assertEqual(results[1].result, {'add': 11}, "Parsing should go on after `-h`!")
+
+    def test_parse_args_still_exits(self) -> None:
+        """Test parse_args() still exits on errors after parse_many()."""
+        self._argcat.parse_many([['add', 'x', 'y']])
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                self._argcat.parse_args(['add', 'x', 'y'])
+
+    def test_exit_without_status(self) -> None:
+        """Test an exit without a status from a type or an action is not a success."""
+        def exiting_type(value):
+            sys.exit(None if value == 'none' else value)
+
+        argcat = ArgCat()
+        with argcat.build() as builder:
+            builder.add_subparser('quit')
+            builder.subparser('quit').add_argument('code', type=exiting_type)
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            results = argcat.parse_many([['quit', 'none'], ['quit', 'bye']])
+        self.assertEqual([(result.succeeded, result.exit_status) for result in results],
+                         [(False, 0), (False, 1)],
+                         "The exit status should be the same as the interpreter's!")
+        self.assertEqual(stderr.getvalue(), 'bye\n', "A message exit should be printed!")
@@ -0,0 +1,81 @@
+"""All UnitTests for ArgCat's parse_stream()."""
+import contextlib
+import io
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestParseStream(ArgCatUnitTest):
+    """UnitTest class for ArgCat's parse_stream()."""
+    def setUp(self):
+        self._argcat = ArgCat()
+        with self._argcat.build() as builder:
+            builder.add_subparser('echo')
+            builder.subparser('echo').add_argument('words', nargs='*')
+            builder.add_subparser('add')
+            builder.subparser('add').add_argument('x', type='int')
+            builder.subparser('add').add_argument('y', type='int')
+        self._echoed = []
+
+        def echo_handler(words):
+            self._echoed.append(words)
+            return ' '.join(words)
+        self._argcat.set_parser_handler('echo', echo_handler)
+        self._argcat.set_parser_handler('add', lambda x, y: x + y)
+
+    def test_parse_stream(self) -> None:
+        """Test each line is split like a shell and results and errors are yielded in order."""
+        stream = io.StringIO("echo 'hello world' \"!\"\n" +
+                             "\n" +
+                             "# A comment line.\n" +
+                             "add 1 two\n" +
+                             "echo 'unclosed\n" +
+                             "add 1 2  # A trailing comment.\n")
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            results = list(self._argcat.parse_stream(stream, subparser_ignore_main=True))
+        self.assertEqual(stderr.getvalue(), '', "Errors should not be printed!")
+        self.assertEqual([result.line_number for result in results], [1, 4, 5, 6],
+                         "Blank and comment lines should be skipped!")
+        self.assertEqual(results[0].args, ['echo', 'hello world', '!'],
+                         "The line should be split like a shell!")
+        self.assertEqual(results[0].result, {'echo': 'hello world !'}, "Incorrect echo result!")
+        self.assertIn("invalid int value: 'two'", results[1].error,
+                      "Incorrect error for the invalid int!")
+        self.assertEqual(results[2].exit_status, 2, "A line not split should be an error!")
+        self.assertIn('quotation', results[2].error, "Incorrect error for the unclosed quote!")
+        self.assertEqual(results[3].result, {'add': 3}, "Parsing should go on after errors!")
+
+    def test_parse_stream_is_lazy(self) -> None:
+        """Test a line is handled before the next line is read."""
+        handled = self._echoed
+
+        def lines():
+            for index in range(3):
+                self.assertEqual(len(handled), index, "Lines should not be read ahead!")
+                yield f'echo {index}\n'
+
+        for result in self._argcat.parse_stream(lines(), subparser_ignore_main=True):
+            self.assertEqual(handled[-1], [str(result.line_number - 1)],
+                             "The result should be yielded once its line is handled!")
+        self.assertEqual(len(handled), 3, "All lines should be handled!")
+
+    def test_parse_stream_flush(self) -> None:
+        """Test stdout is flushed by the interval and at the end of the stream."""
+        with mock.patch('sys.stdout') as mock_stdout:
+            results = self._argcat.parse_stream(io.StringIO('add 1 2\n' * 3), flush_interval=0)
+            next(results)
+            self.assertEqual(mock_stdout.flush.call_count, 1, "Stdout should be flushed!")
+            list(results)
+            self.assertEqual(mock_stdout.flush.call_count, 4,
+                             "Stdout should be flushed for each line and at the end!")
+
+        with mock.patch('sys.stdout') as mock_stdout:
+            list(self._argcat.parse_stream(io.StringIO('add 1 2\n' * 3), flush_interval=3600))
+            self.assertEqual(mock_stdout.flush.call_count, 1,
+                             "Stdout should be flushed only at the end!")
+
+    def test_parse_stream_from_stdin(self) -> None:
+        """Test stdin is the default stream."""
+        with mock.patch('sys.stdin', io.StringIO('add 3 4\n')):
+            results = list(self._argcat.parse_stream(subparser_ignore_main=True))
+        self.assertEqual(results[0].result, {'add': 7}, "Lines should be read from stdin!")
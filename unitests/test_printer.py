@@ -0,0 +1,49 @@
+"""All UnitTests for ArgCat's printer."""
+import contextlib
+import io
+from argcat import _ArgCatPrinter, _ArgCatPrintLevel
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class _FormatCounter:
+    """An object counting how many times it's formatted."""
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return 'formatted'
+
+class TestPrinter(ArgCatUnitTest):
+    """UnitTest class for ArgCat's printer."""
+    def setUp(self):
+        self._filter_level = _ArgCatPrinter.filter_level
+
+    def tearDown(self):
+        _ArgCatPrinter.set_filter_level(self._filter_level)
+
+    def test_deferred_formatting(self) -> None:
+        """Test the arguments of a filtered out message are never formatted."""
+        counter = _FormatCounter()
+        _ArgCatPrinter.set_filter_level(_ArgCatPrintLevel.IF_NECESSARY)
+        self.assertFalse(_ArgCatPrinter.is_enabled(_ArgCatPrintLevel.VERBOSE),
+                         "VERBOSE should be disabled!")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            _ArgCatPrinter.print("Value: `%s`.", counter)
+        self.assertEqual(counter.count, 0, "A filtered out message should not be formatted!")
+        self.assertEqual(output.getvalue(), '', "A filtered out message should not be printed!")
+
+        _ArgCatPrinter.set_filter_level(_ArgCatPrintLevel.VERBOSE)
+        with contextlib.redirect_stdout(output):
+            _ArgCatPrinter.print("Value: `%s`.", counter)
+        self.assertEqual(counter.count, 1, "A displayed message should be formatted once!")
+        self.assertEqual(output.getvalue(), "<ArgCat> [ LOG ]: Value: `formatted`.\n",
+                         "The message is not formatted correctly!")
+
+    def test_message_without_args(self) -> None:
+        """Test a message without args is printed as it is, even if it contains `%`."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            _ArgCatPrinter.print("100% cute", level=_ArgCatPrintLevel.ERROR, indent=1)
+        self.assertEqual(output.getvalue(), "  [ #ERROR# ]: 100% cute\n",
+                         "The message without args should not be formatted!")
@@ -0,0 +1,57 @@
+"""All UnitTests for ArgCat's handler profiling."""
+import os
+import pstats
+import tempfile
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+def _load_handler(file):
+    """A handler to profile."""
+    return sorted(file)
+
+class TestProfile(ArgCatUnitTest):
+    """UnitTest class for ArgCat's handler profiling."""
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._profile_dir = os.path.join(self._temp_dir.name, 'profiles')
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    @staticmethod
+    def _build(argcat: ArgCat) -> None:
+        with argcat.build() as builder:
+            builder.add_subparser('load')
+            builder.subparser('load').add_argument('file')
+        argcat.set_parser_handler('load', _load_handler)
+
+    def test_profile(self) -> None:
+        """Test every invocation of the handler dumps a profile named after the subcommand."""
+        argcat = ArgCat(profile_dir=self._profile_dir)
+        self._build(argcat)
+        for _ in range(2):
+            self.assertEqual(argcat.parse_args(['load', 'cba'], subparser_ignore_main=True),
+                             {'load': ['a', 'b', 'c']}, "Incorrect result with profiling!")
+
+        pid = os.getpid()
+        self.assertEqual(sorted(os.listdir(self._profile_dir)),
+                         [f'load.{pid}.1.pstats', f'load.{pid}.2.pstats'],
+                         "Incorrect profiles dumped!")
+        stats = pstats.Stats(os.path.join(self._profile_dir, f'load.{pid}.1.pstats'))
+        self.assertIn('_load_handler', [function_name for _, _, function_name in stats.stats],
+                      "The handler should be profiled!")
+
+    def test_profile_by_environment_variable(self) -> None:
+        """Test the profiling is turned on by the environment variable only."""
+        argcat = ArgCat()
+        self._build(argcat)
+        argcat.parse_args(['load', 'a'], subparser_ignore_main=True)
+        self.assertFalse(os.path.exists(self._profile_dir), "Nothing should be profiled!")
+
+        with mock.patch.dict(os.environ, {ArgCat.PROFILE_ENV_VAR: self._profile_dir}):
+            argcat = ArgCat()
+        self._build(argcat)
+        argcat.parse_args(['load', 'a'], subparser_ignore_main=True)
+        self.assertEqual(os.listdir(self._profile_dir), [f'load.{os.getpid()}.1.pstats'],
+                         "The handler should be profiled!")
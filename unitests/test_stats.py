@@ -0,0 +1,77 @@
+"""All UnitTests for ArgCat's stats()."""
+import contextlib
+import io
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+class TestStats(ArgCatUnitTest):
+    """UnitTest class for ArgCat's stats()."""
+    @staticmethod
+    def _build(argcat: ArgCat) -> None:
+        with argcat.build() as builder:
+            builder.main_parser().add_argument('-v', '--verbose', action='store_true')
+            builder.add_subparser('init')
+            builder.add_subparser('load')
+            builder.subparser('load').add_argument('file')
+
+        def load_handler(verbose, file):
+            if file == 'broken':
+                raise ValueError(file)
+            return file
+        argcat.set_parser_handler('init', lambda verbose: 'init')
+        argcat.set_parser_handler('load', load_handler)
+
+    def test_stats_off(self) -> None:
+        """Test there are no stats without the instrumentation."""
+        argcat = ArgCat()
+        self._build(argcat)
+        argcat.parse_args(['init'], subparser_ignore_main=True)
+        self.assertIsNone(argcat.stats(), "There should be no stats by default!")
+
+    def test_stats(self) -> None:
+        """Test the phases and the dispatches recorded."""
+        for lazy_subparsers in (False, True):
+            argcat = ArgCat(lazy_subparsers=lazy_subparsers, stats=True)
+            self._build(argcat)
+            argcat.parse_args(['init'], subparser_ignore_main=True)
+            argcat.parse_args(['load', 'a_file'], subparser_ignore_main=True)
+            with contextlib.redirect_stderr(io.StringIO()), \
+                contextlib.redirect_stdout(io.StringIO()):
+                argcat.parse_args(['load', 'broken'], subparser_ignore_main=True)
+                with self.assertRaises(SystemExit, msg="An invalid args should exit!"):
+                    argcat.parse_args(['unknown'])
+
+            stats = argcat.stats()
+            phases = stats['phases']
+            for phase in ('build', 'create_parsers', 'tokenize', 'split', 'dispatch'):
+                self.assertIn(phase, phases, f"`{phase}` should be recorded!")
+            self.assertEqual(('materialize' in phases), lazy_subparsers,
+                             "`materialize` should be recorded for lazy subparsers only!")
+            self.assertEqual((phases['tokenize']['count'], phases['tokenize']['failed']), (4, 1),
+                             "Incorrect tokenize count!")
+            self.assertEqual(phases['split']['count'], 3, "Incorrect split count!")
+            self.assertLessEqual(phases['dispatch']['min'], phases['dispatch']['max'],
+                                 "Incorrect min and max!")
+
+            dispatches = stats['dispatches']
+            self.assertEqual(sorted(dispatches), ['init', 'load'], "Incorrect dispatches!")
+            self.assertEqual((dispatches['load']['count'], dispatches['load']['failed']), (2, 1),
+                             "Incorrect dispatch count of `load`!")
+            self.assertEqual(sum(dispatches['load']['histogram']['counts']), 2,
+                             "Every dispatch should be in the histogram!")
+
+            argcat.reset_stats()
+            self.assertEqual(argcat.stats(), {'phases': {}, 'dispatches': {}},
+                             "The stats should be cleared!")
+
+    def test_stats_callback(self) -> None:
+        """Test the callback is called for every phase recorded."""
+        records = []
+        argcat = ArgCat(stats_callback=lambda *record: records.append(record))
+        self._build(argcat)
+        argcat.parse_args(['load', 'a_file'], subparser_ignore_main=True)
+        self.assertEqual([record[0] for record in records],
+                         ['build', 'create_parsers', 'tokenize', 'split', 'dispatch'],
+                         "Incorrect phases recorded!")
+        self.assertEqual(records[-1][2], 'load', "The parser of the dispatch should be given!")
+        self.assertIsNotNone(argcat.stats(), "A callback should turn the stats on!")
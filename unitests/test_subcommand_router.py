@@ -0,0 +1,142 @@
+"""All UnitTests for ArgCat's subcommand router."""
+import contextlib
+import io
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+# pylint: disable=protected-access
+class TestSubcommandRouter(ArgCatUnitTest):
+    """UnitTest class for ArgCat's subcommand router."""
+    @staticmethod
+    def _build(argcat: ArgCat) -> None:
+        with argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', action='store_true')
+            builder.main_parser().add_exclusive_argument('-o', '--output', default='out')
+            builder.main_parser().add_exclusive_argument('--level', nargs='?', const=1)
+            builder.add_subparser('commit', aliases=['ci'])
+            builder.subparser('commit').add_argument('-m', '--message', default='')
+            builder.subparser('commit').add_argument('files', nargs='*')
+            builder.add_subparser('config')
+            builder.subparser('config').add_argument('key')
+            builder.subparser('config').add_argument('--indent', type='int', default=2)
+            builder.add_subparser('status')
+
+    def _parse(self, argcat: ArgCat, args: list):
+        """Parse args without exiting, and returns the parsed tuple or the error."""
+        parsed, error_result = argcat._try_parse(args)
+        if error_result is not None:
+            return error_result.exit_status, error_result.error
+        return parsed
+
+    def test_same_as_argparse(self) -> None:
+        """Test the routed args are parsed the same as argparse does."""
+        for lazy_subparsers in (False, True):
+            routed_argcat = ArgCat(lazy_subparsers=lazy_subparsers, route_subcommands=True)
+            argcat = ArgCat(lazy_subparsers=lazy_subparsers)
+            self._build(routed_argcat)
+            self._build(argcat)
+            self.assertIsNotNone(routed_argcat._router, "The router should be on!")
+            with mock.patch.object(routed_argcat._router, 'split',
+                                   wraps=routed_argcat._router.split) as mock_split:
+                for args in (['commit', '-m', 'msg', 'a', 'b'],
+                             ['-v', '-o', 'file', 'commit', 'a'],
+                             ['--output=file', 'config', 'name'],
+                             ['config', 'name', '--indent', '4'],
+                             ['-o', 'file', 'config', 'name', '--indent', '4'],
+                             ['--level', 'status'],
+                             ['--verb', 'status'],
+                             ['-v', '--', 'status'],
+                             ['status', 'extra'],
+                             ['config'],
+                             ['-o'],
+                             ['unknown'],
+                             ['-v'],
+                             []):
+                    self.assertEqual(self._parse(routed_argcat, args), self._parse(argcat, args),
+                                     f"`{args}` should be parsed the same as argparse does!")
+            self.assertGreater(mock_split.call_count, 0, "The router should be used!")
+
+    def test_aliases_and_abbreviations(self) -> None:
+        """Test the aliases and the unique abbreviations are routed to the subparser names."""
+        argcat = ArgCat(allow_subcommand_abbrev=True)
+        self._build(argcat)
+        argcat.set_parser_handler('commit', lambda message, files: files)
+        for args in (['ci', 'a'], ['comm', 'a'], ['-v', 'com', 'a']):
+            self.assertEqual(argcat.parse_args(args, subparser_ignore_main=True), {'commit': ['a']},
+                             f"`{args}` should be routed to `commit`!")
+        self.assertEqual(self._parse(argcat, ['st'])[0], 'status', "`st` should be `status`!")
+        exit_status, error = self._parse(argcat, ['co'])
+        self.assertEqual(exit_status, 2, "An ambiguous abbreviation should be an error!")
+        self.assertIn("ambiguous choice: 'co' could match commit, config", error,
+                      "Incorrect error for the ambiguous abbreviation!")
+
+        argcat = ArgCat(route_subcommands=True)
+        self._build(argcat)
+        self.assertEqual(self._parse(argcat, ['stat'])[0], 2,
+                         "Abbreviations should not be allowed by default!")
+
+    def test_abbreviations_left_to_argparse(self) -> None:
+        """Test the aliases and the abbreviations are resolved the same way when the router leaves
+        the args to argparse."""
+        for lazy_subparsers in (False, True):
+            argcat = ArgCat(lazy_subparsers=lazy_subparsers, allow_subcommand_abbrev=True)
+            self._build(argcat)
+            for args in (['--lev', '2', 'stat'], ['--level', '3', 'st'], ['--lev', '2', 'ci']):
+                self.assertIsNone(argcat._router.split(args),
+                                  f"`{args}` should be left to argparse!")
+            self.assertEqual(self._parse(argcat, ['--lev', '2', 'stat'])[0], 'status',
+                             "`stat` should be `status` after an abbreviated option!")
+            self.assertEqual(self._parse(argcat, ['--level', '3', 'st'])[0], 'status',
+                             "`st` should be `status` after an option of optional value!")
+            self.assertEqual(self._parse(argcat, ['--lev', '2', 'ci'])[0], 'commit',
+                             "The alias `ci` should be `commit`!")
+            exit_status, error = self._parse(argcat, ['--lev', '2', 'co'])
+            self.assertEqual(exit_status, 2, "An ambiguous abbreviation should be an error!")
+            self.assertIn("ambiguous choice: 'co' could match commit, config", error,
+                          "Incorrect error for the ambiguous abbreviation!")
+
+        # A main option of an optional value, which the router can't count.
+        argcat = ArgCat(allow_subcommand_abbrev=True)
+        with argcat.build() as builder:
+            builder.main_parser().add_exclusive_argument('-v', '--verbose', nargs='?', const=1)
+            builder.add_subparser('status')
+            builder.subparser('status').add_argument('-s', '--short', action='store_true')
+        argcat.set_parser_handler('status', lambda short: short)
+        self.assertEqual(argcat.parse_args(['-v', '1', 'stat', '-s'], subparser_ignore_main=True),
+                         {'status': True}, "`stat` should be dispatched to `status`!")
+
+    def test_main_parser_skipped(self) -> None:
+        """Test the main parser doesn't parse if there is nothing before the subcommand."""
+        argcat = ArgCat(route_subcommands=True)
+        self._build(argcat)
+        argcat.set_parser_handler('config', lambda key, indent: (key, indent))
+        main_parser = argcat._arg_parsers['main'].parser
+        with mock.patch.object(main_parser, 'parse_args',
+                               wraps=main_parser.parse_args) as mock_parse_args:
+            for key in ('a', 'b', 'c'):
+                self.assertEqual(argcat.parse_args(['config', key], subparser_ignore_main=True),
+                                 {'config': (key, 2)}, "Incorrect result of `config`!")
+        self.assertEqual(mock_parse_args.call_count, 1,
+                         "The defaults of the main parser should be parsed only once!")
+
+    def test_help(self) -> None:
+        """Test `-h` of the subparser prints the same help as argparse."""
+        helps = []
+        for route_subcommands in (False, True):
+            argcat = ArgCat(route_subcommands=route_subcommands)
+            self._build(argcat)
+            with contextlib.redirect_stdout(io.StringIO()) as stdout, \
+                self.assertRaises(SystemExit, msg="`-h` should exit!"):
+                argcat.parse_args(['config', '-h'])
+            helps.append(stdout.getvalue())
+        self.assertEqual(helps[0], helps[1], "The help should be the same!")
+
+    def test_router_disabled(self) -> None:
+        """Test the router is off if the main parser has other positionals."""
+        argcat = ArgCat(route_subcommands=True)
+        with argcat.build() as builder:
+            builder.main_parser().add_argument('target')
+            builder.add_subparser('run')
+        self.assertIsNone(argcat._router, "The router should be off!")
+        self.assertEqual(self._parse(argcat, ['t', 'run'])[0], 'run', "Args should be parsed!")
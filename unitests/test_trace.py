@@ -0,0 +1,105 @@
+"""All UnitTests for ArgCat's tracing."""
+import asyncio
+import json
+import os
+import tempfile
+from unittest import mock
+from argcat import ArgCat
+from unitests.argcat_unittest import ArgCatUnitTest
+
+def _load_handler(verbose, file):
+    """A handler adding nested spans."""
+    with ArgCat.trace_span('read', file=file):
+        with ArgCat.trace_span('decode'):
+            pass
+    return file
+
+async def _async_load_handler(verbose, file):
+    """A coroutine handler adding a span after awaiting."""
+    await asyncio.sleep(0)
+    with ArgCat.trace_span('async read', file=file):
+        pass
+    return file
+
+# pylint: disable=protected-access
+class TestTrace(ArgCatUnitTest):
+    """UnitTest class for ArgCat's tracing."""
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._trace_path = os.path.join(self._temp_dir.name, 'trace.json')
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    @staticmethod
+    def _build(argcat: ArgCat) -> None:
+        with argcat.build() as builder:
+            builder.main_parser().add_argument('-v', '--verbose', action='store_true')
+            builder.add_subparser('load')
+            builder.subparser('load').add_argument('file', type='str')
+        argcat.set_parser_handler('load', _load_handler)
+
+    def _load_events(self) -> dict:
+        with open(self._trace_path, 'r', encoding='utf-8') as trace_file:
+            content = trace_file.read()
+        # The closing bracket is left out by the tracer, which is allowed by the format.
+        self.assertTrue(content.startswith('[\n') and content.endswith(',\n'),
+                        "Incorrect format of the trace file!")
+        events = json.loads(content[:-2] + ']')
+        return {event['name']: event for event in events}
+
+    def test_trace(self) -> None:
+        """Test the spans of an invocation and the nested spans of the handler."""
+        argcat = ArgCat(trace_path=self._trace_path)
+        self._build(argcat)
+        self.assertEqual(argcat.parse_args(['load', 'a_file'], subparser_ignore_main=True),
+                         {'load': 'a_file'}, "Incorrect result with the tracing on!")
+        argcat._tracer.close()
+
+        events = self._load_events()
+        for name in ('build', 'create_parsers', 'build_parser main', 'build_parser load',
+                     'resolve_type str', 'tokenize', 'split', 'dispatch load', 'read', 'decode'):
+            self.assertIn(name, events, f"Span `{name}` should be traced!")
+            self.assertEqual(events[name]['ph'], 'X', "Spans should be complete events!")
+        self.assertEqual(events['read']['args'], {'file': 'a_file'},
+                         "Incorrect arguments of the span from the handler!")
+        # Nested spans are within the time of the outer ones.
+        for inner, outer in (('decode', 'read'), ('read', 'dispatch load')):
+            self.assertGreaterEqual(events[inner]['ts'], events[outer]['ts'],
+                                    f"`{inner}` should start in `{outer}`!")
+            self.assertLessEqual(events[inner]['ts'] + events[inner]['dur'],
+                                 events[outer]['ts'] + events[outer]['dur'],
+                                 f"`{inner}` should end in `{outer}`!")
+
+    def test_trace_by_environment_variable(self) -> None:
+        """Test the tracing is turned on by the environment variable."""
+        with mock.patch.dict(os.environ, {'ARGCAT_TRACE': self._trace_path}):
+            argcat = ArgCat()
+        self._build(argcat)
+        argcat.parse_args(['load', 'a_file'], subparser_ignore_main=True)
+        argcat._tracer.close()
+        self.assertIn('dispatch load', self._load_events(), "The handler should be traced!")
+
+    def test_trace_off(self) -> None:
+        """Test nothing is traced by default."""
+        argcat = ArgCat()
+        self._build(argcat)
+        self.assertEqual(argcat.parse_args(['load', 'a_file'], subparser_ignore_main=True),
+                         {'load': 'a_file'}, "Spans should do nothing with the tracing off!")
+        self.assertIsNone(argcat._tracer, "There should be no tracer by default!")
+        self.assertFalse(os.path.exists(self._trace_path), "No trace should be written!")
+
+    def test_trace_async_handler(self) -> None:
+        """Test the spans added by a coroutine handler are traced."""
+        argcat = ArgCat(trace_path=self._trace_path)
+        with argcat.build() as builder:
+            builder.main_parser().add_argument('-v', '--verbose', action='store_true')
+            builder.add_subparser('load')
+            builder.subparser('load').add_argument('file', type='str')
+        argcat.set_parser_handler('load', _async_load_handler)
+        self.assertEqual(asyncio.run(argcat.parse_args_async(['load', 'a_file'],
+                                                             subparser_ignore_main=True)),
+                         {'load': 'a_file'}, "Incorrect result of the coroutine handler!")
+        argcat._tracer.close()
+        self.assertEqual(self._load_events()['async read']['args'], {'file': 'a_file'},
+                         "The span from the coroutine handler should be traced!")
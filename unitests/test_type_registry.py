@@ -0,0 +1,51 @@
+"""All UnitTests for ArgCat's type resolution and custom type converters."""
+import pathlib
+from unittest import mock
+from argcat import ArgCat, _ArgCatTypeRegistry
+from unitests.argcat_unittest import ArgCatUnitTest
+
+def _hex_int(value: str) -> int:
+    """A custom type converter for hexadecimal integers."""
+    return int(value, 16)
+
+class TestTypeRegistry(ArgCatUnitTest):
+    """UnitTest class for ArgCat's type resolution."""
+    def tearDown(self):
+        ArgCat.unregister_type('hex')
+
+    @staticmethod
+    def _build(argcat: ArgCat, lexical_type: str) -> None:
+        with argcat.build() as builder:
+            builder.main_parser().add_argument('value', type=lexical_type)
+
+    def test_register_type(self) -> None:
+        """Test a registered converter is used by the parsers of all ArgCat instances."""
+        ArgCat.register_type('hex', _hex_int)
+        for _ in range(2):
+            argcat = ArgCat()
+            self._build(argcat, 'hex')
+            self.assertEqual(argcat.parse_args(['ff']), {'main': {'value': 255}},
+                             "The registered converter should be used!")
+
+        self.assertTrue(ArgCat.unregister_type('hex'), "The converter should be unregistered!")
+        self.assertFalse(ArgCat.unregister_type('hex'),
+                         "The converter should not be unregistered twice!")
+
+    def test_resolution_cache(self) -> None:
+        """Test a lexical type is located only once per process."""
+        with mock.patch('pydoc.locate', return_value=_hex_int) as mock_locate:
+            for _ in range(3):
+                argcat = ArgCat()
+                self._build(argcat, 'unitests.test_type_registry.hex_int')
+                self.assertEqual(argcat.parse_args(['10']), {'main': {'value': 16}},
+                                 "The located type should be used!")
+        self.assertEqual(mock_locate.call_count, 1, "The lexical type should be located once!")
+
+    def test_builtin_fast_paths(self) -> None:
+        """Test the common types are resolved without locate()."""
+        with mock.patch('pydoc.locate') as mock_locate:
+            for lexical_type, expected_type in (('int', int), ('str', str), ('float', float),
+                                                ('pathlib.Path', pathlib.Path)):
+                self.assertIs(_ArgCatTypeRegistry.resolve(lexical_type), expected_type,
+                              f"`{lexical_type}` is resolved incorrectly!")
+        mock_locate.assert_not_called()